@@ -3,10 +3,18 @@
 BITRATE_PRESETS = [125_000, 250_000, 500_000, 1_000_000]
 DEFAULT_BITRATE = 500_000
 
+_PRESET_SET = frozenset(BITRATE_PRESETS)
+
 
 def validate_bitrate(bps: int) -> int:
-    if not isinstance(bps, int):
-        raise ValueError("bitrate must be an integer")
-    if bps < 10_000 or bps > 2_000_000:
+    # presets (the usual case) are a single hash probe; the exact type check
+    # keeps 500000.0 out, as before
+    if type(bps) is int and bps in _PRESET_SET:
+        return bps
+    try:
+        value = bps.__index__()
+    except AttributeError:
+        raise ValueError("bitrate must be an integer") from None
+    if value < 10_000 or value > 2_000_000:
         raise ValueError("bitrate out of allowed range (10000..2000000)")
-    return bps
+    return value
@@ -2,11 +2,18 @@
 
 from __future__ import annotations
 
-from typing import Optional
+from typing import Iterable, Optional
 
 import can
 
-from ecusim_ms.transport import CanTransport, PythonCanTransport, SlcanSerialTransport, TermuxUsbSlcanTransport
+from ecusim_ms.transport import (
+    CanTransport,
+    PeriodicTx,
+    PythonCanTransport,
+    SlcanSerialTransport,
+    TermuxUsbSlcanTransport,
+    TxItem,
+)
 
 
 class CanBus:
@@ -62,6 +69,20 @@ class CanBus:
         self.tx_errors = getattr(self.transport, "tx_errors", self.tx_errors)
         return ok
 
+    def send_many(self, items: Iterable[TxItem]) -> int:
+        if self.transport is None:
+            raise RuntimeError("CAN bus is not open")
+        sent = self.transport.send_many(items)
+        self.tx_errors = getattr(self.transport, "tx_errors", self.tx_errors)
+        return sent
+
+    def send_periodic(
+        self, frame_id: int, payload: bytes, is_extended: bool, period_s: float
+    ) -> Optional[PeriodicTx]:
+        if self.transport is None:
+            raise RuntimeError("CAN bus is not open")
+        return self.transport.send_periodic(frame_id, payload, is_extended, period_s)
+
     def recv(self, timeout_s: float | None = 1.0) -> Optional[can.Message]:
         if self.transport is None:
             return None
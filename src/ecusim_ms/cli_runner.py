@@ -9,7 +9,7 @@ import threading
 import time
 from enum import Enum
 from pathlib import Path
-from typing import Any, Dict, Tuple
+from typing import Any, Dict, Optional, Tuple
 
 from ecusim_ms import __version__, dbc_loader, paths
 from ecusim_ms.bitrate import BITRATE_PRESETS, validate_bitrate
@@ -18,13 +18,13 @@ from ecusim_ms.can_monitor import CanMonitor
 from ecusim_ms.config_merge import merge_control_with_args
 from ecusim_ms.control_io import load_control_safe
 from ecusim_ms.control_override import read_overrides
-from ecusim_ms.dbc_codec import encode_message_safe
+from ecusim_ms.dbc_codec import MessagePacker
 from ecusim_ms.models import TelemetrySnapshot
 from ecusim_ms.ms_signals import MS_SIGNAL_LIST
 from ecusim_ms.paths import can_monitor_path
 from ecusim_ms.scenarios import enforce_map_bounds, scenario_values
 from ecusim_ms.scheduler import FixedRateScheduler
-from ecusim_ms.stop_flag import ensure_not_set, is_set
+from ecusim_ms.stop_flag import ensure_not_set, make_is_set
 from ecusim_ms.telemetry import TelemetryWriter
 from ecusim_ms.transport import SLCAN_BITRATE_MAP
 from ecusim_ms.tx_log import TxLogger
@@ -252,22 +252,39 @@ def _sniffer(
             log_file.close()
 
 
-def _build_payloads(
-    dbc_db, scenario: Dict[str, float]
-) -> Tuple[Dict[str, bytes], Dict[str, float], Dict[str, Dict[str, object]]]:
-    payloads: Dict[str, bytes] = {}
-    used_all: Dict[str, float] = {}
-    clamped_all: Dict[str, Dict[str, object]] = {}
+def _precompute_messages(dbc_db) -> tuple:
+    """Return (msg, signal_names, packer) per message, skipping duplicate bit layouts."""
+    precomputed = []
     for msg in dbc_db.messages:
-        desired: Dict[str, float] = {}
+        names = []
         seen_bits = set()
         for sig in msg.signals:
             key = (sig.start, sig.length, getattr(sig, "byte_order", "big_endian"))
             if key in seen_bits:
                 continue
             seen_bits.add(key)
-            desired[sig.name] = scenario.get(sig.name, 0.0)
-        payload, used, clamped = encode_message_safe(msg, desired)
+            names.append(sig.name)
+        precomputed.append((msg, tuple(names), MessagePacker(msg)))
+    return tuple(precomputed)
+
+
+def _build_payloads(
+    precomputed: tuple, scenario: Dict[str, float], cache: Optional[dict] = None
+) -> Tuple[Dict[str, bytes], Dict[str, float], Dict[str, Dict[str, object]]]:
+    """Encode every message; with a cache dict, unchanged inputs reuse the last result."""
+    payloads: Dict[str, bytes] = {}
+    used_all: Dict[str, float] = {}
+    clamped_all: Dict[str, Dict[str, object]] = {}
+    get = scenario.get
+    for msg, names, packer in precomputed:
+        values = tuple(get(name, 0.0) for name in names)
+        hit = cache.get(msg.name) if cache is not None else None
+        if hit is not None and hit[0] == values:
+            payload, used, clamped = hit[1], hit[2], hit[3]
+        else:
+            payload, used, clamped = packer.encode(dict(zip(names, values)))
+            if cache is not None:
+                cache[msg.name] = (values, payload, used, clamped)
         payloads[msg.name] = payload
         used_all.update(used)
         if clamped:
@@ -436,6 +453,14 @@ def _sniff_stats(bus: CanBus, duration: float, focus_id: int = 1512) -> None:
 def main(argv: list[str] | None = None) -> int:
     args = _build_parser().parse_args(argv)
 
+    # stdout/stderr are pipes when run under the GUI; flush per line so the
+    # parent sees log lines as they happen despite its block-sized reads
+    for stream in (sys.stdout, sys.stderr):
+        try:
+            stream.reconfigure(line_buffering=True)
+        except Exception:
+            pass
+
     logging.basicConfig(level=logging.INFO, format="%(asctime)s %(levelname)s %(message)s")
     try:
         iface, channel, bitrate, mode, hz, backend, port, serial_baud, skip_bitrate = (
@@ -448,6 +473,7 @@ def main(argv: list[str] | None = None) -> int:
     merged_cfg = merge_control_with_args(control_cfg, args)
     dbc_db = dbc_loader.load_db(args.dbc)
     msg_by_name, msg_by_id = dbc_loader.build_message_map(dbc_db)
+    precomputed = _precompute_messages(dbc_db)
     mode = validate_startup(dbc_db, merged_cfg)
 
     bitrate_label = (
@@ -473,6 +499,7 @@ def main(argv: list[str] | None = None) -> int:
         logging.warning("custom-file provided but mode=%s; ignoring custom schedule", mode)
 
     ensure_not_set(args.stop_file)
+    stop_requested = make_is_set(args.stop_file)
     bus = CanBus(
         iface=iface,
         channel=channel,
@@ -495,7 +522,7 @@ def main(argv: list[str] | None = None) -> int:
     # One-shot sample payload log for quick comparison/debug
     try:
         sample_signals = scenario_values(mode, 0.0)
-        payloads, _, _ = _build_payloads(dbc_db, sample_signals)
+        payloads, _, _ = _build_payloads(precomputed, sample_signals)
         for msg in dbc_db.messages:
             data = payloads.get(msg.name)
             if data is None:
@@ -530,7 +557,7 @@ def main(argv: list[str] | None = None) -> int:
         logging.info("Monitor-only mode; waiting for stop flag at %s", args.stop_file)
         try:
             while not stop_evt.is_set():
-                if is_set(args.stop_file):
+                if stop_requested():
                     stop_evt.set()
                     break
                 time.sleep(0.5)
@@ -578,6 +605,8 @@ def main(argv: list[str] | None = None) -> int:
     last_map_value: float | None = None
     last_sent_ms_by_signal = {name: 0 for name in MS_SIGNAL_LIST}
     last_raw_by_signal = {name: "" for name in MS_SIGNAL_LIST}
+    # message name -> (input values, payload, used, clamped) from the last encode
+    payload_cache: Dict[str, tuple] = {}
     send_exception_count = 0
     last_error_msg: str | None = None
     # jitter tracking
@@ -656,7 +685,7 @@ def main(argv: list[str] | None = None) -> int:
                 stop_evt.set()
                 break
 
-            scenario = scenario_values(mode, t)
+            scenario = scenario_values(mode, t, hz)
             overrides = read_overrides(args.control, MS_SIGNAL_LIST)
             if mode.lower() == "custom":
                 scenario.update(overrides)
@@ -680,7 +709,9 @@ def main(argv: list[str] | None = None) -> int:
                 tx_frames = custom_scheduler.tx_frames()
             elif mode.lower() != "silent":
                 try:
-                    payloads, used_phys_encoded, clamped = _build_payloads(dbc_db, scenario)
+                    payloads, used_phys_encoded, clamped = _build_payloads(
+                        precomputed, scenario, payload_cache
+                    )
                 except Exception as exc:
                     logging.error("Encoding failed, stopping runner: %s", exc)
                     exit_code = 1
@@ -795,7 +826,7 @@ def main(argv: list[str] | None = None) -> int:
                                 except Exception as exc:
                                     logging.error("USB hard reset failed: %s", exc)
                             while not stop_evt.is_set():
-                                if is_set(args.stop_file):
+                                if stop_requested():
                                     stop_evt.set()
                                     break
                                 try:
@@ -913,7 +944,7 @@ def main(argv: list[str] | None = None) -> int:
                 )
                 last_debug = now
 
-            if is_set(args.stop_file):
+            if stop_requested():
                 stop_evt.set()
                 break
 
@@ -2,15 +2,17 @@
 
 from __future__ import annotations
 
-import json
 import os
 import tempfile
 from pathlib import Path
 from typing import Any, Dict
 
-from ecusim_ms import models
+from ecusim_ms import json_codec, models
 from ecusim_ms.ms_signals import MS_SIGNAL_LIST
 
+# (signal, default) pairs in MS_SIGNAL_LIST order, walked on every control load
+_SIGNAL_DEFAULTS_ITEMS = tuple((key, models.DEFAULT_SIGNAL_VALUES[key]) for key in MS_SIGNAL_LIST)
+
 
 def _coerce_str(value: Any, default: str) -> str:
     if isinstance(value, str) and value:
@@ -26,40 +28,49 @@ def _coerce_int(value: Any, default: int) -> int:
 
 
 def _coerce_float(value: Any, default: float) -> float:
+    # JSON numbers and missing keys are the common cases; keep them off the try path
+    if type(value) is float:
+        return value
+    if type(value) is int:
+        return float(value)
+    if value is None:
+        return default
     try:
         return float(value)
     except Exception:
         return default
 
 
+_TRUE_STRS = frozenset({"1", "true", "yes", "y", "on"})
+_FALSE_STRS = frozenset({"0", "false", "no", "n", "off"})
+
+
 def _coerce_bool(value: Any, default: bool) -> bool:
-    if isinstance(value, bool):
+    if type(value) is bool:
         return value
     if isinstance(value, (int, float)):
         return bool(value)
     if isinstance(value, str):
         val = value.strip().lower()
-        if val in {"1", "true", "yes", "y", "on"}:
+        if val in _TRUE_STRS:
             return True
-        if val in {"0", "false", "no", "n", "off"}:
+        if val in _FALSE_STRS:
             return False
     return default
 
 
 def _load_json(path: Path) -> Dict[str, Any]:
-    with path.open("r", encoding="utf-8") as handle:
-        data = json.load(handle)
+    data = json_codec.loads(path.read_bytes())
     if not isinstance(data, dict):
         return {}
     return data
 
 
 def _merge_custom(raw_custom: Any) -> Dict[str, float]:
-    result: Dict[str, float] = dict(models.DEFAULT_SIGNAL_VALUES)
     if isinstance(raw_custom, dict):
-        for key in MS_SIGNAL_LIST:
-            result[key] = _coerce_float(raw_custom.get(key), result[key])
-    return result
+        get = raw_custom.get
+        return {key: _coerce_float(get(key), default) for key, default in _SIGNAL_DEFAULTS_ITEMS}
+    return dict(_SIGNAL_DEFAULTS_ITEMS)
 
 
 def _build_hard_test(raw_hard: Any) -> models.HardTestConfig:
@@ -102,13 +113,14 @@ def load_control_safe(path: Path | str) -> models.ControlConfig:
     """Wrapper around load_control with defensive fallback."""
     try:
         control_path = Path(path)
-        # size guard
+        # size guard; one stat also answers "missing", which means defaults
         try:
-            if control_path.exists() and control_path.stat().st_size > 256 * 1024:
-                print(f"control.json too large (>256KB), ignoring: {control_path}")
-                return models.ControlConfig()
+            st = os.stat(control_path)
         except Exception:
             return models.ControlConfig()
+        if st.st_size > 256 * 1024:
+            print(f"control.json too large (>256KB), ignoring: {control_path}")
+            return models.ControlConfig()
 
         return load_control(control_path)
     except Exception:
@@ -117,13 +129,16 @@ def load_control_safe(path: Path | str) -> models.ControlConfig:
 
 def read_control_overrides(control_cfg: models.ControlConfig) -> Dict[str, float]:
     """Return the 20-signal override map with defaults for any missing entries."""
-    overrides: Dict[str, float] = {}
-    for key in MS_SIGNAL_LIST:
-        overrides[key] = _coerce_float(
-            control_cfg.custom.get(key) if control_cfg and control_cfg.custom else None,
-            models.DEFAULT_SIGNAL_VALUES[key],
-        )
-    return overrides
+    custom = control_cfg.custom if control_cfg else None
+    if not custom:
+        return dict(_SIGNAL_DEFAULTS_ITEMS)
+    get = custom.get
+    return {key: _coerce_float(get(key), default) for key, default in _SIGNAL_DEFAULTS_ITEMS}
+
+
+def _dump_telemetry(payload: Dict[str, Any]) -> bytes:
+    """Serialize telemetry as indented JSON bytes; orjson when installed."""
+    return json_codec.dumps(payload, indent=True)
 
 
 # ATOMIC_TELEMETRY_PATCH
@@ -145,18 +160,23 @@ def save_telemetry_safe(path: Path | str, snapshot: Any) -> None:
         else:
             payload = {}
 
+        data = _dump_telemetry(payload)
         target.parent.mkdir(parents=True, exist_ok=True)
 
         # Write into the same directory to keep replace() atomic.
         fd, tmp_name = tempfile.mkstemp(prefix=target.name + '.', suffix='.tmp', dir=str(target.parent))
         try:
-            with os.fdopen(fd, 'w', encoding='utf-8') as handle:
-                json.dump(payload, handle, indent=2)
-                handle.flush()
+            # mkstemp's fd is already binary; write it directly, no io stack
+            try:
+                view = memoryview(data)
+                while view:
+                    view = view[os.write(fd, view):]
                 try:
-                    os.fsync(handle.fileno())
+                    os.fsync(fd)
                 except Exception:
                     pass
+            finally:
+                os.close(fd)
 
             # Atomic replace (POSIX); also works on Windows.
             os.replace(tmp_name, str(target))
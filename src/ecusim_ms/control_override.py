@@ -2,24 +2,30 @@
 
 from __future__ import annotations
 
-import json
+import os
 from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Dict, Iterable, Optional
+from typing import Dict, FrozenSet, Iterable, Optional, Tuple
 
+from ecusim_ms import json_codec
 
-@dataclass
+
+@dataclass(slots=True)
 class ControlCache:
-    mtime: Optional[float] = None
-    payload: Dict[str, object] = field(default_factory=dict)
+    # (path, st_mtime_ns, st_size) of the file the cached result was built from
+    key: Optional[Tuple[str, int, int]] = None
+    allowed: FrozenSet[str] = frozenset()
+    # the allowed_keys object allowed was built from; callers pass the same
+    # signal list each time, so an identity match skips rebuilding the set
+    allowed_src: object = None
+    overrides: Dict[str, float] = field(default_factory=dict)
 
 
 _CACHE = ControlCache()
 
 
 def _load_json(path: Path) -> Dict[str, object]:
-    with path.open("r", encoding="utf-8") as handle:
-        data = json.load(handle)
+    data = json_codec.loads(path.read_bytes())
     return data if isinstance(data, dict) else {}
 
 
@@ -35,28 +41,32 @@ def read_overrides(control_path: Path | str, allowed_keys: Iterable[str]) -> Dic
 
     Best-effort:
     - Returns {} if file missing or unreadable.
-    - Uses mtime cache to avoid reloading when unchanged.
+    - Caches the filtered result keyed by (mtime_ns, size); an unchanged file
+      costs a single stat().
     - Filters to allowed_keys and numeric (float-castable) values only.
     """
     try:
-        path = Path(control_path)
-        if not path.exists():
+        path = os.fspath(control_path)
+        try:
+            st = os.stat(path)
+        except OSError:
             return {}
 
-        mtime = path.stat().st_mtime
-        if _CACHE.mtime != mtime:
-            try:
-                _CACHE.payload = _load_json(path)
-                _CACHE.mtime = mtime
-            except Exception:
-                _CACHE.payload = {}
-                _CACHE.mtime = mtime
-
-        data = _CACHE.payload if isinstance(_CACHE.payload, dict) else {}
+        key = (path, st.st_mtime_ns, st.st_size)
+        if allowed_keys is _CACHE.allowed_src:
+            allowed_set = _CACHE.allowed
+        else:
+            allowed_set = frozenset(allowed_keys)
+        if _CACHE.key == key and _CACHE.allowed == allowed_set:
+            return dict(_CACHE.overrides)
+
+        try:
+            data = _load_json(Path(path))
+        except Exception:
+            data = {}
         src = _select_custom_block(data)
 
         overrides: Dict[str, float] = {}
-        allowed_set = set(allowed_keys)
         if isinstance(src, dict):
             for k, v in src.items():
                 if k not in allowed_set:
@@ -65,6 +75,10 @@ def read_overrides(control_path: Path | str, allowed_keys: Iterable[str]) -> Dic
                     overrides[k] = float(v)
                 except Exception:
                     continue
-        return overrides
+        _CACHE.key = key
+        _CACHE.allowed = allowed_set
+        _CACHE.allowed_src = allowed_keys
+        _CACHE.overrides = overrides
+        return dict(overrides)
     except Exception:
         return {}
@@ -126,6 +126,83 @@ def encode_message_safe(
     return payload, used_phys, clamped
 
 
+class MessagePacker:
+    """Precomputed bit layout for encoding one message without cantools.
+
+    Only the happy path is handled here: any value that is non-numeric,
+    needs clamping or falls outside the DBC min/max is re-encoded through
+    encode_message_safe so logging and error counters stay identical.
+    Multiplexed messages and float or enumerated signals always take that
+    path.
+    """
+
+    def __init__(self, msg: Message) -> None:
+        self.msg = msg
+        self.length = msg.length
+        supported = not msg.is_multiplexed()
+        fields = []
+        for sig in msg.signals:
+            lo, hi = raw_limits(sig)
+            little = sig.byte_order == "little_endian"
+            if little:
+                shift = sig.start
+            else:
+                # DBC big-endian start bit is the MSB in sawtooth numbering
+                msb = (self.length - 1 - sig.start // 8) * 8 + sig.start % 8
+                shift = msb - sig.length + 1
+            if shift < 0 or shift + sig.length > self.length * 8:
+                supported = False
+            if sig.is_float or sig.choices:
+                # IEEE bit patterns and named values need cantools' encoder
+                supported = False
+            fields.append(
+                (
+                    sig.name,
+                    sig.scale,
+                    sig.offset,
+                    lo,
+                    hi,
+                    sig.minimum,
+                    sig.maximum,
+                    shift,
+                    (1 << sig.length) - 1,
+                    little,
+                )
+            )
+        self._fields = tuple(fields)
+        self.supported = supported
+
+    def encode(
+        self, desired_phys: Dict[str, Any]
+    ) -> Tuple[bytes, Dict[str, float], Dict[str, Dict[str, Any]]]:
+        """Same contract as encode_message_safe(self.msg, desired_phys)."""
+        if not self.supported:
+            return encode_message_safe(self.msg, desired_phys)
+        used_phys: Dict[str, float] = {}
+        be_acc = 0
+        le_acc = 0
+        for name, scale, offset, lo, hi, minimum, maximum, shift, mask, little in self._fields:
+            try:
+                raw = round((float(desired_phys.get(name, 0)) - offset) / scale)
+            except Exception:
+                return encode_message_safe(self.msg, desired_phys)
+            if raw < lo or raw > hi:
+                return encode_message_safe(self.msg, desired_phys)
+            phys_used = raw * scale + offset
+            if (minimum is not None and phys_used < minimum) or (
+                maximum is not None and phys_used > maximum
+            ):
+                return encode_message_safe(self.msg, desired_phys)
+            used_phys[name] = phys_used
+            if little:
+                le_acc |= (raw & mask) << shift
+            else:
+                be_acc |= (raw & mask) << shift
+        if le_acc:
+            be_acc |= int.from_bytes(le_acc.to_bytes(self.length, "little"), "big")
+        return be_acc.to_bytes(self.length, "big"), used_phys, {}
+
+
 def reset_encode_error_stats() -> None:
     """Reset encode error counters (for tests)."""
     global _encode_error_total
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import contextlib
 import subprocess
 import sys
 import threading
@@ -371,8 +372,7 @@ class MainWindow(ttk.Frame):
     def _apply_control_to_widgets(self) -> None:
         """Load control.json values into widgets without triggering writes."""
         cfg = self.control_cfg
-        self._suppress_writes = True
-        try:
+        with self._suppressed():
             self.backend.set(str(getattr(cfg, "backend", "pythoncan") or "pythoncan"))
             self.iface.set(str(cfg.iface or "virtual"))
             self.mode.set(str(cfg.mode or "loop"))
@@ -402,8 +402,6 @@ class MainWindow(ttk.Frame):
                 self.custom_editor.set_defaults(cfg.custom)
             else:
                 self.custom_editor.reset_defaults()
-        finally:
-            self._suppress_writes = False
 
     def _on_backend_change(self, initial: bool = False) -> None:
         backend = (self.backend.get() or "pythoncan").lower()
@@ -700,6 +698,16 @@ class MainWindow(ttk.Frame):
             "hard_test": self.hard_panel.get_payload(),
         }
 
+    @contextlib.contextmanager
+    def _suppressed(self):
+        """Drop control.json writes while widgets are bulk-updated."""
+        previous = self._suppress_writes
+        self._suppress_writes = True
+        try:
+            yield
+        finally:
+            self._suppress_writes = previous
+
     def _write_control_immediate(self, status_text: str | None = None) -> None:
         if self._suppress_writes:
             return
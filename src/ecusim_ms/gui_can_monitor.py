@@ -2,11 +2,73 @@
 
 from __future__ import annotations
 
-import json
 import time
 import tkinter as tk
 from pathlib import Path
 from tkinter import ttk
+from typing import Callable, Dict, FrozenSet, List, Optional, TextIO, Tuple
+
+from ecusim_ms import json_codec
+
+
+def _fmt_rx(evt: dict, ts_s: str, etype: str) -> str:
+    return f"[{ts_s}] RX id=0x{evt.get('id', 0):X} dlc={evt.get('dlc', '')} data={evt.get('data_hex','')} err={evt.get('is_error', False)}"
+
+
+def _fmt_tx_ok(evt: dict, ts_s: str, etype: str) -> str:
+    return f"[{ts_s}] TX_OK id=0x{evt.get('id', 0):X} tx={evt.get('tx_frames','')}"
+
+
+def _fmt_tx_fail(evt: dict, ts_s: str, etype: str) -> str:
+    return f"[{ts_s}] TX_FAIL id=0x{evt.get('id',0):X} consec={evt.get('consec_fail','?')} err={evt.get('error','')}"
+
+
+def _fmt_bus_state(evt: dict, ts_s: str, etype: str) -> str:
+    return f"[{ts_s}] BUS_STATE {evt.get('state','')}"
+
+
+def _fmt_reopen(evt: dict, ts_s: str, etype: str) -> str:
+    return f"[{ts_s}] {etype.upper()} {evt.get('error','')}"
+
+
+def _fmt_start(evt: dict, ts_s: str, etype: str) -> str:
+    return f"[{ts_s}] START iface={evt.get('iface','')} bitrate={evt.get('bitrate','')} mode={evt.get('mode','')}"
+
+
+def _fmt_stop(evt: dict, ts_s: str, etype: str) -> str:
+    return f"[{ts_s}] STOP"
+
+
+def _fmt_rate(evt: dict, ts_s: str, etype: str) -> str:
+    return (
+        f"[{ts_s}] RATE tx/s={evt.get('tx_per_s',0):.1f} "
+        f"rx/s={evt.get('rx_per_s',0):.1f} err/s={evt.get('err_per_s',0):.1f} state={evt.get('state','')}"
+    )
+
+
+# event type -> (visibility toggle attribute, formatter); the toggle is checked
+# before the timestamp is formatted, so hidden events cost one dict lookup
+_HANDLERS: Dict[str, Tuple[str, Callable[[dict, str, str], str]]] = {
+    "rx": ("show_rx", _fmt_rx),
+    "tx_ok": ("show_tx_ok", _fmt_tx_ok),
+    "tx_fail": ("show_errors", _fmt_tx_fail),
+    "bus_state": ("show_errors", _fmt_bus_state),
+    "reopen_begin": ("show_errors", _fmt_reopen),
+    "reopen_ok": ("show_errors", _fmt_reopen),
+    "reopen_fail": ("show_errors", _fmt_reopen),
+    "start": ("show_errors", _fmt_start),
+    "stop": ("show_errors", _fmt_stop),
+    "rate": ("show_errors", _fmt_rate),
+}
+
+# distinct visibility toggle attributes
+_GATES: Tuple[str, ...] = tuple(dict.fromkeys(gate for gate, _fmt in _HANDLERS.values()))
+
+# substrings identifying each event type in a raw JSONL line (compact and
+# default separators), so lines of hidden types are skipped unparsed
+_TYPE_NEEDLES: Dict[str, Tuple[str, str]] = {
+    etype: (f'"type":"{etype}"', f'"type": "{etype}"') for etype in _HANDLERS
+}
 
 
 class CanMonitorView(ttk.Frame):
@@ -15,7 +77,13 @@ class CanMonitorView(ttk.Frame):
         self.log_path = Path(log_path)
         self.poll_ms = poll_ms
         self._offset = 0
-        self._file_mtime = 0.0
+        # the log is append-only: keep it open between polls and reopen only
+        # when it is replaced (new inode) or truncated
+        self._fh: Optional[TextIO] = None
+        self._inode: Optional[Tuple[int, int]] = None
+        # bursts share a wall-clock second, so the HH:MM:SS text is reused
+        self._ts_cache_sec = -1
+        self._ts_cache_str = ""
 
         controls = ttk.Frame(self)
         controls.grid(row=0, column=0, sticky="w")
@@ -62,74 +130,81 @@ class CanMonitorView(ttk.Frame):
         except Exception:
             pass
 
-    def _append_line(self, line: str) -> None:
+    def _append_lines(self, lines: List[str]) -> None:
         self.text.configure(state="normal")
-        self.text.insert("end", line + "\n")
+        self.text.insert("end", "\n".join(lines) + "\n")
         self.text.see("end")
         self.text.configure(state="disabled")
 
-    def _format_event(self, evt: dict) -> str | None:
+    def _enabled_types(self) -> FrozenSet[str]:
+        """Event types whose toggle is on; each BooleanVar is read once."""
+        gates = {gate: getattr(self, gate).get() for gate in _GATES}
+        return frozenset(etype for etype, (gate, _fmt) in _HANDLERS.items() if gates[gate])
+
+    def _format_event(self, evt: dict, enabled: Optional[FrozenSet[str]] = None) -> str | None:
         etype = evt.get("type", "")
-        ts = evt.get("ts", time.time())
-        ts_s = time.strftime("%H:%M:%S", time.localtime(ts))
-        if etype == "rx":
-            if not self.show_rx.get():
-                return None
-            return f"[{ts_s}] RX id=0x{evt.get('id', 0):X} dlc={evt.get('dlc', '')} data={evt.get('data_hex','')} err={evt.get('is_error', False)}"
-        if etype == "tx_ok":
-            if not self.show_tx_ok.get():
-                return None
-            return f"[{ts_s}] TX_OK id=0x{evt.get('id', 0):X} tx={evt.get('tx_frames','')}"
-        if etype in {
-            "tx_fail",
-            "bus_state",
-            "reopen_begin",
-            "reopen_ok",
-            "reopen_fail",
-            "start",
-            "stop",
-            "rate",
-        }:
-            if not self.show_errors.get():
+        handler = _HANDLERS.get(etype)
+        if handler is None:
+            return None
+        gate, fmt = handler
+        if enabled is not None:
+            if etype not in enabled:
                 return None
-            if etype == "tx_fail":
-                return f"[{ts_s}] TX_FAIL id=0x{evt.get('id',0):X} consec={evt.get('consec_fail','?')} err={evt.get('error','')}"
-            if etype == "bus_state":
-                return f"[{ts_s}] BUS_STATE {evt.get('state','')}"
-            if etype.startswith("reopen"):
-                return f"[{ts_s}] {etype.upper()} {evt.get('error','')}"
-            if etype == "start":
-                return f"[{ts_s}] START iface={evt.get('iface','')} bitrate={evt.get('bitrate','')} mode={evt.get('mode','')}"
-            if etype == "stop":
-                return f"[{ts_s}] STOP"
-            if etype == "rate":
-                return (
-                    f"[{ts_s}] RATE tx/s={evt.get('tx_per_s',0):.1f} "
-                    f"rx/s={evt.get('rx_per_s',0):.1f} err/s={evt.get('err_per_s',0):.1f} state={evt.get('state','')}"
-                )
-        return None
+        elif not getattr(self, gate).get():
+            return None
+        sec = int(evt.get("ts", time.time()))
+        if sec != self._ts_cache_sec:
+            self._ts_cache_str = time.strftime("%H:%M:%S", time.localtime(sec))
+            self._ts_cache_sec = sec
+        return fmt(evt, self._ts_cache_str, etype)
+
+    def _close_log(self) -> None:
+        if self._fh is not None:
+            try:
+                self._fh.close()
+            except Exception:
+                pass
+            self._fh = None
+
+    def destroy(self) -> None:
+        self._close_log()
+        super().destroy()
 
     def poll(self) -> None:
         try:
-            if not self.log_path.exists():
+            try:
+                st = self.log_path.stat()
+            except FileNotFoundError:
+                self._close_log()
                 return
-            mtime = self.log_path.stat().st_mtime
-            if mtime < self._file_mtime:
+            inode = (st.st_ino, st.st_dev)
+            if self._fh is None or inode != self._inode or st.st_size < self._offset:
+                self._close_log()
+                self._fh = self.log_path.open("r", encoding="utf-8")
+                self._inode = inode
                 self._offset = 0
-            self._file_mtime = mtime
-            with self.log_path.open("r", encoding="utf-8") as handle:
-                handle.seek(self._offset)
-                for line in handle:
-                    line = line.strip()
-                    if not line:
-                        continue
-                    try:
-                        evt = json.loads(line)
-                    except Exception:
-                        continue
-                    formatted = self._format_event(evt)
-                    if formatted:
-                        self._append_line(formatted)
-                self._offset = handle.tell()
+            elif st.st_size == self._offset:
+                return
+            handle = self._fh
+            lines: List[str] = []
+            # toggles are read once per poll, not once per event (each
+            # BooleanVar.get is a Tcl call)
+            enabled = self._enabled_types()
+            wanted = tuple(needle for etype in enabled for needle in _TYPE_NEEDLES[etype])
+            handle.seek(self._offset)
+            for line in handle:
+                if not any(needle in line for needle in wanted):
+                    continue
+                line = line.strip()
+                try:
+                    evt = json_codec.loads(line)
+                except Exception:
+                    continue
+                formatted = self._format_event(evt, enabled)
+                if formatted:
+                    lines.append(formatted)
+            self._offset = handle.tell()
+            if lines:
+                self._append_lines(lines)
         except Exception:
             pass
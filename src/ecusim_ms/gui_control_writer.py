@@ -2,56 +2,122 @@
 
 from __future__ import annotations
 
-import json
+import logging
+import os
 import threading
+import time
 from pathlib import Path
-from typing import Any, Dict, Optional
+from typing import Any, Callable, Dict, Optional, Tuple
+
+from ecusim_ms import json_codec
 
 
 class Debouncer:
-    """Simple thread-based debouncer to coalesce rapid events."""
+    """Simple thread-based debouncer to coalesce rapid events.
+
+    One daemon worker, started on first use, runs the latest scheduled call
+    once no newer one has arrived for its delay. With max_delay_s, a steady
+    stream of calls still runs at least that often after the burst began.
+    """
 
     def __init__(self) -> None:
-        self._lock = threading.Lock()
-        self._timer: Optional[threading.Timer] = None
+        self._cond = threading.Condition()
+        self._pending: Optional[Tuple[Callable[..., Any], tuple, dict]] = None
+        self._deadline = 0.0
+        self._first_at = 0.0
+        self._worker: Optional[threading.Thread] = None
 
-    def schedule(self, delay_s: float, fn, *args, **kwargs) -> None:
-        with self._lock:
-            if self._timer:
-                self._timer.cancel()
-            timer = threading.Timer(delay_s, self._run, args=(fn, args, kwargs))
-            timer.daemon = True
-            self._timer = timer
-            timer.start()
+    def schedule(
+        self, delay_s: float, fn, *args, max_delay_s: Optional[float] = None, **kwargs
+    ) -> None:
+        with self._cond:
+            now = time.monotonic()
+            if self._pending is None:
+                self._first_at = now
+            self._pending = (fn, args, kwargs)
+            self._deadline = now + delay_s
+            if max_delay_s is not None:
+                self._deadline = min(self._deadline, self._first_at + max_delay_s)
+            if self._worker is None:
+                self._worker = threading.Thread(target=self._loop, name="debouncer", daemon=True)
+                self._worker.start()
+            self._cond.notify()
 
-    def _run(self, fn, args, kwargs) -> None:
-        try:
-            fn(*args, **kwargs)
-        finally:
-            with self._lock:
-                self._timer = None
+    def _loop(self) -> None:
+        while True:
+            with self._cond:
+                while True:
+                    if self._pending is None:
+                        self._cond.wait()
+                        continue
+                    remaining = self._deadline - time.monotonic()
+                    if remaining <= 0:
+                        break
+                    # a newer schedule() moves the deadline and wakes us early
+                    self._cond.wait(remaining)
+                fn, args, kwargs = self._pending
+                self._pending = None
+            try:
+                fn(*args, **kwargs)
+            except Exception:
+                logging.exception("Debounced call failed")
 
     def cancel(self) -> None:
-        with self._lock:
-            if self._timer:
-                self._timer.cancel()
-                self._timer = None
+        with self._cond:
+            self._pending = None
 
 
 class ControlWriter:
     def __init__(self, path: Path | str):
         self.path = Path(path)
+        self._tmp_path = self.path.with_suffix(self.path.suffix + ".tmp")
         self._debouncer = Debouncer()
+        # writers share one .tmp path: serialize them so a concurrent write
+        # cannot truncate the file another one is about to rename into place
+        self._write_lock = threading.Lock()
+        # bytes last written and the (size, mtime_ns) they left on disk; an
+        # identical payload is skipped while the file still looks like ours
+        self._last_payload_bytes: Optional[bytes] = None
+        self._last_stat: Optional[Tuple[int, int]] = None
 
     def write(self, control_dict: Dict[str, Any]) -> None:
-        """Write control data atomically to avoid partial reads."""
+        """Write control data atomically to avoid partial reads.
+
+        Skipped when the payload matches the last write and the file is untouched.
+        """
         try:
+            buf = json_codec.dumps(control_dict, indent=True)
             target = self.path
-            target.parent.mkdir(parents=True, exist_ok=True)
-            tmp_path = target.with_suffix(target.suffix + ".tmp")
-            with tmp_path.open("w", encoding="utf-8") as handle:
-                json.dump(control_dict, handle, indent=2)
-            tmp_path.replace(target)
+            with self._write_lock:
+                if buf == self._last_payload_bytes and self._last_stat is not None:
+                    try:
+                        st = target.stat()
+                        if (st.st_size, st.st_mtime_ns) == self._last_stat:
+                            return
+                    except OSError:
+                        pass
+                target.parent.mkdir(parents=True, exist_ok=True)
+                tmp_path = self._tmp_path
+                # one os.write on a raw fd; O_BINARY keeps Windows from
+                # translating newlines
+                fd = os.open(
+                    tmp_path,
+                    os.O_WRONLY | os.O_CREAT | os.O_TRUNC | getattr(os, "O_BINARY", 0),
+                    0o644,
+                )
+                try:
+                    view = memoryview(buf)
+                    while view:
+                        view = view[os.write(fd, view):]
+                finally:
+                    os.close(fd)
+                os.replace(tmp_path, target)
+                self._last_payload_bytes = buf
+                try:
+                    st = target.stat()
+                    self._last_stat = (st.st_size, st.st_mtime_ns)
+                except OSError:
+                    self._last_stat = None
         except Exception:
             return
 
@@ -4,7 +4,7 @@ from __future__ import annotations
 
 import tkinter as tk
 from tkinter import ttk
-from typing import Dict, Iterable
+from typing import Dict, Iterable, Tuple
 
 
 class LiveView(ttk.Frame):
@@ -27,7 +27,10 @@ class LiveView(ttk.Frame):
         self.grid_rowconfigure(0, weight=1)
         self.grid_columnconfigure(0, weight=1)
 
-        for sig in signals:
+        # rows never change after construction; iterate this instead of
+        # asking Tk for get_children() on every update
+        self._iids: Tuple[str, ...] = tuple(signals)
+        for sig in self._iids:
             self.tree.insert("", "end", iid=sig, values=(sig, "?", ""))
 
     def update_view(
@@ -35,18 +38,22 @@ class LiveView(ttk.Frame):
     ) -> None:
         clamped = clamped or {}
         fault_set = set(faults or [])
-        for sig in self.tree.get_children():
+        tree_item = self.tree.item
+        for sig in self._iids:
             val = values.get(sig, None)
             flag = ""
             if sig in clamped:
                 flag = "CLAMP"
             elif sig in fault_set:
                 flag = "ERR"
-            if val is None:
-                self.tree.set(sig, "value", "?")
+            if isinstance(val, (float, int)):
+                text = f"{val:.2f}"
+            elif val is None:
+                text = "?"
             else:
                 try:
-                    self.tree.set(sig, "value", f"{float(val):.2f}")
+                    text = f"{float(val):.2f}"
                 except Exception:
-                    self.tree.set(sig, "value", str(val))
-            self.tree.set(sig, "flag", flag)
+                    text = str(val)
+            # one Tcl call per row instead of one per column
+            tree_item(sig, values=(sig, text, flag))
@@ -6,11 +6,32 @@ import datetime
 import tkinter as tk
 from tkinter import ttk
 
+# keys that edit a Text widget; everything else (navigation, selection,
+# Ctrl+C / Ctrl+A) is left to the default bindings
+_EDIT_KEYSYMS = frozenset({"BackSpace", "Delete", "Return", "KP_Enter", "Tab", "Insert"})
+# Tk's emacs-style Control bindings that edit: delete char/backspace, insert
+# tab, kill line, open line, transpose
+_EDIT_CONTROL_KEYSYMS = frozenset({"d", "h", "i", "k", "o", "t"})
+_CONTROL_MASK = 0x4
+
+
+def _block_edit_key(event: tk.Event) -> str | None:
+    if event.state & _CONTROL_MASK:
+        return "break" if event.keysym in _EDIT_CONTROL_KEYSYMS else None
+    if event.keysym in _EDIT_KEYSYMS or (event.char and event.char.isprintable()):
+        return "break"
+    return None
+
 
 class GuiLogger(ttk.Frame):
     def __init__(self, master: tk.Misc, height: int = 8):
         super().__init__(master, padding=4)
-        self.text = tk.Text(self, height=height, wrap="word", state="disabled")
+        # Stay in state="normal" and swallow editing input instead of toggling
+        # the state around every insert (two extra Tcl round-trips per line).
+        self.text = tk.Text(self, height=height, wrap="word")
+        self.text.bind("<Key>", _block_edit_key)
+        for sequence in ("<<Paste>>", "<<Cut>>", "<<Clear>>", "<<PasteSelection>>", "<Button-2>"):
+            self.text.bind(sequence, lambda _e: "break")
         scroll = ttk.Scrollbar(self, orient="vertical", command=self.text.yview)
         self.text.configure(yscrollcommand=scroll.set)
         self.text.grid(row=0, column=0, sticky="nsew")
@@ -22,10 +43,8 @@ class GuiLogger(ttk.Frame):
         try:
             ts = datetime.datetime.now().strftime("%H:%M:%S")
             line = f"[{ts}] {level}: {msg}\n"
-            self.text.configure(state="normal")
             self.text.insert("end", line)
             self.text.see("end")
-            self.text.configure(state="disabled")
         except Exception:
             return
 
@@ -4,7 +4,7 @@ from __future__ import annotations
 
 import tkinter as tk
 from tkinter import ttk
-from typing import Dict, Iterable
+from typing import Dict, Iterable, Optional
 
 from ecusim_ms.ms_signals import MS_SIGNAL_LIST
 from ecusim_ms.ui_backend import UiBackend
@@ -29,15 +29,15 @@ class MobileApp(ttk.Frame):
         self.mode_var = tk.StringVar(value=current_mode)
         self.status_var = tk.StringVar(value="")
         self._running = False
-        self.custom_vars = {}
-        for key in MS_SIGNAL_LIST:
-            schema = self._schemas.get(key)
-            default_value = schema.default_value if schema else 0.0
-            self.custom_vars[key] = tk.StringVar(value=str(default_value))
+        self.custom_vars: Dict[str, tk.StringVar] = {
+            key: tk.StringVar(value=str(self._default_value(key))) for key in MS_SIGNAL_LIST
+        }
         self.custom_enabled: Dict[str, tk.BooleanVar] = {
             key: tk.BooleanVar(value=True) for key in MS_SIGNAL_LIST
         }
-        self._signal_rows: Dict[str, Dict[str, object]] = {}
+        # Pre-sized with every key; rows stay None until built.
+        self._signal_rows: Dict[str, Optional[Dict[str, object]]] = dict.fromkeys(MS_SIGNAL_LIST)
+        self._pending_keys: list[str] = []
         self._filter_var = tk.StringVar(value="")
         self.mode_var.trace_add(
             "write",
@@ -47,6 +47,10 @@ class MobileApp(ttk.Frame):
         self._build_layout()
         self._update_status()
 
+    def _default_value(self, key: str) -> float:
+        schema = self._schemas.get(key)
+        return schema.default_value if schema else 0.0
+
     def _build_layout(self) -> None:
         toggle = ttk.Frame(self)
         toggle.grid(row=0, column=0, sticky="ew")
@@ -238,40 +242,48 @@ class MobileApp(ttk.Frame):
         body.bind("<Configure>", _on_frame_configure)
         canvas.bind("<Configure>", _on_canvas_configure)
 
-        for idx, key in enumerate(MS_SIGNAL_LIST):
-            item = ttk.Frame(body, padding=(4, 2))
-            item.grid(row=idx, column=0, sticky="ew", pady=(0, 6))
-            item.columnconfigure(0, weight=1)
-            item.columnconfigure(1, weight=0)
+        # Rows are built lazily the first time they match the filter.
+        self._rows_body = body
+        self._pending_keys = list(MS_SIGNAL_LIST)
+        self._apply_filter()
 
-            name_label = ttk.Label(item, text=key, wraplength=260)
-            name_label.grid(row=0, column=0, sticky="w")
+        return start_row + 1
 
-            meta_label = ttk.Label(item, text="", wraplength=260)
-            meta_label.grid(row=1, column=0, sticky="w", pady=(0, 2))
+    def _build_row(self, key: str) -> Dict[str, object]:
+        idx = MS_SIGNAL_LIST.index(key)
+        item = ttk.Frame(self._rows_body, padding=(4, 2))
+        item.grid(row=idx, column=0, sticky="ew", pady=(0, 6))
+        item.columnconfigure(0, weight=1)
+        item.columnconfigure(1, weight=0)
 
-            entry = ttk.Entry(item, textvariable=self.custom_vars[key])
-            entry.grid(row=2, column=0, sticky="ew", padx=(0, 6))
-            entry.bind("<Return>", lambda _e, k=key: self._apply_custom_keys([k]))
-            entry.bind("<FocusOut>", lambda _e, k=key: self._apply_custom_keys([k]))
+        name_label = ttk.Label(item, text=key, wraplength=260)
+        name_label.grid(row=0, column=0, sticky="w")
 
-            toggle = ttk.Checkbutton(
-                item,
-                text="Enable",
-                variable=self.custom_enabled[key],
-            )
-            toggle.grid(row=2, column=1, sticky="e")
-
-            self._signal_rows[key] = {
-                "frame": item,
-                "name": name_label,
-                "meta": meta_label,
-                "entry": entry,
-                "toggle": toggle,
-            }
-            self._update_signal_row(key)
+        meta_label = ttk.Label(item, text="", wraplength=260)
+        meta_label.grid(row=1, column=0, sticky="w", pady=(0, 2))
 
-        return start_row + 1
+        entry = ttk.Entry(item, textvariable=self.custom_vars[key])
+        entry.grid(row=2, column=0, sticky="ew", padx=(0, 6))
+        entry.bind("<Return>", lambda _e, k=key: self._apply_custom_keys([k]))
+        entry.bind("<FocusOut>", lambda _e, k=key: self._apply_custom_keys([k]))
+
+        toggle = ttk.Checkbutton(
+            item,
+            text="Enable",
+            variable=self.custom_enabled[key],
+        )
+        toggle.grid(row=2, column=1, sticky="e")
+
+        row = {
+            "frame": item,
+            "name": name_label,
+            "meta": meta_label,
+            "entry": entry,
+            "toggle": toggle,
+        }
+        self._signal_rows[key] = row
+        self._update_signal_row(key)
+        return row
 
     def _build_status(self, parent: ttk.Frame, start_row: int) -> int:
         status = ttk.Label(
@@ -366,11 +378,17 @@ class MobileApp(ttk.Frame):
 
     def _apply_filter(self) -> None:
         query = (self._filter_var.get() or "").strip().lower()
-        for key, row in self._signal_rows.items():
+        for key in self._pending_keys:
+            row = self._signal_rows.get(key)
+            matches = not query or query in key.lower()
+            if row is None:
+                if matches:
+                    self._build_row(key)
+                continue
             frame = row.get("frame")
             if not isinstance(frame, ttk.Frame):
                 continue
-            if not query or query in key.lower():
+            if matches:
                 frame.grid()
             else:
                 frame.grid_remove()
@@ -1,12 +1,13 @@
-"""Telemetry reader with mtime cache for GUI polling."""
+"""Telemetry reader with mtime and content-hash cache for GUI polling."""
 
 from __future__ import annotations
 
-import json
 import time
 from pathlib import Path
 from typing import Any, Dict, Optional
 
+from ecusim_ms import json_codec
+
 
 class TelemetryReader:
     def __init__(self, path: Path | str, poll_hz: float = 5.0):
@@ -14,6 +15,10 @@ class TelemetryReader:
         self.dt = 1.0 / poll_hz if poll_hz > 0 else 0.2
         self._next = time.monotonic()
         self._last_mtime: Optional[float] = None
+        self._last_size: Optional[int] = None
+        # hash of the bytes last parsed; a rewrite with identical content
+        # (new mtime, same payload) is then skipped without parsing
+        self._last_hash: Optional[int] = None
         self._cache: Dict[str, Any] = {}
 
     def poll(self) -> Dict[str, Any]:
@@ -24,15 +29,26 @@ class TelemetryReader:
         self._next = now + self.dt
 
         try:
-            if not self.path.exists():
+            try:
+                st = self.path.stat()
+            except FileNotFoundError:
+                return {}
+            mtime = st.st_mtime
+            size = st.st_size
+            if self._last_mtime is not None and (mtime, size) == (self._last_mtime, self._last_size):
                 return {}
-            mtime = self.path.stat().st_mtime
-            if self._last_mtime is not None and mtime == self._last_mtime:
+            raw = self.path.read_bytes()
+            digest = hash(raw)
+            if digest == self._last_hash:
+                self._last_mtime = mtime
+                self._last_size = size
                 return {}
-            data = json.loads(self.path.read_text(encoding="utf-8"))
+            data = json_codec.loads(raw)
             if isinstance(data, dict):
                 self._cache = data
                 self._last_mtime = mtime
+                self._last_size = size
+                self._last_hash = digest
                 return data
         except Exception:
             return {}
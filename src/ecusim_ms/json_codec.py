@@ -0,0 +1,31 @@
+"""JSON loads/dumps backed by orjson when installed, stdlib json otherwise."""
+
+from __future__ import annotations
+
+import json
+from typing import Any
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional dependency
+    orjson = None
+
+
+def loads(data: bytes | str) -> Any:
+    """Parse JSON from bytes or str."""
+    if orjson is not None:
+        try:
+            return orjson.loads(data)
+        except Exception:
+            pass  # e.g. NaN/Infinity literals, which only the stdlib accepts
+    return json.loads(data)
+
+
+def dumps(obj: Any, indent: bool = False) -> bytes:
+    """Serialize obj to UTF-8 JSON bytes, two-space indented when indent is set."""
+    if orjson is not None:
+        try:
+            return orjson.dumps(obj, option=orjson.OPT_INDENT_2 if indent else 0)
+        except Exception:
+            pass  # e.g. non-str keys; the stdlib path handles those
+    return json.dumps(obj, indent=2 if indent else None).encode("utf-8")
@@ -2,8 +2,9 @@
 
 from __future__ import annotations
 
-from dataclasses import asdict, dataclass, field, is_dataclass
-from typing import Any, Dict, Optional
+from dataclasses import dataclass, field
+from types import MappingProxyType
+from typing import Any, Dict, Mapping, Optional
 
 from ecusim_ms.ms_signals import MS_SIGNAL_LIST
 
@@ -33,8 +34,12 @@ DEFAULT_SIGNAL_VALUES.update(
     }
 )
 
+# read-only default for ControlConfig.custom, shared by every instance that
+# does not load its own values; copy it (dict(cfg.custom)) before editing
+_DEFAULT_CUSTOM: Mapping[str, float] = MappingProxyType(dict(DEFAULT_SIGNAL_VALUES))
 
-@dataclass
+
+@dataclass(slots=True)
 class HardTestConfig:
     """Placeholder for deterministic stress test profile."""
 
@@ -42,7 +47,7 @@ class HardTestConfig:
     data: Dict[str, Any] = field(default_factory=dict)
 
 
-@dataclass
+@dataclass(slots=True)
 class ControlConfig:
     profile_id: str = "ms_simplified"
     backend: str = "pythoncan"
@@ -54,11 +59,11 @@ class ControlConfig:
     bitrate: int = 500_000
     hz: float = 50.0
     mode: str = "loop"
-    custom: Dict[str, float] = field(default_factory=lambda: dict(DEFAULT_SIGNAL_VALUES))
+    custom: Mapping[str, float] = field(default_factory=lambda: _DEFAULT_CUSTOM)
     hard_test: HardTestConfig = field(default_factory=HardTestConfig)
 
 
-@dataclass
+@dataclass(slots=True)
 class TelemetrySnapshot:
     ts: float = 0.0
     iface: str = ""
@@ -75,6 +80,17 @@ class TelemetrySnapshot:
     counters: Dict[str, Any] = field(default_factory=dict)
 
     def to_dict(self) -> Dict[str, Any]:
-        if is_dataclass(self):
-            return asdict(self)
-        raise TypeError("TelemetrySnapshot must be a dataclass instance")
+        """Plain dict of the snapshot; the dict fields are copied one level deep."""
+        return {
+            "ts": self.ts,
+            "iface": self.iface,
+            "bitrate": self.bitrate,
+            "hz": self.hz,
+            "mode": self.mode,
+            "last_error": self.last_error,
+            "signals": dict(self.signals),
+            "signal_meta": dict(self.signal_meta),
+            "clamped": dict(self.clamped),
+            "faults": dict(self.faults),
+            "counters": dict(self.counters),
+        }
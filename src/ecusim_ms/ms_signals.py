@@ -2,7 +2,7 @@
 
 from __future__ import annotations
 
-from typing import Set
+from typing import FrozenSet, Tuple
 
 MS_MESSAGES = [
     "megasquirt_dash0",
@@ -13,8 +13,8 @@ MS_MESSAGES = [
 ]
 
 # Order must stay stable for UI/control/telemetry consumers; keys must match DBC signal names.
-# Order must stay stable for UI/control/telemetry consumers; keys must match DBC signal names.
-MS_SIGNAL_LIST = [
+# A tuple: it is never mutated and is iterated on every TX tick and telemetry poll.
+MS_SIGNAL_LIST: Tuple[str, ...] = (
     "map",
     "rpm",
     "clt",
@@ -35,10 +35,11 @@ MS_SIGNAL_LIST = [
     "VSS1",
     "tc_retard",
     "launch_timing",
-]
+)
 
-MS_SIGNAL_SET: Set[str] = set(MS_SIGNAL_LIST)
-MS_MESSAGE_SET: Set[str] = set(MS_MESSAGES)
+# read-only view for membership tests
+MS_SIGNAL_SET: FrozenSet[str] = frozenset(MS_SIGNAL_LIST)
+MS_MESSAGE_SET: FrozenSet[str] = frozenset(MS_MESSAGES)
 
 
 def assert_ms_signals_in_dbc(db) -> None:
@@ -63,12 +64,8 @@ def _has_message(db, name: str) -> bool:
         return False
 
 
-def _all_signal_names(db) -> Set[str]:
-    names: Set[str] = set()
+def _all_signal_names(db) -> FrozenSet[str]:
     try:
-        for msg in db.messages:
-            for sig in msg.signals:
-                names.add(sig.name)
+        return frozenset(sig.name for msg in db.messages for sig in msg.signals)
     except Exception:
-        return set()
-    return names
+        return frozenset()
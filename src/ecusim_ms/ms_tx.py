@@ -2,7 +2,7 @@
 
 from __future__ import annotations
 
-from typing import Dict, List, Tuple
+from typing import Dict, List, Optional, Tuple
 
 from cantools.database import Database, Message
 
@@ -17,33 +17,49 @@ MESSAGE_SIGNALS = {
     "megasquirt_dash4": ["VSS1", "tc_retard", "launch_timing"],
 }
 
-
-def _get_message(db: Database, name: str) -> Message:
-    msg = db.get_message_by_name(name)
-    if msg is None:
-        raise RuntimeError(f"DBC missing expected message {name}")
-    return msg
+# (message name, signal names) pairs walked by build_frames on every TX tick
+_MESSAGE_SIGNAL_ITEMS: Tuple[Tuple[str, Tuple[str, ...]], ...] = tuple(
+    (name, tuple(sig_list)) for name, sig_list in MESSAGE_SIGNALS.items()
+)
 
 
 def init_messages(db: Database) -> Dict[str, Message]:
     """Return a mapping of message name to cantools Message, validating presence."""
-    return {name: _get_message(db, name) for name in MESSAGE_SIGNALS.keys()}
+    by_name = {msg.name: msg for msg in db.messages}
+    msg_map: Dict[str, Message] = {}
+    for name in MESSAGE_SIGNALS:
+        msg = by_name.get(name)
+        if msg is None:
+            raise RuntimeError(f"DBC missing expected message {name}")
+        msg_map[name] = msg
+    return msg_map
 
 
 def build_frames(
-    msg_map: Dict[str, Message], signals_phys: Dict[str, float]
+    msg_map: Dict[str, Message],
+    signals_phys: Dict[str, float],
+    cache: Optional[dict] = None,
 ) -> List[Tuple[int, bytes, bool, Dict[str, float], Dict[str, Dict[str, object]]]]:
     """Build encoded frames for all dash messages.
 
     Returns a list of tuples: (frame_id, payload, is_extended, used_phys, clamped_info).
     Each signal from the 20-signal set is covered in exactly one message.
+    With a cache dict, a message whose inputs match the previous call reuses
+    that call's encoding.
     """
     frames = []
-    for name, sig_list in MESSAGE_SIGNALS.items():
+    get = signals_phys.get
+    for name, sig_list in _MESSAGE_SIGNAL_ITEMS:
         msg = msg_map.get(name)
         if msg is None:
             raise RuntimeError(f"Message {name} not loaded")
-        desired = {sig: signals_phys.get(sig, 0.0) for sig in sig_list}
-        payload, used, clamped = encode_message_safe(msg, desired)
+        values = tuple(get(sig, 0.0) for sig in sig_list)
+        hit = cache.get(msg.frame_id) if cache is not None else None
+        if hit is not None and hit[0] == values:
+            payload, used, clamped = hit[1], hit[2], hit[3]
+        else:
+            payload, used, clamped = encode_message_safe(msg, dict(zip(sig_list, values)))
+            if cache is not None:
+                cache[msg.frame_id] = (values, payload, used, clamped)
         frames.append((msg.frame_id, payload, msg.is_extended_frame, used, clamped))
     return frames
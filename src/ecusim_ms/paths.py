@@ -3,9 +3,11 @@
 from __future__ import annotations
 
 import sys
+from functools import cache
 from pathlib import Path
 
 
+@cache
 def _base_dir() -> Path:
     """Return the root directory for resolving assets and data.
 
@@ -22,36 +24,43 @@ def _base_dir() -> Path:
     return Path(__file__).resolve().parents[2]
 
 
+@cache
 def project_root() -> Path:
     """Project root for the current execution context."""
     return _base_dir()
 
 
+@cache
 def data_dir() -> Path:
     """Directory holding control/telemetry JSON and stop flag."""
     return project_root() / "data"
 
 
+@cache
 def control_path() -> Path:
     """Path to control.json."""
     return data_dir() / "control.json"
 
 
+@cache
 def telemetry_path() -> Path:
     """Path to telemetry.json."""
     return data_dir() / "telemetry.json"
 
 
+@cache
 def can_monitor_path() -> Path:
     """Path to can_monitor.jsonl (structured CAN RX log)."""
     return data_dir() / "can_monitor.jsonl"
 
 
+@cache
 def stop_flag_path() -> Path:
     """Path to stop.flag file (used in dev/test loops)."""
     return data_dir() / "stop.flag"
 
 
+@cache
 def dbc_path() -> Path:
     """Path to the MegaSquirt Simplified Dash broadcast DBC."""
     return project_root() / "assets" / "dbc" / "Megasquirt_simplified_dash_broadcast.dbc"
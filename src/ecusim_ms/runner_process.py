@@ -2,20 +2,112 @@
 
 from __future__ import annotations
 
+import codecs
+import selectors
 import subprocess
 import sys
 import threading
 import time
 from pathlib import Path
-from typing import Callable, Iterable, List, Optional
+from typing import Callable, Dict, Iterable, List, Optional, Tuple
 
 from ecusim_ms.stop_flag import request_stop
 import os
 
+# how long start() watches the new child for an early exit, and how often it
+# checks for an exit while the child stays quiet
+EARLY_EXIT_WAIT_S = 0.2
+EARLY_EXIT_POLL_S = 0.01
+
+_JOB_OBJECT_EXTENDED_LIMIT_INFORMATION = 9
+_JOB_OBJECT_LIMIT_KILL_ON_JOB_CLOSE = 0x2000
+
+
+def _create_kill_job(proc: subprocess.Popen) -> Optional[int]:
+    """Put proc in a Windows Job Object that kills its whole tree on close.
+
+    Returns the job handle, or None off Windows or when the job cannot be set up.
+    """
+    if os.name != "nt":
+        return None
+    try:
+        import ctypes
+        from ctypes import wintypes
+
+        class _BasicLimits(ctypes.Structure):
+            _fields_ = [
+                ("PerProcessUserTimeLimit", ctypes.c_int64),
+                ("PerJobUserTimeLimit", ctypes.c_int64),
+                ("LimitFlags", wintypes.DWORD),
+                ("MinimumWorkingSetSize", ctypes.c_size_t),
+                ("MaximumWorkingSetSize", ctypes.c_size_t),
+                ("ActiveProcessLimit", wintypes.DWORD),
+                ("Affinity", ctypes.c_size_t),
+                ("PriorityClass", wintypes.DWORD),
+                ("SchedulingClass", wintypes.DWORD),
+            ]
+
+        class _ExtendedLimits(ctypes.Structure):
+            _fields_ = [
+                ("BasicLimitInformation", _BasicLimits),
+                ("IoInfo", ctypes.c_uint64 * 6),
+                ("ProcessMemoryLimit", ctypes.c_size_t),
+                ("JobMemoryLimit", ctypes.c_size_t),
+                ("PeakProcessMemoryUsed", ctypes.c_size_t),
+                ("PeakJobMemoryUsed", ctypes.c_size_t),
+            ]
+
+        kernel32 = ctypes.WinDLL("kernel32", use_last_error=True)
+        kernel32.CreateJobObjectW.restype = wintypes.HANDLE
+        kernel32.CreateJobObjectW.argtypes = (wintypes.LPVOID, wintypes.LPCWSTR)
+        kernel32.SetInformationJobObject.argtypes = (
+            wintypes.HANDLE,
+            ctypes.c_int,
+            wintypes.LPVOID,
+            wintypes.DWORD,
+        )
+        kernel32.AssignProcessToJobObject.argtypes = (wintypes.HANDLE, wintypes.HANDLE)
+        kernel32.CloseHandle.argtypes = (wintypes.HANDLE,)
+
+        job = kernel32.CreateJobObjectW(None, None)
+        if not job:
+            return None
+        info = _ExtendedLimits()
+        info.BasicLimitInformation.LimitFlags = _JOB_OBJECT_LIMIT_KILL_ON_JOB_CLOSE
+        ok = kernel32.SetInformationJobObject(
+            job,
+            _JOB_OBJECT_EXTENDED_LIMIT_INFORMATION,
+            ctypes.byref(info),
+            ctypes.sizeof(info),
+        ) and kernel32.AssignProcessToJobObject(job, int(proc._handle))
+        if not ok:
+            kernel32.CloseHandle(job)
+            return None
+        return job
+    except Exception:
+        return None
+
+
+def _close_job(job: Optional[int]) -> None:
+    """Close a job handle; with KILL_ON_JOB_CLOSE this ends every process in it."""
+    if job is None:
+        return
+    try:
+        import ctypes
+        from ctypes import wintypes
+
+        kernel32 = ctypes.WinDLL("kernel32", use_last_error=True)
+        kernel32.CloseHandle.argtypes = (wintypes.HANDLE,)
+        kernel32.CloseHandle(job)
+    except Exception:
+        pass
+
 
 class RunnerProcess:
     def __init__(self) -> None:
         self.proc: Optional[subprocess.Popen] = None
+        # Windows Job Object holding the runner's process tree
+        self._job: Optional[int] = None
         self._stop_path: Optional[Path] = None
         self._stdout_thread: Optional[threading.Thread] = None
         self._stderr_thread: Optional[threading.Thread] = None
@@ -52,6 +144,49 @@ class RunnerProcess:
         t.start()
         return t
 
+    def _start_mux_reader(
+        self, streams: Iterable[Tuple[object, Optional[Callable[[str], None]]]]
+    ) -> threading.Thread:
+        """One thread pumping lines from several pipes via a selector (POSIX only)."""
+        watched = [(s, cb) for s, cb in streams if s is not None and cb is not None]
+
+        def _emit(callback: Callable[[str], None], line: str) -> None:
+            try:
+                callback(line.rstrip("\r"))
+            except Exception:
+                pass
+
+        def _loop():
+            sel = selectors.DefaultSelector()
+            pending: Dict[int, str] = {}
+            try:
+                for stream, callback in watched:
+                    fd = stream.fileno()
+                    decoder = codecs.getincrementaldecoder("utf-8")("replace")
+                    sel.register(fd, selectors.EVENT_READ, (callback, decoder))
+                    pending[fd] = ""
+                while sel.get_map():
+                    for key, _events in sel.select():
+                        callback, decoder = key.data
+                        chunk = os.read(key.fd, 65536)
+                        if not chunk:
+                            sel.unregister(key.fd)
+                            tail = pending.pop(key.fd) + decoder.decode(b"", final=True)
+                            if tail:
+                                _emit(callback, tail)
+                            continue
+                        *lines, pending[key.fd] = (pending[key.fd] + decoder.decode(chunk)).split("\n")
+                        for line in lines:
+                            _emit(callback, line)
+            except Exception:
+                pass
+            finally:
+                sel.close()
+
+        t = threading.Thread(target=_loop, daemon=True)
+        t.start()
+        return t
+
     def start(
         self,
         control_path: Path | str,
@@ -91,13 +226,44 @@ class RunnerProcess:
             close_fds=False,
             pass_fds=pass_fds,
             text=True,
-            bufsize=1,
+            # block-buffered on our side; the child line-buffers its output
+            bufsize=16384,
         )
-        self._stdout_thread = self._start_reader(self.proc.stdout, self._on_stdout)
-        self._stderr_thread = self._start_reader(self.proc.stderr, self._on_stderr)
+        # the runner is still importing when this lands, well before it
+        # could spawn anything of its own
+        self._job = _create_kill_job(self.proc)
+        stderr_seen = threading.Event()
+        user_on_stderr = self._on_stderr
+
+        def _on_stderr(line: str) -> None:
+            stderr_seen.set()
+            if user_on_stderr is not None:
+                user_on_stderr(line)
+
+        if os.name == "nt":
+            # Windows pipes cannot be registered with a selector
+            self._stdout_thread = self._start_reader(self.proc.stdout, self._on_stdout)
+            self._stderr_thread = self._start_reader(self.proc.stderr, _on_stderr)
+        else:
+            self._stdout_thread = self._start_mux_reader(
+                [(self.proc.stdout, self._on_stdout), (self.proc.stderr, _on_stderr)]
+            )
+            self._stderr_thread = None
 
-        # Early exit detection
-        time.sleep(0.2)
+        # Early exit detection: watch the child for up to EARLY_EXIT_WAIT_S and
+        # stop early only when it exits; once it writes to stderr (often a
+        # traceback on its way out) block on its exit for the rest of the window
+        deadline = time.monotonic() + EARLY_EXIT_WAIT_S
+        while self.proc.poll() is None:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                break
+            if stderr_seen.wait(min(remaining, EARLY_EXIT_POLL_S)):
+                try:
+                    self.proc.wait(timeout=max(0.0, deadline - time.monotonic()))
+                except subprocess.TimeoutExpired:
+                    pass
+                break
         if self.proc.poll() is not None:
             try:
                 stdout_tail = (self.proc.stdout.read() or "").strip() if self.proc.stdout else ""
@@ -107,6 +273,8 @@ class RunnerProcess:
                 stderr_tail = (self.proc.stderr.read() or "").strip() if self.proc.stderr else ""
             except Exception:
                 stderr_tail = ""
+            _close_job(self._job)
+            self._job = None
             msg = "Runner exited early."
             if stderr_tail:
                 msg += f" stderr: {stderr_tail}"
@@ -125,10 +293,11 @@ class RunnerProcess:
         except Exception:
             pass
 
-        waited = 0.0
-        while self.is_running() and waited < grace_s:
-            time.sleep(0.1)
-            waited += 0.1
+        # returns the moment the child exits instead of polling in 100 ms steps
+        try:
+            self.proc.wait(timeout=grace_s)
+        except subprocess.TimeoutExpired:
+            pass
 
         if self.is_running():
             try:
@@ -142,6 +311,8 @@ class RunnerProcess:
                     self.proc.kill()
                 except Exception:
                     pass
+        _close_job(self._job)
+        self._job = None
         self._cleanup_threads()
         self.proc = None
         self._stop_path = None
@@ -151,8 +322,9 @@ class RunnerProcess:
     def force_kill(self) -> None:
         """Immediately terminate the runner process (no grace)."""
         if not self.is_running():
+            _close_job(self._job)
+            self._job = None
             self.proc = None
-            self._kill_by_cmdline()
             return
         try:
             if self._stop_path:
@@ -160,21 +332,27 @@ class RunnerProcess:
         except Exception:
             pass
         pid = self.proc.pid if self.proc else None
+        if self._job is not None:
+            # one call tears down the runner and anything it started
+            _close_job(self._job)
+            self._job = None
+        else:
+            try:
+                self.proc.terminate()
+            except Exception:
+                pass
         try:
-            self.proc.terminate()
-        except Exception:
+            self.proc.wait(timeout=0.1)
+        except subprocess.TimeoutExpired:
             pass
-        time.sleep(0.1)
         if self.is_running():
             try:
                 self.proc.kill()
             except Exception:
                 pass
-        # Windows fallback: force kill process tree
-        if self.is_running() and pid:
+        # Windows without a job: force kill the process tree
+        if os.name == "nt" and self.is_running() and pid:
             try:
-                import subprocess
-
                 subprocess.run(
                     ["taskkill", "/F", "/T", "/PID", str(pid)],
                     check=False,
@@ -183,7 +361,6 @@ class RunnerProcess:
                 )
             except Exception:
                 pass
-        self._kill_by_cmdline()
         self._cleanup_threads()
         self.proc = None
         self._stop_path = None
@@ -196,28 +373,6 @@ class RunnerProcess:
                 self._stdout_thread.join(timeout=1.0)
         except Exception:
             pass
-
-    def _kill_by_cmdline(self) -> None:
-        """Best-effort kill of any lingering cli_runner processes (Windows only)."""
-        try:
-            import os
-            import subprocess
-
-            if os.name != "nt":
-                return
-            cmd = (
-                "$p = Get-CimInstance Win32_Process | "
-                "Where-Object { $_.CommandLine -match 'ecusim_ms\\.cli_runner' }; "
-                "foreach ($x in $p) { taskkill /F /T /PID $x.ProcessId | Out-Null }"
-            )
-            subprocess.run(
-                ["powershell", "-NoProfile", "-Command", cmd],
-                check=False,
-                stdout=subprocess.DEVNULL,
-                stderr=subprocess.DEVNULL,
-            )
-        except Exception:
-            pass
         try:
             if self._stderr_thread:
                 self._stderr_thread.join(timeout=1.0)
@@ -6,7 +6,8 @@ from __future__ import annotations
 
 import logging
 import math
-from typing import Dict
+from functools import lru_cache
+from typing import Callable, Dict
 
 from ecusim_ms.ms_signals import MS_SIGNAL_LIST
 
@@ -22,6 +23,8 @@ def _base_signals() -> Dict[str, float]:
 
 def _sanitize_map(val: float, ctx: str) -> float:
     """Clamp MAP to realistic bounds and warn on non-finite inputs."""
+    if MAP_MIN <= val <= MAP_MAX:
+        return val  # common case; NaN fails both comparisons
     if not math.isfinite(val):
         logging.warning("MAP non-finite in %s: %r -> %.1f kPa", ctx, val, MAP_FALLBACK)
         val = MAP_FALLBACK
@@ -48,6 +51,21 @@ def _ordered(signals: Dict[str, float], ctx: str) -> Dict[str, float]:
     return out
 
 
+def _sanitize_inplace(signals: Dict[str, float], ctx: str) -> Dict[str, float]:
+    """Sanitize a scenario dict already keyed in MS_SIGNAL_LIST order, in place.
+
+    Scenario values come from float literals and arithmetic, so no float()
+    cast is needed; MAP is clamped and any non-finite value becomes 0.0.
+    """
+    # MAP first: a non-finite MAP falls back to MAP_FALLBACK, not 0.0
+    signals["map"] = _sanitize_map(signals["map"], ctx)
+    isfinite = math.isfinite
+    for k, v in signals.items():
+        if not isfinite(v):
+            signals[k] = 0.0
+    return signals
+
+
 def enforce_map_bounds(signals: Dict[str, float], ctx: str = "runtime") -> float:
     """Ensure signals['map'] exists, is finite, and clamped; returns sanitized value."""
     raw = signals.get("map", MAP_FALLBACK)
@@ -61,11 +79,7 @@ def enforce_map_bounds(signals: Dict[str, float], ctx: str = "runtime") -> float
     return sanitized
 
 
-def _clamp(val: float, lo: float, hi: float) -> float:
-    return max(lo, min(hi, val))
-
-
-def scenario_koeo() -> Dict[str, float]:
+def _koeo_signals() -> Dict[str, float]:
     signals = {
         "map": 100.0,
         "rpm": 0.0,
@@ -91,32 +105,55 @@ def scenario_koeo() -> Dict[str, float]:
     return _ordered(signals, "scenario_koeo")
 
 
+# KOEO is constant: order and sanitize it once; callers get a fresh copy
+# because they update/clamp the returned dict in place
+_KOEO_ORDERED = _koeo_signals()
+
+
+def scenario_koeo() -> Dict[str, float]:
+    return dict(_KOEO_ORDERED)
+
+
+# angular frequencies (2*pi*f) of the idle wobble, folded once at import
+_W_RPM = 2 * math.pi * 0.5
+_W_TPS = 2 * math.pi * 0.2  # egt shares this frequency
+_W_MAP = 2 * math.pi * 0.3
+_W_BATT = 2 * math.pi * 0.1
+_W_ADV = 2 * math.pi * 0.25
+_W_PW = 2 * math.pi * 0.4
+_W_CLT = 2 * math.pi * 0.03
+_W_MAT = 2 * math.pi * 0.05
+_W_KNK = 2 * math.pi * 0.15
+
+
 def scenario_idle(t: float) -> Dict[str, float]:
-    s_rpm = math.sin(2 * math.pi * 0.5 * t)
-    s_tps = math.sin(2 * math.pi * 0.2 * t)
-    s_map = math.sin(2 * math.pi * 0.3 * t)
-    s_batt = math.sin(2 * math.pi * 0.1 * t)
-    s_adv = math.sin(2 * math.pi * 0.25 * t)
-    s_pw = math.sin(2 * math.pi * 0.4 * t)
-    s_clt = math.sin(2 * math.pi * 0.03 * t)
-    s_mat = math.sin(2 * math.pi * 0.05 * t)
-    s_egt = math.sin(2 * math.pi * 0.2 * t)
-    s_knk = math.sin(2 * math.pi * 0.15 * t)
+    sin = math.sin
+    s_rpm = sin(_W_RPM * t)
+    s_tps = sin(_W_TPS * t)
+    s_map = sin(_W_MAP * t)
+    s_batt = sin(_W_BATT * t)
+    s_adv = sin(_W_ADV * t)
+    s_pw = sin(_W_PW * t)
+    s_clt = sin(_W_CLT * t)
+    s_mat = sin(_W_MAT * t)
+    s_egt = s_tps
+    s_knk = sin(_W_KNK * t)
+    pw = 2.5 + 0.15 * s_pw
 
     signals = {
         "map": 100.0 + 1.0 * s_map,  # keep near baro for demo
         "rpm": 900.0 + 40.0 * s_rpm,
         "clt": 185.0 + 2.0 * s_clt,  # deg F
         "tps": 1.5 + 0.2 * s_tps,
-        "pw1": 2.5 + 0.15 * s_pw,
-        "pw2": 2.5 + 0.15 * s_pw,
+        "pw1": pw,
+        "pw2": pw,
         "mat": 86.0 + 1.0 * s_mat,  # deg F
         "adv_deg": 12.0 + 2.0 * s_adv,
         "afrtgt1": 14.7,
         "AFR1": 14.7,
         "egocor1": 100.0,
         "egt1": 500.0 + 30.0 * s_egt,  # deg F
-        "pwseq1": 2.5 + 0.15 * s_pw,
+        "pwseq1": pw,
         "batt": 14.0 - 0.05 * s_batt,
         "sensors1": 280.0 + 10.0 * s_map,
         "sensors2": 90.0 + 2.0 * s_mat,
@@ -125,26 +162,27 @@ def scenario_idle(t: float) -> Dict[str, float]:
         "tc_retard": 0.0,
         "launch_timing": 0.0,
     }
-    return _ordered(signals, "scenario_idle")
+    return _sanitize_inplace(signals, "scenario_idle")
 
 
 def scenario_pull(t: float) -> Dict[str, float]:
-    ramp = _clamp(t / 5.0, 0.0, 1.0)
+    ramp = 0.0 if t < 0.0 else (1.0 if t > 5.0 else t / 5.0)
     afr1 = 14.7 - 2.2 * ramp
+    pw = 3.0 + 8.0 * ramp
     signals = {
         "map": 100.0 + 10.0 * ramp,  # ~0-10 kPa above baro for demo
         "rpm": 1000.0 + 7000.0 * ramp,
         "clt": 185.0 + 5.0 * ramp,
         "tps": 2.0 + 93.0 * ramp,
-        "pw1": 3.0 + 8.0 * ramp,
-        "pw2": 3.0 + 8.0 * ramp,
+        "pw1": pw,
+        "pw2": pw,
         "mat": 86.0 + 10.0 * ramp,
         "adv_deg": 12.0 - 6.0 * ramp,
         "afrtgt1": afr1,
         "AFR1": afr1,
         "egocor1": 100.0,
         "egt1": 520.0 + 650.0 * ramp,  # deg F
-        "pwseq1": 3.0 + 8.0 * ramp,
+        "pwseq1": pw,
         "batt": 14.0 - 0.2 * ramp,
         "sensors1": 300.0 + 220.0 * ramp,
         "sensors2": 95.0 + 15.0 * ramp,
@@ -153,7 +191,7 @@ def scenario_pull(t: float) -> Dict[str, float]:
         "tc_retard": 0.0,
         "launch_timing": 0.0,
     }
-    return _ordered(signals, "scenario_pull")
+    return _sanitize_inplace(signals, "scenario_pull")
 
 
 def scenario_loop(t: float) -> Dict[str, float]:
@@ -165,19 +203,55 @@ def scenario_loop(t: float) -> Dict[str, float]:
     return scenario_pull(t15 - 10.0)
 
 
-def scenario_values(mode: str, t: float) -> Dict[str, float]:
-    mode_l = (mode or "").lower()
-    if mode_l == "loop":
-        return scenario_loop(t)
-    if mode_l == "koeo":
-        return scenario_koeo()
-    if mode_l == "idle":
-        return scenario_idle(t)
-    if mode_l == "pull":
-        return scenario_pull(t)
-    if mode_l == "custom":
-        return scenario_idle(t)
-    if mode_l == "silent":
-        return scenario_loop(t)
-    # default fallback
-    return scenario_idle(t)
+# custom starts from idle and silent still runs the loop (it just never sends)
+_SCENARIOS = {
+    "loop": scenario_loop,
+    "koeo": lambda t: scenario_koeo(),
+    "idle": scenario_idle,
+    "pull": scenario_pull,
+    "custom": scenario_idle,
+    "silent": scenario_loop,
+}
+
+
+# scenarios are sampled on a fixed time grid and memoized per (scenario, bin);
+# t is folded into each scenario's period first so the cache stays bounded.
+# Faster senders would repeat values across frames, so they bypass the grid
+SCENARIO_BIN_S = 0.02
+SCENARIO_CACHE_MAX_HZ = 1.0 / SCENARIO_BIN_S
+_LOOP_PERIOD_S = 15.0
+_IDLE_PERIOD_S = 100.0  # every idle wobble frequency is a multiple of 0.01 Hz
+_PULL_RAMP_S = 5.0
+
+
+def _time_bin(fn: Callable[[float], Dict[str, float]], t: float) -> int:
+    if fn is scenario_loop:
+        t %= _LOOP_PERIOD_S
+    elif fn is scenario_idle:
+        t %= _IDLE_PERIOD_S
+    elif fn is scenario_pull:
+        t = 0.0 if t < 0.0 else min(t, _PULL_RAMP_S)
+    else:
+        return 0  # koeo is constant
+    return int(t / SCENARIO_BIN_S)
+
+
+@lru_cache(maxsize=8192)
+def _scenario_cached(fn: Callable[[float], Dict[str, float]], t_bin: int) -> Dict[str, float]:
+    """Signals of fn at the start of t_bin; shared, so never mutate the result."""
+    return fn(t_bin * SCENARIO_BIN_S)
+
+
+def scenario_values(mode: str, t: float, hz: float = 0.0) -> Dict[str, float]:
+    """Scenario signals for mode at t, for a sender running at hz.
+
+    Up to SCENARIO_CACHE_MAX_HZ (and when hz is not given) t is quantized down
+    to the SCENARIO_BIN_S grid, so values lag t by less than one bin (at most
+    about 28 rpm on the idle wobble); faster senders get the exact values.
+    Returns a fresh dict; callers update and clamp it in place.
+    """
+    # unknown modes fall back to idle
+    fn = _SCENARIOS.get((mode or "").lower(), scenario_idle)
+    if hz > SCENARIO_CACHE_MAX_HZ:
+        return fn(t)
+    return dict(_scenario_cached(fn, _time_bin(fn, t)))
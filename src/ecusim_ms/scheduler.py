@@ -2,8 +2,53 @@
 
 from __future__ import annotations
 
+import ctypes
+import errno
+import sys
 import time
-from typing import Optional
+from typing import Callable, Optional
+
+# Linux/Android clock ids (time.monotonic() reads CLOCK_MONOTONIC there too).
+_CLOCK_MONOTONIC = 1
+_TIMER_ABSTIME = 1
+
+
+class _Timespec(ctypes.Structure):
+    _fields_ = [("tv_sec", ctypes.c_long), ("tv_nsec", ctypes.c_long)]
+
+
+def _load_sleep_until() -> Optional[Callable[[int], None]]:
+    """Return an absolute-deadline sleep on CLOCK_MONOTONIC, or None if unavailable.
+
+    The stdlib only exposes relative sleeps; an absolute deadline avoids the
+    drift of "compute remaining time, then sleep it".
+    """
+    if not sys.platform.startswith(("linux", "android")):
+        return None
+    try:
+        clock_nanosleep = ctypes.CDLL(None).clock_nanosleep
+    except Exception:
+        return None
+    clock_nanosleep.argtypes = [
+        ctypes.c_int,
+        ctypes.c_int,
+        ctypes.POINTER(_Timespec),
+        ctypes.POINTER(_Timespec),
+    ]
+    clock_nanosleep.restype = ctypes.c_int
+
+    def _sleep_until(deadline_ns: int) -> None:
+        ts = _Timespec(deadline_ns // 1_000_000_000, deadline_ns % 1_000_000_000)
+        # returns the error number directly; retry the same deadline on EINTR
+        while True:
+            rc = clock_nanosleep(_CLOCK_MONOTONIC, _TIMER_ABSTIME, ctypes.byref(ts), None)
+            if rc != errno.EINTR:
+                return
+
+    return _sleep_until
+
+
+_sleep_until = _load_sleep_until()
 
 
 class FixedRateScheduler:
@@ -12,27 +57,29 @@ class FixedRateScheduler:
             raise ValueError("hz must be positive")
         self.hz = hz
         self.dt = 1.0 / hz
-        self._start: Optional[float] = None
-        self._next: Optional[float] = None
+        self._dt_ns = round(1e9 / hz)
+        self._start_ns: Optional[int] = None
+        self._next_ns: Optional[int] = None
 
     def start(self) -> None:
-        now = time.monotonic()
-        self._start = now
-        self._next = now + self.dt
+        now = time.monotonic_ns()
+        self._start_ns = now
+        self._next_ns = now + self._dt_ns
 
     def wait_next(self) -> float:
-        if self._start is None or self._next is None:
+        if self._start_ns is None or self._next_ns is None:
             self.start()
 
-        while True:
-            now = time.monotonic()
-            sleep_time = self._next - now
-            if sleep_time > 0:
-                time.sleep(sleep_time)
-                now = time.monotonic()
-            else:
-                # late: do not sleep; realign next tick to current time
-                self._next = now
-            # schedule next tick
-            self._next += self.dt
-            return now - (self._start or now)
+        # absolute sleep returns at once if the deadline already passed, so
+        # a single clock read after it covers both the on-time and late paths
+        deadline = self._next_ns
+        if _sleep_until is not None:
+            _sleep_until(deadline)
+        else:
+            remaining = deadline - time.monotonic_ns()
+            if remaining > 0:
+                time.sleep(remaining / 1e9)
+        now = time.monotonic_ns()
+        # late: realign next tick to current time instead of bursting to catch up
+        self._next_ns = max(deadline + self._dt_ns, now)
+        return (now - self._start_ns) / 1e9
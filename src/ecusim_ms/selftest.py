@@ -3,7 +3,10 @@
 from __future__ import annotations
 
 import logging
+import operator
+import queue
 import sys
+import threading
 import time
 
 from ecusim_ms import dbc_loader, paths
@@ -11,6 +14,7 @@ from ecusim_ms.bitrate import DEFAULT_BITRATE
 from ecusim_ms.can_bus import CanBus
 from ecusim_ms.control_override import read_overrides
 from ecusim_ms.dbc_codec import (
+    MessagePacker,
     encode_message_safe,
     get_encode_error_count,
     reset_encode_error_stats,
@@ -20,29 +24,79 @@ from ecusim_ms.scenarios import scenario_values
 from ecusim_ms.scheduler import FixedRateScheduler
 
 
-def _build_payloads(dbc_db, scenario):
-    payloads = {}
-    used_per_msg = {}
+def _precompute_messages(dbc_db):
+    """Return (msg, signal_names, packer) per message, skipping duplicate bit layouts."""
+    precomputed = []
     for msg in dbc_db.messages:
-        desired = {}
+        names = []
         seen_bits = set()
         for sig in msg.signals:
             key = (sig.start, sig.length, getattr(sig, "byte_order", "big_endian"))
             if key in seen_bits:
                 continue
             seen_bits.add(key)
-            desired[sig.name] = scenario.get(sig.name, 0.0)
-        payload, used, _ = encode_message_safe(msg, desired)
+            names.append(sig.name)
+        precomputed.append((msg, tuple(names), MessagePacker(msg)))
+    return tuple(precomputed)
+
+
+def _build_payloads(precomputed, scenario, cache=None):
+    """Encode every message; with a cache dict, unchanged inputs reuse the last result."""
+    payloads = {}
+    used_per_msg = {}
+    for msg, names, packer in precomputed:
+        values = tuple(scenario.get(name, 0.0) for name in names)
+        hit = cache.get(msg.name) if cache is not None else None
+        if hit is not None and hit[0] == values:
+            payload, used = hit[1], hit[2]
+        else:
+            payload, used, _ = packer.encode(dict(zip(names, values)))
+            if cache is not None:
+                cache[msg.name] = (values, payload, used)
         payloads[msg.name] = payload
         used_per_msg[msg.name] = used
     return payloads, used_per_msg
 
 
+def _tuple_getter(names):
+    """itemgetter that always returns a tuple, even for a single name."""
+    if len(names) == 1:
+        name = names[0]
+        return lambda d: (d[name],)
+    return operator.itemgetter(*names)
+
+
+def _start_periodic(bus, batch, period_s):
+    """Start one cyclic task per frame; {} (nothing left running) if any is unsupported."""
+    tasks = {}
+    for fid, data, ext in batch:
+        task = bus.send_periodic(fid, data, ext, period_s)
+        if task is None:
+            for started in tasks.values():
+                started.stop()
+            return {}
+        tasks[fid] = task
+    return tasks
+
+
+def _tx_worker(bus, tx_q, sent):
+    """Send per-tick frame batches from tx_q until the None sentinel arrives."""
+    while True:
+        batch = tx_q.get()
+        if batch is None:
+            return
+        try:
+            sent[0] += bus.send_many(batch)
+        except Exception as exc:
+            logging.warning("Selftest send failed: %s", exc)
+
+
 def main() -> int:
     logging.basicConfig(level=logging.INFO, format="%(asctime)s %(levelname)s %(message)s")
 
     dbc_db = dbc_loader.load_db(paths.dbc_path())
     dbc_loader.assert_expected_layout(dbc_db)
+    precomputed = _precompute_messages(dbc_db)
     reset_encode_error_stats()
 
     # Endianness sanity: RPM 0x1234 should yield bytes ...12 34... (big endian)
@@ -73,49 +127,98 @@ def main() -> int:
     scheduler = FixedRateScheduler(hz)
     scheduler.start()
 
-    start = time.perf_counter()
+    # roundtrip check metadata for dash0: signal names, tolerances, tuple getter
+    dash0 = dbc_db.get_message_by_name("megasquirt_dash0")
+    dash0_names = tuple(sig.name for sig in dash0.signals) if dash0 else ()
+    dash0_tols = tuple(max(abs(sig.scale), 1e-6) for sig in dash0.signals) if dash0 else ()
+    dash0_values = _tuple_getter(dash0_names) if dash0_names else None
+    # per-message TX metadata, frozen once instead of read off cantools objects each tick
+    msg_tx = tuple(
+        (msg.frame_id, msg.name, getattr(msg, "is_extended_frame", False))
+        for msg in dbc_db.messages
+    )
+
+    # sends run on a worker so the tick thread can encode the next batch meanwhile;
+    # a small queue makes a stalled bus show up as overflow quickly
+    tx_q: queue.Queue = queue.Queue(maxsize=64)
+    tx_sent = [0]
+    tx_thread = threading.Thread(target=_tx_worker, args=(bus, tx_q, tx_sent), daemon=True)
+    tx_thread.start()
+
+    # last (inputs, payload, used) per message; slow-varying scenarios mostly hit it
+    payload_cache = {}
+
+    # hot callables bound to locals once, outside the tick loop
+    perf = time.perf_counter
+    make_scenario = scenario_values
+    get_overrides = read_overrides
+    build_payloads = _build_payloads
+    control_path = paths.control_path()
+    tx_put = tx_q.put_nowait
+    dash0_decode = dash0.decode if dash0 else None
+    rx_recv = rx_bus.recv if rx_bus else None
+    wait_next = scheduler.wait_next
+
+    # fid -> PeriodicTx once started; {} means the bus has no send_periodic and
+    # each tick's batch goes through the TX worker instead
+    periodic = None
+    tx_periodic = 0
+
+    start = perf()
     duration = 5.0
-    tx_frames = 0
     rx_seen = False
 
     try:
         while True:
-            now = time.perf_counter()
+            now = perf()
             if now - start >= duration:
                 break
 
-            scenario = scenario_values("loop", now - start)
-            overrides = read_overrides(paths.control_path(), MS_SIGNAL_LIST)
-            scenario.update(overrides)
+            scenario = make_scenario("loop", now - start, hz)
+            scenario.update(get_overrides(control_path, MS_SIGNAL_LIST))
 
             try:
-                payloads, used_per_msg = _build_payloads(dbc_db, scenario)
+                payloads, used_per_msg = build_payloads(precomputed, scenario, payload_cache)
             except Exception as exc:
                 logging.error("Selftest encode failed: %s", exc)
                 return 1
-            for msg in dbc_db.messages:
-                data = payloads.get(msg.name)
-                if data is None:
-                    continue
-                if bus.send(
-                    msg.frame_id, data, is_extended=getattr(msg, "is_extended_frame", False)
-                ):
-                    tx_frames += 1
+            batch = [(fid, payloads[name], ext) for fid, name, ext in msg_tx if name in payloads]
+            if periodic is None:
+                periodic = _start_periodic(bus, batch, 1.0 / hz)
+            if periodic:
+                # tasks run at the tick rate, so each one carries a frame per tick
+                for fid, data, _ext in batch:
+                    periodic[fid].update(data)
+                tx_periodic += len(batch)
+            else:
+                try:
+                    tx_put(batch)
+                except queue.Full:
+                    logging.error("Selftest failed: TX queue overflow (bus stalled)")
+                    return 1
 
             # roundtrip decode check on dash0 if available
-            dash0 = dbc_db.get_message_by_name("megasquirt_dash0")
-            if dash0 and "megasquirt_dash0" in payloads and "megasquirt_dash0" in used_per_msg:
+            if (
+                dash0_values
+                and "megasquirt_dash0" in payloads
+                and "megasquirt_dash0" in used_per_msg
+            ):
                 try:
-                    decoded = dash0.decode(payloads["megasquirt_dash0"])
+                    decoded = dash0_decode(payloads["megasquirt_dash0"])
                     used = used_per_msg["megasquirt_dash0"]
-                    for sig in dash0.signals:
-                        sent_val = used.get(sig.name, 0.0)
-                        decoded_val = decoded.get(sig.name, 0.0)
-                        tol = max(abs(sig.scale), 1e-6)
+                    try:
+                        sent_vals = dash0_values(used)
+                        decoded_vals = dash0_values(decoded)
+                    except KeyError:
+                        sent_vals = tuple(used.get(name, 0.0) for name in dash0_names)
+                        decoded_vals = tuple(decoded.get(name, 0.0) for name in dash0_names)
+                    for name, sent_val, decoded_val, tol in zip(
+                        dash0_names, sent_vals, decoded_vals, dash0_tols
+                    ):
                         if abs(sent_val - decoded_val) > tol + 1e-6:
                             logging.error(
                                 "Selftest decode mismatch for %s: sent=%s decoded=%s tol=%s",
-                                sig.name,
+                                name,
                                 sent_val,
                                 decoded_val,
                                 tol,
@@ -125,17 +228,25 @@ def main() -> int:
                     logging.error("Selftest decode failed: %s", exc)
                     return 1
 
-            if rx_bus and not rx_seen:
-                msg = rx_bus.recv(timeout_s=0.05)
+            if rx_recv and not rx_seen:
+                msg = rx_recv(timeout_s=0.05)
                 if msg is not None:
                     rx_seen = True
 
-            scheduler.wait_next()
+            wait_next()
     finally:
+        try:
+            tx_q.put(None, timeout=1.0)
+        except queue.Full:
+            pass
+        tx_thread.join(timeout=2.0)
+        for task in (periodic or {}).values():
+            task.stop()
         bus.close()
         if rx_bus:
             rx_bus.close()
 
+    tx_frames = tx_sent[0] + tx_periodic
     if tx_frames <= 0:
         logging.error("Selftest failed: no frames sent")
         return 1
@@ -5,11 +5,19 @@ from __future__ import annotations
 import logging
 import time
 from pathlib import Path
-from typing import Optional
+from typing import Dict, List, Optional
 
 from cantools.database import Database
 
 from ecusim_ms.can_bus import CanBus
+from ecusim_ms.stop_flag import make_is_set
+
+# the stop file is checked at most this often rather than before every recv
+STOP_CHECK_INTERVAL_S = 0.5
+
+# CSV lines are written in batches: this many, or after this long
+LOG_BATCH_LINES = 128
+LOG_BATCH_S = 0.25
 
 
 def sniff_loop(
@@ -20,34 +28,59 @@ def sniff_loop(
     decode: bool,
 ) -> None:
     log_file = None
+    pending: List[str] = []
     try:
         if log_path:
             log_path.parent.mkdir(parents=True, exist_ok=True)
             log_file = log_path.open("a", encoding="utf-8")
             log_file.write("ts,dir,id,dlc,data_hex,decoded\n")
 
+        # frame id -> Message, built once instead of a DBC lookup per frame
+        by_frame_id = {m.frame_id: m for m in db.messages} if decode and db else {}
+
+        stop_requested = make_is_set(stop_file)
+        next_stop_check = 0.0
+        last_flush = time.monotonic()
+        debug_enabled = logging.getLogger().isEnabledFor(logging.DEBUG)
+        # a bus repeats a few dozen ids; format each one once
+        id_hex: Dict[int, str] = {}
         while True:
-            if stop_file.exists():
-                break
+            now = time.monotonic()
+            if now >= next_stop_check:
+                if stop_requested():
+                    break
+                next_stop_check = now + STOP_CHECK_INTERVAL_S
+            if pending and (len(pending) >= LOG_BATCH_LINES or now - last_flush >= LOG_BATCH_S):
+                log_file.write("".join(pending))
+                log_file.flush()
+                pending.clear()
+                last_flush = now
 
             msg = bus.recv(timeout_s=0.1)
             if msg is None:
                 continue
 
             decoded = ""
-            if decode and db:
+            dbc_msg = by_frame_id.get(msg.arbitration_id) if by_frame_id else None
+            if dbc_msg is not None:
                 try:
-                    dbc_msg = db.get_message_by_frame_id(msg.arbitration_id)
-                    if dbc_msg:
-                        decoded = dbc_msg.decode(msg.data)
+                    decoded = dbc_msg.decode(msg.data)
                 except Exception:
                     decoded = ""
 
-            line = f"{time.time():.3f},RX,{hex(msg.arbitration_id)},${msg.dlc},{msg.data.hex()},{decoded}"
-            logging.info("RX %s", line)
+            aid = msg.arbitration_id
+            aid_hex = id_hex.get(aid)
+            if aid_hex is None:
+                aid_hex = id_hex[aid] = hex(aid)
+            line = "%.3f,RX,%s,%s,%s,%s" % (time.time(), aid_hex, msg.dlc, msg.data.hex(), decoded)
+            if debug_enabled:
+                logging.debug("RX %s", line)
             if log_file:
-                log_file.write(line + "\n")
-                log_file.flush()
+                pending.append(line + "\n")
     finally:
         if log_file:
-            log_file.close()
+            try:
+                if pending:
+                    log_file.write("".join(pending))
+            finally:
+                log_file.close()
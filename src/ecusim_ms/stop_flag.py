@@ -2,7 +2,9 @@
 
 from __future__ import annotations
 
+import os
 from pathlib import Path
+from typing import Callable
 
 
 def ensure_not_set(stop_path: Path) -> None:
@@ -15,11 +17,18 @@ def ensure_not_set(stop_path: Path) -> None:
 
 def is_set(stop_path: Path) -> bool:
     try:
-        return stop_path.exists()
+        return os.path.exists(stop_path)
     except Exception:
         return False
 
 
+def make_is_set(stop_path: Path) -> Callable[[], bool]:
+    """Return a no-arg is_set for polling loops; the path is converted once."""
+    path = os.fspath(stop_path)
+    exists = os.path.exists  # never raises; False on OSError/ValueError
+    return lambda: exists(path)
+
+
 def request_stop(stop_path: Path) -> None:
     try:
         stop_path.parent.mkdir(parents=True, exist_ok=True)
@@ -2,25 +2,57 @@
 
 from __future__ import annotations
 
+import functools
+import sys
 import time
-from typing import Any
+from typing import Any, Callable
 
+from ecusim_ms import models
 from ecusim_ms.control_io import save_telemetry_safe
 
+# The coarse clock is a plain memory read of the last kernel tick (lags by up to
+# ~4 ms), which is plenty for a 5 Hz gate polled from the TX loop. The stdlib
+# does not name it, so fall back to the Linux/Android clock id.
+_COARSE = getattr(time, "CLOCK_MONOTONIC_COARSE", None)
+if _COARSE is None and sys.platform.startswith(("linux", "android")):
+    _COARSE = 6
+
+
+def _load_now() -> Callable[[], float]:
+    if _COARSE is not None:
+        try:
+            time.clock_gettime(_COARSE)
+            return functools.partial(time.clock_gettime, _COARSE)
+        except Exception:
+            pass
+    return time.monotonic
+
+
+_now = _load_now()
+
 
 class TelemetryWriter:
-    def __init__(self, path, hz: float = 5.0) -> None:
+    def __init__(self, path, hz: float = 5.0, heartbeat_s: float = 1.0) -> None:
         if hz <= 0:
             raise ValueError("hz must be positive")
         self.path = path
         self.hz = hz
         self.dt = 1.0 / hz
-        self._next = time.monotonic()
+        # readers use "ts" for freshness, so an unchanged snapshot is still
+        # rewritten at least this often
+        self.heartbeat_s = heartbeat_s
+        self._next = _now()
+        self._last_body: Any = None
+        self._last_write = float("-inf")
 
     def maybe_write(self, snapshot: Any) -> None:
-        """Persist telemetry at the configured rate; never raise."""
+        """Persist telemetry at the configured rate; never raise.
+
+        Snapshots identical to the last one written (ignoring "ts") are skipped
+        until the heartbeat interval elapses.
+        """
         try:
-            now = time.monotonic()
+            now = _now()
             if now < self._next:
                 return
 
@@ -28,6 +60,16 @@ class TelemetryWriter:
             while self._next <= now:
                 self._next += self.dt
 
-            save_telemetry_safe(self.path, snapshot)
+            payload = snapshot
+            if isinstance(snapshot, models.TelemetrySnapshot):
+                payload = snapshot.to_dict()
+            if isinstance(payload, dict):
+                body = dict(payload)
+                body.pop("ts", None)
+                if body == self._last_body and now - self._last_write < self.heartbeat_s:
+                    return
+                self._last_body = body
+            self._last_write = now
+            save_telemetry_safe(self.path, payload)
         except Exception:
             return
@@ -3,7 +3,8 @@
 from __future__ import annotations
 
 import logging
-from typing import Optional
+import os
+from typing import Dict, Iterable, Optional, Tuple
 
 import can
 from ecusim_ms.transports.termux_libusb_slcan import TermuxUsbSlcan
@@ -20,13 +21,97 @@ SLCAN_BITRATE_MAP = {
     1_000_000: "S8",
 }
 
+# Frames per serial write in send_many; keeps one burst within the adapter's
+# TX queue so a large batch cannot overflow it.
+SLCAN_MAX_BATCH = 16
+
+TxItem = Tuple[int, bytes, bool]
+
+# Data frames sent without waiting for an ack skip the serial flush() on POSIX,
+# where it is tcdrain(); Windows keeps it (FlushFileBuffers on the handle).
+_FLUSH_DATA_FRAMES = os.name == "nt"
+
+# SLCAN wants uppercase ASCII hex; a byte -> b"XX" table avoids the str
+# round-trip of payload.hex().upper().encode() on every frame.
+_HEX_DIGITS = b"0123456789ABCDEF"
+_HEX_U = tuple(bytes((_HEX_DIGITS[i >> 4], _HEX_DIGITS[i & 0xF])) for i in range(256))
+# ASCII byte -> nibble value, -1 for non-hex; OR-ing a -1 into a result keeps
+# it negative, so a single sign check validates a whole field.
+_HEX_VAL = [-1] * 256
+for _i, _c in enumerate(b"0123456789ABCDEF"):
+    _HEX_VAL[_c] = _i
+    _HEX_VAL[_c | 0x20] = _i  # lowercase
+
+
+def _parse_hex(line: bytes, start: int, end: int) -> int:
+    value = 0
+    for i in range(start, end):
+        value = (value << 4) | _HEX_VAL[line[i]]
+    return value
+
+
+def _append_slcan_frame(buf: bytearray, frame_id: int, payload: bytes, is_extended: bool) -> None:
+    """Append an SLCAN t/T frame (without the trailing CR) to buf.
+
+    Raises ValueError for a payload over 8 bytes or an out-of-range ID.
+    """
+    dlc = len(payload)
+    if dlc > 8:
+        raise ValueError(f"SLCAN payload too long: {dlc}")
+    if is_extended:
+        if frame_id > 0x1FFFFFFF or frame_id < 0:
+            raise ValueError(f"SLCAN extended ID out of range: {frame_id}")
+        buf += b"T%08X" % frame_id
+    else:
+        if frame_id > 0x7FF or frame_id < 0:
+            raise ValueError(f"SLCAN standard ID out of range: {frame_id}")
+        buf += b"t%03X" % frame_id
+    buf.append(_HEX_DIGITS[dlc])
+    for b in payload:
+        buf += _HEX_U[b]
+
+
+def _slcan_frame_cr(frame_id: int, payload: bytes, is_extended: bool) -> bytes:
+    buf = bytearray()
+    _append_slcan_frame(buf, frame_id, payload, is_extended)
+    buf += b"\r"
+    return bytes(buf)
+
 
 def _state_to_str(state: object | None) -> str | None:
     if state is None:
         return None
-    if hasattr(state, "name"):
-        return str(getattr(state, "name", ""))
-    return str(state)
+    name = getattr(state, "name", None)
+    return str(name) if name is not None else str(state)
+
+
+class PeriodicTx:
+    """Handle for a python-can cyclic send task carrying one frame id."""
+
+    def __init__(self, task, frame_id: int, is_extended: bool, payload: bytes) -> None:
+        self.task = task
+        self.frame_id = frame_id
+        self.is_extended = is_extended
+        self._payload = bytes(payload)
+
+    def update(self, payload: bytes) -> None:
+        """Swap the periodic frame's data; a no-op when it is unchanged."""
+        if payload == self._payload:
+            return
+        self._payload = bytes(payload)
+        self.task.modify_data(
+            can.Message(
+                arbitration_id=self.frame_id,
+                is_extended_id=self.is_extended,
+                data=self._payload,
+            )
+        )
+
+    def stop(self) -> None:
+        try:
+            self.task.stop()
+        except Exception:
+            pass
 
 
 class CanTransport:
@@ -40,12 +125,26 @@ class CanTransport:
     def send(self, frame_id: int, payload: bytes, is_extended: bool = False) -> bool:
         raise NotImplementedError
 
+    def send_many(self, items: Iterable[TxItem]) -> int:
+        """Send (frame_id, payload, is_extended) items; return how many were sent."""
+        sent = 0
+        for frame_id, payload, is_extended in items:
+            if self.send(frame_id, payload, is_extended=is_extended):
+                sent += 1
+        return sent
+
     def recv(self, timeout_s: float | None = 1.0) -> Optional[can.Message]:
         raise NotImplementedError
 
     def close(self) -> None:
         raise NotImplementedError
 
+    def send_periodic(
+        self, frame_id: int, payload: bytes, is_extended: bool, period_s: float
+    ) -> Optional[PeriodicTx]:
+        """Start transmitting a frame every period_s; None if unsupported."""
+        return None
+
     def get_state(self) -> str | None:
         return None
 
@@ -64,23 +163,33 @@ class TermuxUsbSlcanTransport(CanTransport):
             return
         if not os.environ.get("TERMUX_USB_FD"):
             raise RuntimeError("TERMUX_USB_FD not set. Launch via: termux-usb -r -E -e ... <device>")
-        self.dev = TermuxUsbSlcan()
+        dev = TermuxUsbSlcan()
         cmd = SLCAN_BITRATE_MAP.get(int(self.bitrate), "S6")
-        self.dev.init_slcan(cmd)
+        try:
+            dev.init_slcan(cmd)
+        except Exception:
+            dev.close()
+            raise
+        self.dev = dev
 
     def send(self, frame_id: int, payload: bytes, is_extended: bool = False) -> bool:
+        return self.send_prebuilt(_slcan_frame_cr(frame_id, payload, is_extended))
+
+    @staticmethod
+    def build_frame(frame_id: int, payload: bytes, is_extended: bool = False) -> bytes:
+        """CR-terminated SLCAN bytes for one frame, to pass to send_prebuilt."""
+        return _slcan_frame_cr(frame_id, payload, is_extended)
+
+    def send_prebuilt(self, frame: bytes) -> bool:
+        """Send a frame from build_frame; lets loops resending one frame skip encoding."""
         if self.dev is None:
             raise RuntimeError("termux-usb device not open")
-        dlc = len(payload)
-        if is_extended:
-            frame = "T%08X%1X%s\r" % (frame_id, dlc, payload.hex().upper())
-        else:
-            frame = "t%03X%1X%s\r" % (frame_id & 0x7FF, dlc, payload.hex().upper())
         try:
-            self.dev.write_ascii(frame)
+            self.dev.write_bytes(frame)
             return True
-        except Exception:
-            self.tx_errors += 1
+        except Exception as exc:
+            # this frame, plus any queued earlier that the flusher lost
+            self.tx_errors += 1 + getattr(exc, "frames", 0)
             raise
 
     def recv(self, timeout_s: float | None = 1.0) -> Optional[can.Message]:
@@ -106,6 +215,11 @@ class PythonCanTransport(CanTransport):
         self.bus: Optional[can.BusABC] = None
         self.termux_usb = None  # Termux USB/libusb SLCAN transport
         self.tx_errors = 0
+        # one reusable Message per (id, extended); only for interfaces whose
+        # send() copies the frame before returning (virtual deep-copies,
+        # gs_usb packs it into a GsUsbFrame)
+        self._reuse_msgs = iface in ("virtual", "gs_usb")
+        self._msg_cache: Dict[Tuple[int, bool], can.Message] = {}
 
     def open(self) -> None:
         if self.bus is not None:
@@ -171,23 +285,27 @@ class PythonCanTransport(CanTransport):
     def send(self, frame_id: int, payload: bytes, is_extended: bool = False) -> bool:
         if self.bus is None:
             raise RuntimeError("CAN bus is not open")
-        msg = can.Message(
-            arbitration_id=frame_id,
-            is_extended_id=is_extended,
-            data=payload,
-        )
+        if self._reuse_msgs:
+            msg = self._msg_cache.get((frame_id, is_extended))
+            if msg is None:
+                msg = can.Message(arbitration_id=frame_id, is_extended_id=is_extended)
+                self._msg_cache[(frame_id, is_extended)] = msg
+            msg.data[:] = payload
+            msg.dlc = len(payload)
+        else:
+            msg = can.Message(
+                arbitration_id=frame_id,
+                is_extended_id=is_extended,
+                data=payload,
+            )
         try:
             if getattr(self, "backend", None) == "termux-usb":
                 if not self.termux_usb:
                     raise RuntimeError("termux-usb transport not initialized")
-                arbid = msg.arbitration_id
-                data = msg.data or b""
-                dlc = len(data)
-                if getattr(msg, "is_extended_id", False):
-                    frame = "T%08X%1X%s\r" % (arbid, dlc, data.hex().upper())
-                else:
-                    frame = "t%03X%1X%s\r" % (arbid & 0x7FF, dlc, data.hex().upper())
-                self.termux_usb.write_ascii(frame)
+                frame = _slcan_frame_cr(
+                    msg.arbitration_id, bytes(msg.data or b""), bool(msg.is_extended_id)
+                )
+                self.termux_usb.write_bytes(frame)
                 return True
             
 
@@ -203,6 +321,23 @@ class PythonCanTransport(CanTransport):
             )
             return False
 
+    def send_periodic(
+        self, frame_id: int, payload: bytes, is_extended: bool, period_s: float
+    ) -> Optional[PeriodicTx]:
+        if self.bus is None:
+            raise RuntimeError("CAN bus is not open")
+        if getattr(self, "backend", None) == "termux-usb":
+            return None
+        msg = can.Message(arbitration_id=frame_id, is_extended_id=is_extended, data=payload)
+        try:
+            # pacing is done by the driver/kernel where the interface supports
+            # it, otherwise by python-can's own sender thread
+            task = self.bus.send_periodic(msg, period_s)
+        except (can.CanError, NotImplementedError) as exc:
+            logging.info("send_periodic unavailable (iface=%s): %s", self.iface, exc)
+            return None
+        return PeriodicTx(task, frame_id, is_extended, payload)
+
     def recv(self, timeout_s: float | None = 1.0) -> Optional[can.Message]:
         if self.bus is None:
             return None
@@ -216,16 +351,13 @@ class PythonCanTransport(CanTransport):
         if self.bus is None:
             return
         try:
-            shutdown = getattr(self.bus, "shutdown", None)
-            if callable(shutdown):
-                shutdown()
+            # BusABC.shutdown is the python-can lifecycle call; close() is not
+            # part of the interface and only duplicated it where present
+            self.bus.shutdown()
         except Exception:
             pass
-        try:
-            self.bus.close()
-        except Exception:
-            pass
-        self.bus = None
+        finally:
+            self.bus = None
 
     def get_state(self) -> str | None:
         if self.bus is None:
@@ -254,23 +386,10 @@ class SlcanSerialTransport(CanTransport):
         self.tx_errors = 0
 
     @staticmethod
-    def format_frame(frame_id: int, payload: bytes, is_extended: bool = False) -> str:
-        payload = payload or b""
-        dlc = len(payload)
-        if dlc > 8:
-            raise ValueError(f"SLCAN payload too long: {dlc}")
-        if is_extended:
-            if frame_id > 0x1FFFFFFF or frame_id < 0:
-                raise ValueError(f"SLCAN extended ID out of range: {frame_id}")
-            cmd = "T"
-            id_hex = f"{frame_id:08X}"
-        else:
-            if frame_id > 0x7FF or frame_id < 0:
-                raise ValueError(f"SLCAN standard ID out of range: {frame_id}")
-            cmd = "t"
-            id_hex = f"{frame_id:03X}"
-        data_hex = payload.hex().upper()
-        return f"{cmd}{id_hex}{dlc:X}{data_hex}"
+    def format_frame(frame_id: int, payload: bytes, is_extended: bool = False) -> bytes:
+        buf = bytearray()
+        _append_slcan_frame(buf, frame_id, payload or b"", is_extended)
+        return bytes(buf)
 
     def _read_response(self, timeout_s: float = 0.05) -> bytes:
         if self.ser is None:
@@ -287,16 +406,44 @@ class SlcanSerialTransport(CanTransport):
             except Exception:
                 pass
 
+    def _poll_response(self) -> bytes:
+        """Like _read_response, but returns b"" at once when nothing is buffered."""
+        if self.ser is None:
+            return b""
+        try:
+            if not self.ser.in_waiting:
+                return b""
+        except Exception:
+            return b""
+        # read a whole line so a pending RX frame is not split mid-way
+        return self._read_response(0.01)
+
     def _write_cmd(self, cmd: str, expect_ack: bool = True) -> None:
+        """Send a command-channel line (C, S<n>, O) and drain its reply.
+
+        Always blocks for the reply so it cannot be mistaken for the ack of a
+        later command. Without expect_ack a BELL is tolerated: C on a channel
+        that is already closed (the normal state at startup) answers BELL.
+        """
         if self.ser is None:
             raise RuntimeError("Serial port not open")
-        payload = cmd.encode("ascii") + b"\r"
-        self.ser.write(payload)
+        self.ser.write(cmd.encode("ascii") + b"\r")
         self.ser.flush()
         resp = self._read_response(0.05) if expect_ack else self._read_response(0.01)
-        if b"\x07" in resp:
+        if expect_ack and b"\x07" in resp:
             raise RuntimeError(f"SLCAN error response to {cmd}")
 
+    def _write_frame(self, frame: bytes) -> None:
+        """Send one data frame; its ack is polled without blocking."""
+        if self.ser is None:
+            raise RuntimeError("Serial port not open")
+        self.ser.write(frame + b"\r")
+        # on POSIX flush() is tcdrain, blocking until the bytes hit the wire
+        if _FLUSH_DATA_FRAMES:
+            self.ser.flush()
+        if b"\x07" in self._poll_response():
+            raise RuntimeError("SLCAN error response to data frame")
+
     def open(self) -> None:
         if self.ser is not None:
             return
@@ -341,7 +488,7 @@ class SlcanSerialTransport(CanTransport):
             raise RuntimeError("Serial port not open")
         frame = self.format_frame(frame_id, payload, is_extended=is_extended)
         try:
-            self._write_cmd(frame, expect_ack=False)
+            self._write_frame(frame)
             return True
         except Exception as exc:
             self.tx_errors += 1
@@ -353,6 +500,42 @@ class SlcanSerialTransport(CanTransport):
             )
             return False
 
+    def send_many(self, items: Iterable[TxItem]) -> int:
+        """Send frames with one serial write per SLCAN_MAX_BATCH frames."""
+        if self.ser is None:
+            raise RuntimeError("Serial port not open")
+        sent = 0
+        pending = 0
+        buf = bytearray()
+        try:
+            for frame_id, payload, is_extended in items:
+                try:
+                    buf += self.format_frame(frame_id, payload, is_extended=is_extended)
+                except ValueError as exc:
+                    self.tx_errors += 1
+                    logging.warning("SLCAN frame skipped (id=0x%x): %s", frame_id, exc)
+                    continue
+                buf += b"\r"
+                pending += 1
+                if pending == SLCAN_MAX_BATCH:
+                    self.ser.write(buf)
+                    sent += pending
+                    pending = 0
+                    buf.clear()
+            if pending:
+                self.ser.write(buf)
+                sent += pending
+            if sent:
+                if _FLUSH_DATA_FRAMES:
+                    self.ser.flush()
+                resp = self._poll_response()
+                if b"\x07" in resp:
+                    raise RuntimeError("SLCAN error response to batched frames")
+        except Exception as exc:
+            self.tx_errors += 1
+            logging.warning("SLCAN batch send failed (port=%s): %s", self.port, exc)
+        return sent
+
     def recv(self, timeout_s: float | None = 1.0) -> Optional[can.Message]:
         if self.ser is None:
             return None
@@ -374,29 +557,34 @@ class SlcanSerialTransport(CanTransport):
         line = raw.strip()
         if not line:
             return None
-        try:
-            prefix = chr(line[0])
-        except Exception:
+        prefix = line[0]
+        if prefix == 0x74:  # b"t"
+            id_end = 4
+        elif prefix == 0x54:  # b"T"
+            id_end = 9
+        else:
+            return None
+        if len(line) <= id_end:
             return None
-        if prefix not in {"t", "T"}:
+        hexval = _HEX_VAL
+        frame_id = _parse_hex(line, 1, id_end)
+        dlc = hexval[line[id_end]]
+        if frame_id < 0 or dlc < 0:
             return None
+        off = id_end + 1
+        if len(line) < off + dlc * 2:
+            return None
+        payload = bytearray(dlc)
+        for j in range(dlc):
+            b = (hexval[line[off]] << 4) | hexval[line[off + 1]]
+            if b < 0:
+                return None
+            payload[j] = b
+            off += 2
         try:
-            if prefix == "t":
-                if len(line) < 5:
-                    return None
-                frame_id = int(line[1:4].decode("ascii"), 16)
-                dlc = int(chr(line[4]), 16)
-                data_hex = line[5 : 5 + dlc * 2].decode("ascii")
-            else:
-                if len(line) < 10:
-                    return None
-                frame_id = int(line[1:9].decode("ascii"), 16)
-                dlc = int(chr(line[9]), 16)
-                data_hex = line[10 : 10 + dlc * 2].decode("ascii")
-            payload = bytes.fromhex(data_hex) if data_hex else b""
             return can.Message(
                 arbitration_id=frame_id,
-                is_extended_id=(prefix == "T"),
+                is_extended_id=(prefix == 0x54),
                 data=payload,
             )
         except Exception:
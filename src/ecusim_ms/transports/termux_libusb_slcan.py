@@ -1,8 +1,14 @@
 import os
+import collections
 import ctypes
 import ctypes.util
+import logging
+import queue
+import struct
+import threading
+import time
 from dataclasses import dataclass
-from typing import Optional, Tuple
+from typing import Dict, Optional, Tuple
 
 # libusb C types
 libusb_context_p = ctypes.c_void_p
@@ -14,63 +20,100 @@ LIBUSB_ENDPOINT_OUT = 0x00
 LIBUSB_TRANSFER_TYPE_MASK = 0x03
 LIBUSB_TRANSFER_TYPE_BULK = 0x02
 
+# Descriptor types (wire format)
+LIBUSB_DT_DEVICE = 0x01
+LIBUSB_DT_INTERFACE = 0x04
+LIBUSB_DT_ENDPOINT = 0x05
+
+# Bulk OUT scratch size; larger writes are split into chunks of this size
+TX_BUF_SIZE = 4096
+# Async TX ring: transfers that may be in flight at once
+ASYNC_TX_TRANSFERS = 8
+LIBUSB_TRANSFER_COMPLETED = 0
+# TX coalescing: queued frames are joined into bulk OUTs of at most this size
+COALESCE_MAX_BYTES = 512
+# frames allowed to wait in the outbound queue before writes fail
+OUTQ_MAX_FRAMES = 1024
+# on close the flusher keeps draining for this long, then drops the backlog
+FLUSH_STOP_DRAIN_S = 0.5
+
 class LibusbError(RuntimeError):
     pass
 
-def _load_libusb():
+class LibusbQueuedWriteError(LibusbError):
+    """Frames queued by earlier write_bytes calls failed on the flusher.
+
+    frames is how many of those earlier frames were not sent.
+    """
+
+    def __init__(self, msg: str, frames: int):
+        super().__init__(msg)
+        self.frames = frames
+
+def _libusb_path():
     path = ctypes.util.find_library("usb-1.0")
     if not path:
         # Termux usually provides libusb-1.0.so
         path = "libusb-1.0.so"
-    return ctypes.CDLL(path)
-
-_libusb = _load_libusb()
-
-# int libusb_init(libusb_context **ctx);
-_libusb.libusb_init.argtypes = [ctypes.POINTER(libusb_context_p)]
-_libusb.libusb_init.restype = ctypes.c_int
+    return path
 
-# void libusb_exit(libusb_context *ctx);
-_libusb.libusb_exit.argtypes = [libusb_context_p]
-_libusb.libusb_exit.restype = None
-
-# int libusb_wrap_sys_device(libusb_context *ctx, intptr_t sys_dev, libusb_device_handle **dev_handle);
-# Linux: sys_dev is usually a file descriptor for usbfs node
-_libusb.libusb_wrap_sys_device.argtypes = [libusb_context_p, ctypes.c_long, ctypes.POINTER(libusb_device_handle_p)]
-_libusb.libusb_wrap_sys_device.restype = ctypes.c_int
-
-# int libusb_kernel_driver_active(libusb_device_handle *dev, int interface_number);
-_libusb.libusb_kernel_driver_active.argtypes = [libusb_device_handle_p, ctypes.c_int]
-_libusb.libusb_kernel_driver_active.restype = ctypes.c_int
-
-# int libusb_detach_kernel_driver(libusb_device_handle *dev, int interface_number);
-_libusb.libusb_detach_kernel_driver.argtypes = [libusb_device_handle_p, ctypes.c_int]
-_libusb.libusb_detach_kernel_driver.restype = ctypes.c_int
-
-# int libusb_attach_kernel_driver(libusb_device_handle *dev, int interface_number);
-_libusb.libusb_attach_kernel_driver.argtypes = [libusb_device_handle_p, ctypes.c_int]
-_libusb.libusb_attach_kernel_driver.restype = ctypes.c_int
+def _load_libusb():
+    # CDLL (not PyDLL) drops the GIL around every foreign call, so a blocking
+    # libusb_bulk_transfer does not stall the telemetry/GUI threads
+    return ctypes.CDLL(_libusb_path())
 
-# int libusb_claim_interface(libusb_device_handle *dev, int interface_number);
-_libusb.libusb_claim_interface.argtypes = [libusb_device_handle_p, ctypes.c_int]
-_libusb.libusb_claim_interface.restype = ctypes.c_int
+def _load_cffi_hot_path():
+    """Optional cffi (ABI mode) binding for the per-frame calls.
 
-# int libusb_release_interface(libusb_device_handle *dev, int interface_number);
-_libusb.libusb_release_interface.argtypes = [libusb_device_handle_p, ctypes.c_int]
-_libusb.libusb_release_interface.restype = ctypes.c_int
+    Setup and descriptor parsing stay on ctypes; only bulk transfer and
+    submit, called once per write, go through cffi's cheaper call path.
+    dlopen returns the same loaded library, so handles are shared. Like
+    ctypes.CDLL, ABI-mode calls release the GIL for their duration.
+    """
+    try:
+        import cffi
+    except ImportError:  # pragma: no cover - optional dependency
+        return None
+    try:
+        ffi = cffi.FFI()
+        ffi.cdef(
+            """
+            struct libusb_transfer;
+            int libusb_bulk_transfer(void *dev_handle, unsigned char endpoint,
+                                     unsigned char *data, int length,
+                                     int *transferred, unsigned int timeout);
+            int libusb_submit_transfer(struct libusb_transfer *transfer);
+            """
+        )
+        return ffi, ffi.dlopen(_libusb_path())
+    except Exception:
+        return None
 
-# void libusb_close(libusb_device_handle *dev_handle);
-_libusb.libusb_close.argtypes = [libusb_device_handle_p]
-_libusb.libusb_close.restype = None
+# Asynchronous transfer API
+class libusb_transfer(ctypes.Structure):
+    pass
 
-# int libusb_bulk_transfer(libusb_device_handle *dev, unsigned char endpoint,
-#                          unsigned char *data, int length, int *transferred, unsigned int timeout);
-_libusb.libusb_bulk_transfer.argtypes = [
-    libusb_device_handle_p, ctypes.c_ubyte,
-    ctypes.c_void_p, ctypes.c_int,
-    ctypes.POINTER(ctypes.c_int), ctypes.c_uint
+# void (*libusb_transfer_cb_fn)(struct libusb_transfer *transfer);
+libusb_transfer_cb_fn = ctypes.CFUNCTYPE(None, ctypes.POINTER(libusb_transfer))
+
+libusb_transfer._fields_ = [
+    ("dev_handle", libusb_device_handle_p),
+    ("flags", ctypes.c_uint8),
+    ("endpoint", ctypes.c_ubyte),
+    ("type", ctypes.c_ubyte),
+    ("timeout", ctypes.c_uint),
+    ("status", ctypes.c_int),
+    ("length", ctypes.c_int),
+    ("actual_length", ctypes.c_int),
+    ("callback", libusb_transfer_cb_fn),
+    ("user_data", ctypes.c_void_p),
+    ("buffer", ctypes.c_void_p),
+    ("num_iso_packets", ctypes.c_int),
+    # iso_packet_desc[] follows; unused for bulk (alloc with 0 iso packets)
 ]
-_libusb.libusb_bulk_transfer.restype = ctypes.c_int
+
+class timeval(ctypes.Structure):
+    _fields_ = [("tv_sec", ctypes.c_long), ("tv_usec", ctypes.c_long)]
 
 # Descriptor structs (minimal subset)
 class libusb_endpoint_descriptor(ctypes.Structure):
@@ -124,16 +167,155 @@ class libusb_config_descriptor(ctypes.Structure):
         ("extra_length", ctypes.c_int),
     ]
 
-# int libusb_get_active_config_descriptor(libusb_device *dev, libusb_config_descriptor **config);
-# Need libusb_device*: get it from handle: libusb_get_device(handle)
-_libusb.libusb_get_device.argtypes = [libusb_device_handle_p]
-_libusb.libusb_get_device.restype = ctypes.c_void_p
 
-_libusb.libusb_get_active_config_descriptor.argtypes = [ctypes.c_void_p, ctypes.POINTER(ctypes.POINTER(libusb_config_descriptor))]
-_libusb.libusb_get_active_config_descriptor.restype = ctypes.c_int
+class libusb_device_descriptor(ctypes.Structure):
+    _fields_ = [
+        ("bLength", ctypes.c_uint8),
+        ("bDescriptorType", ctypes.c_uint8),
+        ("bcdUSB", ctypes.c_uint16),
+        ("bDeviceClass", ctypes.c_uint8),
+        ("bDeviceSubClass", ctypes.c_uint8),
+        ("bDeviceProtocol", ctypes.c_uint8),
+        ("bMaxPacketSize0", ctypes.c_uint8),
+        ("idVendor", ctypes.c_uint16),
+        ("idProduct", ctypes.c_uint16),
+        ("bcdDevice", ctypes.c_uint16),
+        ("iManufacturer", ctypes.c_uint8),
+        ("iProduct", ctypes.c_uint8),
+        ("iSerialNumber", ctypes.c_uint8),
+        ("bNumConfigurations", ctypes.c_uint8),
+    ]
+
+
+
+# Loaded by _ensure_libusb() on first TermuxUsbSlcan(), so importing this
+# module (e.g. from transport.py on a desktop) does no library I/O
+_libusb = None
+_CFFI = None
+_dev_mem_alloc = None
+_dev_mem_free = None
+_HAS_ASYNC = False
+_libusb_lock = threading.Lock()
+
+
+def _bind_prototypes(lib):
+    # int libusb_init(libusb_context **ctx);
+    lib.libusb_init.argtypes = [ctypes.POINTER(libusb_context_p)]
+    lib.libusb_init.restype = ctypes.c_int
+
+    # void libusb_exit(libusb_context *ctx);
+    lib.libusb_exit.argtypes = [libusb_context_p]
+    lib.libusb_exit.restype = None
+
+    # int libusb_wrap_sys_device(libusb_context *ctx, intptr_t sys_dev, libusb_device_handle **dev_handle);
+    # Linux: sys_dev is usually a file descriptor for usbfs node
+    lib.libusb_wrap_sys_device.argtypes = [libusb_context_p, ctypes.c_long, ctypes.POINTER(libusb_device_handle_p)]
+    lib.libusb_wrap_sys_device.restype = ctypes.c_int
+
+    # int libusb_kernel_driver_active(libusb_device_handle *dev, int interface_number);
+    lib.libusb_kernel_driver_active.argtypes = [libusb_device_handle_p, ctypes.c_int]
+    lib.libusb_kernel_driver_active.restype = ctypes.c_int
 
-_libusb.libusb_free_config_descriptor.argtypes = [ctypes.POINTER(libusb_config_descriptor)]
-_libusb.libusb_free_config_descriptor.restype = None
+    # int libusb_detach_kernel_driver(libusb_device_handle *dev, int interface_number);
+    lib.libusb_detach_kernel_driver.argtypes = [libusb_device_handle_p, ctypes.c_int]
+    lib.libusb_detach_kernel_driver.restype = ctypes.c_int
+
+    # int libusb_attach_kernel_driver(libusb_device_handle *dev, int interface_number);
+    lib.libusb_attach_kernel_driver.argtypes = [libusb_device_handle_p, ctypes.c_int]
+    lib.libusb_attach_kernel_driver.restype = ctypes.c_int
+
+    # int libusb_claim_interface(libusb_device_handle *dev, int interface_number);
+    lib.libusb_claim_interface.argtypes = [libusb_device_handle_p, ctypes.c_int]
+    lib.libusb_claim_interface.restype = ctypes.c_int
+
+    # int libusb_release_interface(libusb_device_handle *dev, int interface_number);
+    lib.libusb_release_interface.argtypes = [libusb_device_handle_p, ctypes.c_int]
+    lib.libusb_release_interface.restype = ctypes.c_int
+
+    # void libusb_close(libusb_device_handle *dev_handle);
+    lib.libusb_close.argtypes = [libusb_device_handle_p]
+    lib.libusb_close.restype = None
+
+    # int libusb_bulk_transfer(libusb_device_handle *dev, unsigned char endpoint,
+    #                          unsigned char *data, int length, int *transferred, unsigned int timeout);
+    lib.libusb_bulk_transfer.argtypes = [
+        libusb_device_handle_p, ctypes.c_ubyte,
+        ctypes.c_void_p, ctypes.c_int,
+        ctypes.POINTER(ctypes.c_int), ctypes.c_uint
+    ]
+    lib.libusb_bulk_transfer.restype = ctypes.c_int
+
+    # int libusb_get_active_config_descriptor(libusb_device *dev, libusb_config_descriptor **config);
+    # Need libusb_device*: get it from handle: libusb_get_device(handle)
+    lib.libusb_get_device.argtypes = [libusb_device_handle_p]
+    lib.libusb_get_device.restype = ctypes.c_void_p
+
+    lib.libusb_get_active_config_descriptor.argtypes = [ctypes.c_void_p, ctypes.POINTER(ctypes.POINTER(libusb_config_descriptor))]
+    lib.libusb_get_active_config_descriptor.restype = ctypes.c_int
+
+    lib.libusb_free_config_descriptor.argtypes = [ctypes.POINTER(libusb_config_descriptor)]
+    lib.libusb_free_config_descriptor.restype = None
+
+    # int libusb_get_device_descriptor(libusb_device *dev, struct libusb_device_descriptor *desc);
+    lib.libusb_get_device_descriptor.argtypes = [ctypes.c_void_p, ctypes.POINTER(libusb_device_descriptor)]
+    lib.libusb_get_device_descriptor.restype = ctypes.c_int
+
+
+def _ensure_libusb():
+    """Load libusb and bind its prototypes on first use (thread-safe)."""
+    global _libusb, _CFFI, _dev_mem_alloc, _dev_mem_free, _HAS_ASYNC
+    if _libusb is not None:
+        return _libusb
+    with _libusb_lock:
+        if _libusb is not None:
+            return _libusb
+        try:
+            lib = _load_libusb()
+        except OSError as exc:
+            raise LibusbError(f"cannot load libusb ({_libusb_path()}): {exc}") from exc
+        _bind_prototypes(lib)
+
+        # unsigned char *libusb_dev_mem_alloc(libusb_device_handle *dev_handle, size_t length);
+        # int libusb_dev_mem_free(libusb_device_handle *dev_handle, unsigned char *buffer, size_t length);
+        # libusb >= 1.0.21; on Linux >= 4.9 the buffer is usbfs-mmapped, so bulk
+        # transfers from it skip the kernel bounce copy.
+        try:
+            _dev_mem_alloc = lib.libusb_dev_mem_alloc
+            _dev_mem_alloc.argtypes = [libusb_device_handle_p, ctypes.c_size_t]
+            _dev_mem_alloc.restype = ctypes.c_void_p
+            _dev_mem_free = lib.libusb_dev_mem_free
+            _dev_mem_free.argtypes = [libusb_device_handle_p, ctypes.c_void_p, ctypes.c_size_t]
+            _dev_mem_free.restype = ctypes.c_int
+        except AttributeError:
+            _dev_mem_alloc = None
+            _dev_mem_free = None
+
+        try:
+            # struct libusb_transfer *libusb_alloc_transfer(int iso_packets);
+            lib.libusb_alloc_transfer.argtypes = [ctypes.c_int]
+            lib.libusb_alloc_transfer.restype = ctypes.POINTER(libusb_transfer)
+            # int libusb_submit_transfer(struct libusb_transfer *transfer);
+            lib.libusb_submit_transfer.argtypes = [ctypes.POINTER(libusb_transfer)]
+            lib.libusb_submit_transfer.restype = ctypes.c_int
+            # int libusb_cancel_transfer(struct libusb_transfer *transfer);
+            lib.libusb_cancel_transfer.argtypes = [ctypes.POINTER(libusb_transfer)]
+            lib.libusb_cancel_transfer.restype = ctypes.c_int
+            # void libusb_free_transfer(struct libusb_transfer *transfer);
+            lib.libusb_free_transfer.argtypes = [ctypes.POINTER(libusb_transfer)]
+            lib.libusb_free_transfer.restype = None
+            # int libusb_handle_events_timeout_completed(libusb_context *ctx, struct timeval *tv, int *completed);
+            lib.libusb_handle_events_timeout_completed.argtypes = [
+                libusb_context_p, ctypes.POINTER(timeval), ctypes.POINTER(ctypes.c_int)
+            ]
+            lib.libusb_handle_events_timeout_completed.restype = ctypes.c_int
+            _HAS_ASYNC = True
+        except AttributeError:
+            _HAS_ASYNC = False
+
+        _CFFI = _load_cffi_hot_path()
+        # publish last: other threads skip the lock once this is set
+        _libusb = lib
+    return lib
 
 
 def _check(rc: int, msg: str):
@@ -148,7 +330,90 @@ class UsbEndpoints:
     ep_in: Optional[int] = None
 
 
-def _find_bulk_endpoints(handle: libusb_device_handle_p) -> UsbEndpoints:
+# (idVendor, idProduct, bcdDevice) -> endpoints; the layout is fixed per
+# adapter model/firmware, so reconnects skip the descriptor walk
+_EP_CACHE: Dict[Tuple[int, int, int], UsbEndpoints] = {}
+
+
+def _cached_bulk_endpoints(handle: libusb_device_handle_p, fd: Optional[int] = None) -> UsbEndpoints:
+    key = None
+    try:
+        dev = _libusb.libusb_get_device(handle)
+        desc = libusb_device_descriptor()
+        if dev and _libusb.libusb_get_device_descriptor(dev, ctypes.byref(desc)) == 0:
+            key = (int(desc.idVendor), int(desc.idProduct), int(desc.bcdDevice))
+    except Exception:
+        key = None
+    if key is not None:
+        eps = _EP_CACHE.get(key)
+        if eps is not None:
+            return eps
+    eps = _raw_bulk_endpoints(fd) if fd is not None else None
+    if eps is None:
+        eps = _find_bulk_endpoints(handle)
+    if key is not None:
+        _EP_CACHE[key] = eps
+    return eps
+
+
+def _raw_bulk_endpoints(fd: int) -> Optional[UsbEndpoints]:
+    # usbfs returns the device descriptor followed by the raw config
+    # descriptors on read (libusb parses the same bytes), so the endpoint
+    # walk needs no ctypes struct traversal
+    try:
+        raw = os.pread(fd, 4096, 0)
+    except (OSError, AttributeError):
+        return None
+    return _parse_bulk_endpoints(raw)
+
+
+def _parse_bulk_endpoints(
+    raw: bytes,
+    _IN=LIBUSB_ENDPOINT_IN,
+    _MASK=LIBUSB_TRANSFER_TYPE_MASK,
+    _BULK=LIBUSB_TRANSFER_TYPE_BULK,
+) -> Optional[UsbEndpoints]:
+    unpack = struct.unpack_from
+    n = len(raw)
+    if n < 18:
+        return None
+    length, dtype = unpack("<BB", raw, 0)
+    # several configurations: cannot tell the active one from here
+    if dtype != LIBUSB_DT_DEVICE or raw[17] != 1:
+        return None
+    off = length
+    iface = None
+    out_ep = None
+    in_ep = None
+    while off + 4 <= n:
+        length, dtype, b2, b3 = unpack("<BBBB", raw, off)
+        if length < 2:
+            return None  # malformed; let the libusb walk handle it
+        if dtype == LIBUSB_DT_INTERFACE:
+            if out_ep is not None:
+                break
+            iface = b2
+            in_ep = None
+        elif dtype == LIBUSB_DT_ENDPOINT and iface is not None:
+            # b2 = bEndpointAddress, b3 = bmAttributes
+            if b3 & _MASK == _BULK:
+                if b2 & _IN:
+                    in_ep = b2
+                else:
+                    out_ep = b2
+        off += length
+    if out_ep is None:
+        return None
+    return UsbEndpoints(interface_number=iface, ep_out=out_ep, ep_in=in_ep)
+
+
+def _find_bulk_endpoints(
+    handle: libusb_device_handle_p,
+    _IN=LIBUSB_ENDPOINT_IN,
+    _MASK=LIBUSB_TRANSFER_TYPE_MASK,
+    _BULK=LIBUSB_TRANSFER_TYPE_BULK,
+) -> UsbEndpoints:
+    # mask constants are bound as defaults so the endpoint loop reads locals
     dev = _libusb.libusb_get_device(handle)
     if not dev:
         raise LibusbError("libusb_get_device returned NULL")
@@ -159,25 +424,28 @@ def _find_bulk_endpoints(handle: libusb_device_handle_p) -> UsbEndpoints:
 
     try:
         cfg = cfg_p.contents
+        interfaces = cfg.interface
         # iterate interfaces / altsettings / endpoints, pick first interface with bulk OUT (+ optional bulk IN)
         for i in range(cfg.bNumInterfaces):
-            intf = cfg.interface[i]
+            intf = interfaces[i]
+            altsettings = intf.altsetting
             for a in range(intf.num_altsetting):
-                alt = intf.altsetting[a]
+                alt = altsettings[a]
+                endpoints = alt.endpoint
                 out_ep = None
                 in_ep = None
+                # scan the whole altsetting: the IN endpoint may follow the OUT one
                 for e in range(alt.bNumEndpoints):
-                    ep = alt.endpoint[e]
-                    addr = ep.bEndpointAddress
-                    xfer_type = ep.bmAttributes & LIBUSB_TRANSFER_TYPE_MASK
-                    if xfer_type != LIBUSB_TRANSFER_TYPE_BULK:
+                    ep = endpoints[e]
+                    if ep.bmAttributes & _MASK != _BULK:
                         continue
-                    if (addr & LIBUSB_ENDPOINT_IN) == LIBUSB_ENDPOINT_IN:
+                    addr = ep.bEndpointAddress
+                    if addr & _IN:
                         in_ep = addr
                     else:
                         out_ep = addr
                 if out_ep is not None:
-                    return UsbEndpoints(interface_number=int(alt.bInterfaceNumber), ep_out=int(out_ep), ep_in=(int(in_ep) if in_ep is not None else None))
+                    return UsbEndpoints(interface_number=alt.bInterfaceNumber, ep_out=out_ep, ep_in=in_ep)
         raise LibusbError("No BULK OUT endpoint found in active config descriptor")
     finally:
         _libusb.libusb_free_config_descriptor(cfg_p)
@@ -187,7 +455,8 @@ class TermuxUsbSlcan:
     """
     SLCAN over Termux USB FD using libusb_wrap_sys_device.
     """
-    def __init__(self, usb_fd_env: str = "TERMUX_USB_FD", baudrate: int = 115200, timeout_ms: int = 200):
+    def __init__(self, usb_fd_env: str = "TERMUX_USB_FD", baudrate: int = 115200, timeout_ms: int = 200, async_tx: bool = True, batch_tx: bool = True):
+        _ensure_libusb()
         self.usb_fd_env = usb_fd_env
         self.timeout_ms = timeout_ms
         self.ctx = libusb_context_p()
@@ -208,7 +477,7 @@ class TermuxUsbSlcan:
         rc = _libusb.libusb_wrap_sys_device(self.ctx, ctypes.c_long(self.fd), ctypes.byref(self.handle))
         _check(rc, "libusb_wrap_sys_device failed (fd might not be usbfs device)")
 
-        self.eps = _find_bulk_endpoints(self.handle)
+        self.eps = _cached_bulk_endpoints(self.handle, self.fd)
 
         # Android often binds a kernel driver; try to detach before claiming
         try:
@@ -220,42 +489,319 @@ class TermuxUsbSlcan:
         rc = _libusb.libusb_claim_interface(self.handle, int(self.eps.interface_number))
         _check(rc, f"libusb_claim_interface({self.eps.interface_number}) failed")
 
+        # Reused TX scratch + transfer args, so a write does no ctypes allocation
+        self._tx_size = TX_BUF_SIZE
+        self._tx_buf = None
+        self._tx_dma = False
+        addr = _dev_mem_alloc(self.handle, self._tx_size) if _dev_mem_alloc else None
+        if addr:
+            self._tx_addr = addr
+            self._tx_dma = True
+        else:
+            # older libusb/kernel: plain heap buffer (kernel copies it per transfer)
+            self._tx_buf = (ctypes.c_ubyte * self._tx_size)()
+            self._tx_addr = ctypes.addressof(self._tx_buf)
+        self._ep_out = ctypes.c_ubyte(self.eps.ep_out)
+        self._timeout_c = ctypes.c_uint(self.timeout_ms)
+        self._transferred = ctypes.c_int(0)
+        self._transferred_ref = ctypes.byref(self._transferred)
+        self._bulk = _libusb.libusb_bulk_transfer
+        self._bulk_out = self._bulk_out_ctypes
+        if _CFFI is not None:
+            ffi, lib = _CFFI
+            self._bulk_c = lib.libusb_bulk_transfer
+            self._handle_c = ffi.cast("void *", self.handle.value)
+            self._tx_addr_c = ffi.cast("unsigned char *", self._tx_addr)
+            self._transferred_c = ffi.new("int *")
+            self._bulk_out = self._bulk_out_cffi
+
+        # Async TX ring: write_bytes submits and returns; the sync path above
+        # stays as the fallback when the async API is missing or fails to start
+        self._ring_xfers: list = []
+        self._ring_thread: Optional[threading.Thread] = None
+        if async_tx and _HAS_ASYNC:
+            try:
+                self._start_tx_ring()
+            except Exception:
+                self._stop_tx_ring()
+
+        # Outbound queue: write_bytes enqueues, a flusher thread joins whatever
+        # piled up into one bulk OUT (up to COALESCE_MAX_BYTES)
+        self._outq: collections.deque = collections.deque()
+        self._outq_event = threading.Event()
+        self._outq_error: Optional[str] = None
+        # frames lost in failed batches since the caller was last told
+        self._outq_failed = 0
+        self._outq_error_lock = threading.Lock()
+        self._flush_stop = threading.Event()
+        self._flush_deadline = 0.0
+        self._flush_thread: Optional[threading.Thread] = None
+        if batch_tx:
+            self._flush_thread = threading.Thread(target=self._flush_loop, daemon=True)
+            self._flush_thread.start()
+
+    def _start_tx_ring(self):
+        self._ring_free: "queue.Queue[int]" = queue.Queue()
+        self._ring_bufs: list = []  # (addr, heap buffer or None when DMA)
+        self._ring_error: Optional[str] = None
+        self._ring_stop = threading.Event()
+        self._ring_cb = libusb_transfer_cb_fn(self._on_tx_done)  # keep alive
+        self._submit = _libusb.libusb_submit_transfer
+        self._ring_submit_args = self._ring_xfers  # ctypes: the pointers themselves
+        for i in range(ASYNC_TX_TRANSFERS):
+            xfer = _libusb.libusb_alloc_transfer(0)
+            if not xfer:
+                raise LibusbError("libusb_alloc_transfer failed")
+            self._ring_xfers.append(xfer)
+            addr = _dev_mem_alloc(self.handle, TX_BUF_SIZE) if _dev_mem_alloc else None
+            heap = None
+            if not addr:
+                heap = (ctypes.c_ubyte * TX_BUF_SIZE)()
+                addr = ctypes.addressof(heap)
+            self._ring_bufs.append((addr, heap))
+            t = xfer.contents
+            t.dev_handle = self.handle.value
+            t.endpoint = self.eps.ep_out
+            t.type = LIBUSB_TRANSFER_TYPE_BULK
+            t.timeout = self.timeout_ms
+            t.callback = self._ring_cb
+            t.user_data = i
+            t.buffer = addr
+            self._ring_free.put(i)
+        if _CFFI is not None:
+            ffi, lib = _CFFI
+            self._submit = lib.libusb_submit_transfer
+            self._ring_submit_args = [
+                ffi.cast("struct libusb_transfer *", ctypes.addressof(x.contents))
+                for x in self._ring_xfers
+            ]
+        self._ring_thread = threading.Thread(target=self._ring_events, daemon=True)
+        self._ring_thread.start()
+
+    def _ring_events(self):
+        tv = timeval(0, 100_000)
+        while not self._ring_stop.is_set():
+            _libusb.libusb_handle_events_timeout_completed(self.ctx, ctypes.byref(tv), None)
+
+    def _on_tx_done(self, xfer_p):
+        # runs on the event thread, inside libusb_handle_events_*
+        t = xfer_p.contents
+        if t.status != LIBUSB_TRANSFER_COMPLETED or t.actual_length != t.length:
+            self._ring_error = f"bulk OUT transfer failed (status={t.status}, {t.actual_length}/{t.length})"
+        self._ring_free.put(t.user_data or 0)
+
+    def _stop_tx_ring(self):
+        xfers = self._ring_xfers
+        if not xfers:
+            return
+        if self._ring_thread is not None:
+            # let queued frames go out, then cancel whatever is still in flight
+            deadline = time.monotonic() + self.timeout_ms / 1000.0
+            while self._ring_free.qsize() < len(xfers) and time.monotonic() < deadline:
+                time.sleep(0.005)
+            if self._ring_free.qsize() < len(xfers):
+                for xfer in xfers:
+                    _libusb.libusb_cancel_transfer(xfer)  # NOT_FOUND if idle
+                deadline = time.monotonic() + 0.5
+                while self._ring_free.qsize() < len(xfers) and time.monotonic() < deadline:
+                    time.sleep(0.005)
+            self._ring_stop.set()
+            self._ring_thread.join(timeout=1.0)
+            self._ring_thread = None
+            if self._ring_free.qsize() < len(xfers):
+                # still owned by libusb; leaking beats freeing memory in use
+                self._ring_xfers = []
+                return
+        for xfer in xfers:
+            _libusb.libusb_free_transfer(xfer)
+        for addr, heap in self._ring_bufs:
+            if heap is None:
+                _dev_mem_free(self.handle, addr, TX_BUF_SIZE)
+        self._ring_bufs = []
+        self._ring_xfers = []
+
+    def _write_async(self, data: bytes):
+        err = self._ring_error
+        if err is not None:
+            # a completion failed after its write returned; report it on the next one
+            self._ring_error = None
+            raise LibusbError(err)
+        try:
+            i = self._ring_free.get(timeout=self.timeout_ms / 1000.0)
+        except queue.Empty:
+            raise LibusbError("bulk OUT ring full: no transfer completed in time") from None
+        n = len(data)
+        ctypes.memmove(self._ring_bufs[i][0], data, n)
+        self._ring_xfers[i].contents.length = n
+        rc = self._submit(self._ring_submit_args[i])
+        if rc < 0:
+            self._ring_free.put(i)
+            _check(rc, "libusb_submit_transfer failed")
+
+    def _flush_loop(self):
+        outq = self._outq
+        popleft = outq.popleft
+        event = self._outq_event
+        stop = self._flush_stop
+        while True:
+            event.wait()
+            event.clear()
+            while outq:
+                if stop.is_set() and time.monotonic() >= self._flush_deadline:
+                    # closing: refuse the rest rather than outlive close()
+                    outq.clear()
+                    break
+                data = popleft()
+                size = len(data)
+                frames = 1
+                if outq and size + len(outq[0]) <= COALESCE_MAX_BYTES:
+                    chunk = [data]
+                    while outq and size + len(outq[0]) <= COALESCE_MAX_BYTES:
+                        data = popleft()
+                        chunk.append(data)
+                        size += len(data)
+                    data = b"".join(chunk)
+                    frames = len(chunk)
+                try:
+                    self._send_now(data)
+                except Exception as exc:
+                    # every frame in the batch is lost, not just one
+                    with self._outq_error_lock:
+                        self._outq_failed += frames
+                        self._outq_error = str(exc)
+            if self._flush_stop.is_set():
+                return
+
+    def _stop_flusher(self) -> bool:
+        """Stop the flusher; False if it is still running (stuck in a write)."""
+        thread = self._flush_thread
+        if thread is None:
+            return True
+        # the flusher keeps draining until the deadline, then drops the rest;
+        # one write already in progress may still take up to timeout_ms
+        self._flush_deadline = time.monotonic() + FLUSH_STOP_DRAIN_S
+        self._flush_stop.set()
+        self._outq_event.set()
+        thread.join(timeout=FLUSH_STOP_DRAIN_S + self.timeout_ms / 1000.0 + 0.5)
+        self._flush_thread = None
+        return not thread.is_alive()
+
     def close(self):
         try:
-            if self.handle and self.eps:
-                _libusb.libusb_release_interface(self.handle, int(self.eps.interface_number))
+            stopped = self._stop_flusher()
+        except Exception:
+            stopped = False
+        if not stopped:
+            # a write outlived every libusb timeout; release anyway so the
+            # handle and context do not leak. Clearing self.handle first makes
+            # the flusher's next _send_now refuse instead of touching them
+            logging.warning("termux-usb flusher did not stop; releasing the device anyway")
+        try:
+            self._stop_tx_ring()
         except Exception:
             pass
+        h = self.handle
+        ctx = self.ctx
+        iface = self.eps.interface_number if self.eps else None
+        # idempotent: a second close() finds nothing left to release
+        self.handle = self.ctx = self.eps = None
         try:
-            if self.handle:
-                _libusb.libusb_close(self.handle)
+            if h:
+                if iface is not None:
+                    _libusb.libusb_release_interface(h, iface)
+                if getattr(self, "_tx_dma", False):
+                    self._tx_dma = False
+                    _dev_mem_free(h, self._tx_addr, self._tx_size)
+                _libusb.libusb_close(h)
         except Exception:
             pass
         try:
-            if self.ctx:
-                _libusb.libusb_exit(self.ctx)
+            if ctx:
+                _libusb.libusb_exit(ctx)
         except Exception:
             pass
 
     def write_ascii(self, s: str):
-        data = (s).encode("ascii")
-        buf = ctypes.create_string_buffer(data)
-        transferred = ctypes.c_int(0)
-        rc = _libusb.libusb_bulk_transfer(
-            self.handle,
-            ctypes.c_ubyte(self.eps.ep_out),
-            ctypes.cast(buf, ctypes.c_void_p),
-            len(data),
-            ctypes.byref(transferred),
-            ctypes.c_uint(self.timeout_ms),
+        # str convenience wrapper; hot callers build bytes and use write_bytes
+        self.write_bytes(s.encode("ascii"))
+
+    def write_bytes(self, data: bytes):
+        """Queue data for the flusher thread, or send it at once without one.
+
+        With the flusher, a return only means the data was queued: a bulk OUT
+        failure surfaces on the caller's next write_bytes call, which raises
+        LibusbQueuedWriteError (frames = earlier frames lost) and does not
+        queue its own data.
+        """
+        if self._flush_thread is None:
+            self._send_now(data)
+            return
+        if self._outq_error is not None:
+            with self._outq_error_lock:
+                err, frames = self._outq_error, self._outq_failed
+                self._outq_error = None
+                self._outq_failed = 0
+            raise LibusbQueuedWriteError(f"{frames} queued frame(s) not sent: {err}", frames)
+        if len(self._outq) >= OUTQ_MAX_FRAMES:
+            raise LibusbError("outbound queue full: device not draining")
+        self._outq.append(data)
+        self._outq_event.set()
+
+    def _send_now(self, data: bytes):
+        if not self.handle:
+            raise LibusbError("device closed")
+        n = len(data)
+        if n > self._tx_size:
+            for off in range(0, n, self._tx_size):
+                self._send_now(data[off : off + self._tx_size])
+            return
+        if self._ring_xfers:
+            self._write_async(data)
+            return
+        ctypes.memmove(self._tx_addr, data, n)
+        transferred = self._bulk_out(n)
+        if transferred != n:
+            raise LibusbError(f"short write: {transferred}/{n}")
+
+    def _bulk_out_ctypes(self, n: int) -> int:
+        rc = self._bulk(
+            self.handle, self._ep_out, self._tx_addr, n, self._transferred_ref, self._timeout_c
+        )
+        _check(rc, "bulk OUT transfer failed")
+        return self._transferred.value
+
+    def _bulk_out_cffi(self, n: int) -> int:
+        rc = self._bulk_c(
+            self._handle_c,
+            self.eps.ep_out,
+            self._tx_addr_c,
+            n,
+            self._transferred_c,
+            self.timeout_ms,
         )
         _check(rc, "bulk OUT transfer failed")
-        if transferred.value != len(data):
-            raise LibusbError(f"short write: {transferred.value}/{len(data)}")
+        return self._transferred_c[0]
 
     def init_slcan(self, bitrate_cmd: str = "S6"):
-        # minimal Lawicel init sequence
-        self.write_ascii("C\r")
-        self.write_ascii(f"{bitrate_cmd}\r")
-        self.write_ascii("O\r")
+        # minimal Lawicel init sequence; the firmware splits commands on CR,
+        # so one bulk OUT carries all three. Sent synchronously, bypassing the
+        # outbound queue, so a failed init raises here rather than later on
+        # some unrelated data frame
+        self._send_now(b"C\r" + bitrate_cmd.encode("ascii") + b"\rO\r")
+        self._wait_ring_idle()
+
+    def _wait_ring_idle(self):
+        """Block until every async TX transfer completed; raise if one failed."""
+        xfers = self._ring_xfers
+        if not xfers:
+            return
+        deadline = time.monotonic() + self.timeout_ms / 1000.0
+        while self._ring_free.qsize() < len(xfers):
+            if time.monotonic() >= deadline:
+                raise LibusbError("bulk OUT transfer did not complete in time")
+            time.sleep(0.002)
+        err = self._ring_error
+        if err is not None:
+            self._ring_error = None
+            raise LibusbError(err)
 
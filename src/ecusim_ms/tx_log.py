@@ -4,11 +4,27 @@ from __future__ import annotations
 
 import csv
 import json
+import math
+import queue
+import threading
+import time
 from pathlib import Path
-from typing import Dict
+from typing import Dict, Tuple
+
+# rows are flushed in batches: after this many, or once this much time passed
+FLUSH_EVERY_ROWS = 64
+FLUSH_EVERY_S = 0.5
+# rows waiting for the writer thread; the oldest are dropped beyond this
+QUEUE_MAX_ROWS = 4096
+# rows formatted and written per writer wake-up
+DRAIN_BATCH_ROWS = 128
+
+_STOP = object()
 
 
 class TxLogger:
+    """CSV TX log; write_line only enqueues, a writer thread formats and writes."""
+
     def __init__(self, path: Path):
         self.path = Path(path)
         self.path.parent.mkdir(parents=True, exist_ok=True)
@@ -17,19 +33,109 @@ class TxLogger:
         self._writer = csv.writer(self._file)
         if is_new:
             self._writer.writerow(["ts", "id", "dlc", "data_hex", "used_json"])
+        self._pending = 0
+        self._last_flush = time.monotonic()
+        # frame_id -> (signal names, %-template); the signal set per frame is
+        # fixed, so used_json only needs its values filled in
+        self._templates: Dict[int, Tuple[Tuple[str, ...], str]] = {}
+        self._q: queue.Queue = queue.Queue(maxsize=QUEUE_MAX_ROWS)
+        self.dropped = 0
+        self._thread = threading.Thread(target=self._drain, name="tx-log", daemon=True)
+        self._thread.start()
+
+    def _used_json(self, frame_id: int, used_subset: Dict[str, float]) -> str:
+        values = tuple(used_subset.values())
+        for value in values:
+            # repr matches json.dumps only for finite floats (and no bools)
+            if type(value) is not float or not math.isfinite(value):
+                return json.dumps(used_subset, separators=(",", ":"))
+        keys = tuple(used_subset)
+        entry = self._templates.get(frame_id)
+        if entry is None or entry[0] != keys:
+            body = ",".join(json.dumps(k).replace("%", "%%") + ":%r" for k in keys)
+            entry = (keys, "{" + body + "}")
+            self._templates[frame_id] = entry
+        return entry[1] % values
 
     def write_line(
         self, ts: float, frame_id: int, dlc: int, payload_hex: str, used_subset: Dict[str, float]
     ) -> None:
+        item = (ts, frame_id, dlc, payload_hex, used_subset)
         try:
-            used_json = json.dumps(used_subset, separators=(",", ":"))
-            self._writer.writerow([f"{ts:.3f}", hex(frame_id), dlc, payload_hex, used_json])
-            self._file.flush()
+            self._q.put_nowait(item)
+        except queue.Full:
+            # writer fell behind: drop the oldest row rather than block TX
+            try:
+                self._q.get_nowait()
+            except queue.Empty:
+                pass
+            self.dropped += 1
+            try:
+                self._q.put_nowait(item)
+            except queue.Full:
+                pass
+
+    def _write_rows(self, batch: list) -> None:
+        try:
+            self._writer.writerows(
+                [
+                    (f"{ts:.3f}", hex(frame_id), dlc, payload_hex, self._used_json(frame_id, used))
+                    for ts, frame_id, dlc, payload_hex, used in batch
+                ]
+            )
+            self._pending += len(batch)
         except Exception:
             return
 
-    def close(self) -> None:
+    def _flush(self) -> None:
         try:
-            self._file.close()
+            self._file.flush()
         except Exception:
-            return
+            pass
+        self._pending = 0
+        self._last_flush = time.monotonic()
+
+    def _drain(self) -> None:
+        get = self._q.get
+        get_nowait = self._q.get_nowait
+        stopping = False
+        try:
+            while not stopping:
+                try:
+                    item = get(timeout=FLUSH_EVERY_S)
+                except queue.Empty:
+                    if self._pending:
+                        self._flush()
+                    continue
+                batch = []
+                while True:
+                    if item is _STOP:
+                        stopping = True
+                        break
+                    batch.append(item)
+                    if len(batch) >= DRAIN_BATCH_ROWS:
+                        break
+                    try:
+                        item = get_nowait()
+                    except queue.Empty:
+                        break
+                if batch:
+                    self._write_rows(batch)
+                if (
+                    self._pending >= FLUSH_EVERY_ROWS
+                    or time.monotonic() - self._last_flush >= FLUSH_EVERY_S
+                ):
+                    self._flush()
+        finally:
+            try:
+                self._file.close()
+            except Exception:
+                pass
+
+    def close(self) -> None:
+        """Write out queued rows, then close the file."""
+        try:
+            self._q.put(_STOP, timeout=1.0)
+        except queue.Full:
+            pass
+        self._thread.join(timeout=2.0)
@@ -2,18 +2,20 @@
 
 from __future__ import annotations
 
-import json
+import functools
 import logging
 import math
+import os
+import queue
 import threading
 import time
 from dataclasses import dataclass
 from typing import Dict, List, Optional, Tuple
 
-from ecusim_ms import dbc_loader, models, paths, validate
+from ecusim_ms import dbc_loader, json_codec, models, paths, validate
 from ecusim_ms.control_io import load_control_safe
-from ecusim_ms.gui_control_writer import ControlWriter
-from ecusim_ms.ms_signals import MS_SIGNAL_LIST
+from ecusim_ms.gui_control_writer import ControlWriter, Debouncer
+from ecusim_ms.ms_signals import MS_SIGNAL_LIST, MS_SIGNAL_SET
 from ecusim_ms.runner_process import RunnerProcess
 from ecusim_ms.stop_flag import ensure_not_set
 
@@ -30,6 +32,56 @@ class SignalSchema:
     default_value: float
 
 
+# telemetry deltas: an unchanged row is resent only once its age drifts this
+# far from what the client extrapolates (last sent age + elapsed time)
+TELEMETRY_AGE_TOLERANCE_MS = 250.0
+
+# live slider updates land in memory at once; control.json is rewritten once
+# they pause for this long, and at least this often during a continuous drag
+UPDATE_WRITE_DELAY_S = 0.05
+UPDATE_WRITE_MAX_DELAY_S = 0.1
+
+# telemetry poll interval while the runner writes; it backs off one step per
+# TELEMETRY_BACKOFF_CYCLES unchanged polls up to the idle interval, which is
+# also used whenever the runner is stopped
+TELEMETRY_POLL_S = 0.5
+TELEMETRY_IDLE_POLL_S = 2.0
+TELEMETRY_BACKOFF_CYCLES = 4
+
+# SLCAN device detection enumerates serial ports; reuse a result for this long
+DEVICE_STATUS_TTL_S = 2.0
+
+# each web UI event stream holds a server worker thread for its lifetime; past
+# this many, subscribe() refuses and the page polls instead
+MAX_SUBSCRIBERS = 4
+
+
+def _available_modes() -> Tuple[str, ...]:
+    preferred = ["idle", "pull", "loop", "koeo", "custom", "silent"]
+    modes = list(getattr(validate, "VALID_MODES", [])) or preferred
+    ordered = [m for m in preferred if m in modes]
+    for m in modes:
+        if m not in ordered:
+            ordered.append(m)
+    return tuple(ordered)
+
+
+# VALID_MODES is fixed at import, so the UI mode order is computed once
+_AVAILABLE_MODES = _available_modes()
+
+
+def _event_body(payload: object) -> str:
+    """Serialize an event stream payload to a JSON str."""
+    return json_codec.dumps(payload).decode("utf-8")
+
+
+@functools.lru_cache(maxsize=512)
+def _format_raw_hex(raw: str) -> str:
+    """'0a1b2c' -> '0A 1B 2C'; payloads repeat across snapshots, so cache them."""
+    clean = "".join(raw.split()).upper()
+    return " ".join(clean[i : i + 2] for i in range(0, len(clean), 2))
+
+
 class UiBackend:
     """Backend API used by UI (no direct CAN send)."""
 
@@ -39,6 +91,7 @@ class UiBackend:
         self._telemetry_path = paths.telemetry_path()
         self._stop_path = paths.stop_flag_path()
         self._writer = ControlWriter(self._control_path)
+        self._update_debouncer = Debouncer()
         self._runner = RunnerProcess()
 
         self._backend = cfg.backend or "pythoncan"
@@ -51,17 +104,21 @@ class UiBackend:
         self._hz = float(cfg.hz)
         self._mode = cfg.mode or "idle"
         self._custom_values = dict(cfg.custom or models.DEFAULT_SIGNAL_VALUES)
-        self._custom_enabled = {k: True for k in MS_SIGNAL_LIST}
+        self._custom_enabled = dict.fromkeys(MS_SIGNAL_LIST, True)
         self._custom_period_ms = {
             k: (1000.0 / self._hz if self._hz else 0.0) for k in MS_SIGNAL_LIST
         }
-        self._schemas = self._load_signal_schema()
-        self._schema_by_name = {schema.name: schema for schema in self._schemas}
         self._last_error: Optional[str] = None
+        # why the DBC-derived schema could not be loaded; reported in status
+        self._schema_error: Optional[str] = None
         self._warned_ranges: set[str] = set()
+        # apply errors come from concurrent web request threads, parse errors
+        # from the poll thread; both are bumped and read under this lock
+        self._error_count_lock = threading.Lock()
         self._apply_error_count = 0
         self._parse_error_count = 0
-        self._telemetry_lock = threading.Lock()
+        # replaced whole by the poll thread and never mutated after publishing,
+        # so readers take the reference without a lock
         self._telemetry_snapshot: Dict[str, object] = {
             "timestamp_ms": 0,
             "running": False,
@@ -69,23 +126,191 @@ class UiBackend:
             "signals": [],
         }
         self._telemetry_last_error: Optional[str] = None
+        self._device_status_cache: Optional[Tuple[bool, bool, str, Optional[str]]] = None
+        self._device_status_expiry = 0.0
+        # (st_mtime_ns, st_size) of the last telemetry file parsed, and its data
+        self._tel_stat_key: Optional[Tuple[int, int]] = None
+        self._tel_cached_raw: Dict[str, object] = {}
+        # _parse_telemetry_raw result and the raw dict it was computed from
+        self._tel_parsed_src: Optional[Dict[str, object]] = None
+        self._tel_parsed: tuple = ()
+        # push subscribers (web UI event streams): each gets (event, json body)
+        # tuples, sent only when the serialized state changed
+        self._subscribers: List[queue.Queue] = []
+        self._subscribers_lock = threading.Lock()
+        self._last_event_body: Dict[str, str] = {}
+        # last telemetry snapshot broadcast; serialized only when a slow
+        # subscriber has to be resynced from a full frame
+        self._last_telemetry: Optional[dict] = None
+        # telemetry as the subscribers last saw it: key -> ((value, raw_fmt,
+        # enabled), age_ms, monotonic time sent); deltas are computed against it
+        self._telemetry_view: Dict[str, tuple] = {}
+        self._telemetry_header: Optional[dict] = None
+        # the DBC-derived schema (cached properties below) loads in the
+        # background so construction does not wait on the DBC parse
+        threading.Thread(target=self._warm_schema, daemon=True).start()
+        # set to cut a backed-off telemetry sleep short (runner start/stop)
+        self._telemetry_wake = threading.Event()
         self._telemetry_thread = threading.Thread(target=self._telemetry_poll_loop, daemon=True)
         self._telemetry_thread.start()
 
+    @functools.cached_property
+    def _schemas(self) -> List[SignalSchema]:
+        # cached_property does not cache exceptions: remember the failure so
+        # readers such as the telemetry poll do not re-parse the DBC each time
+        if self._schema_error is not None:
+            raise RuntimeError(self._schema_error)
+        try:
+            return self._load_signal_schema()
+        except Exception as exc:
+            self._schema_error = f"Loading the signal schema failed: {exc}"
+            raise
+
+    @functools.cached_property
+    def _schema_by_name(self) -> Dict[str, SignalSchema]:
+        return {schema.name: schema for schema in self._schemas}
+
+    @functools.cached_property
+    def _signal_ranges(self) -> Dict[str, Tuple[float, float, float, float]]:
+        """(min, max, step, default) per signal, normalized once."""
+        return {schema.name: self._normalize_range(schema) for schema in self._schemas}
+
+    @functools.cached_property
+    def _signal_templates(self) -> Dict[str, Dict[str, object]]:
+        return self._build_signal_templates()
+
+    def _warm_schema(self) -> None:
+        try:
+            self._signal_templates
+            self._signal_ranges
+        except Exception:
+            logging.exception("Loading the signal schema failed")
+
     def get_available_modes(self) -> list[str]:
-        preferred = ["idle", "pull", "loop", "koeo", "custom", "silent"]
-        modes = list(getattr(validate, "VALID_MODES", [])) or preferred
-        ordered = [m for m in preferred if m in modes]
-        for m in modes:
-            if m not in ordered:
-                ordered.append(m)
-        return ordered
+        return list(_AVAILABLE_MODES)
+
+    def subscribe(self) -> Optional[queue.Queue]:
+        """Register a push subscriber, primed with the current status and telemetry.
+
+        Returns None when MAX_SUBSCRIBERS streams are already open.
+        """
+        if len(self._subscribers) >= MAX_SUBSCRIBERS:
+            return None
+        sub: queue.Queue = queue.Queue(maxsize=16)
+        sub.put(("status", _event_body(self.get_status())))
+        sub.put(("telemetry", _event_body(self.get_telemetry())))
+        with self._subscribers_lock:
+            if len(self._subscribers) >= MAX_SUBSCRIBERS:
+                return None
+            if not self._subscribers:
+                # nobody received deltas meanwhile, so the view is stale
+                self._telemetry_view = {}
+                self._telemetry_header = None
+            self._subscribers.append(sub)
+        return sub
+
+    def unsubscribe(self, sub: queue.Queue) -> None:
+        with self._subscribers_lock:
+            try:
+                self._subscribers.remove(sub)
+            except ValueError:
+                pass
+
+    def broadcast(self, event: str, payload: dict) -> None:
+        """Send payload to all subscribers if it differs from the last one sent."""
+        if not self._subscribers:
+            return
+        body = _event_body(payload)
+        if self._last_event_body.get(event) == body:
+            return
+        self._last_event_body[event] = body
+        self._send_event(event, body)
+
+    def broadcast_telemetry(self, snapshot: dict) -> None:
+        """Send subscribers a telemetry_delta frame: changed and gone rows plus the header.
+
+        The snapshot is kept (unserialized) as the "telemetry" frame that
+        resynced subscribers start from.
+        """
+        if not self._subscribers:
+            return
+        now = time.monotonic()
+        view = self._telemetry_view
+        rows = snapshot.get("signals") or []
+        changed = []
+        current = set()
+        for row in rows:
+            key = row.get("key")
+            current.add(key)
+            state = (row.get("value"), row.get("raw_fmt"), row.get("enabled"))
+            age = row.get("age_ms")
+            prev = view.get(key)
+            if prev is not None and prev[0] == state:
+                if age is None or prev[1] is None:
+                    if age == prev[1]:
+                        continue
+                elif abs(age - (prev[1] + (now - prev[2]) * 1000.0)) <= TELEMETRY_AGE_TOLERANCE_MS:
+                    continue
+            view[key] = (state, age, now)
+            changed.append(row)
+        gone = [key for key in view if key not in current]
+        for key in gone:
+            del view[key]
+        header = {k: v for k, v in snapshot.items() if k != "signals"}
+        header_changed = header != self._telemetry_header
+        self._telemetry_header = header
+        self._last_telemetry = snapshot
+        if not (changed or gone or header_changed):
+            return
+        delta = dict(header)
+        delta["changed"] = changed
+        delta["gone"] = gone
+        self._send_event("telemetry_delta", _event_body(delta))
+
+    def _resync_frames(self) -> List[Tuple[str, str]]:
+        """The latest full frame of each event type, for a subscriber that fell behind."""
+        frames = list(self._last_event_body.items())
+        snapshot = self._last_telemetry
+        if snapshot is not None:
+            frames.append(("telemetry", _event_body(snapshot)))
+        return frames
+
+    def _send_event(self, event: str, body: str) -> None:
+        with self._subscribers_lock:
+            subscribers = list(self._subscribers)
+        resync: Optional[List[Tuple[str, str]]] = None
+        for sub in subscribers:
+            try:
+                sub.put_nowait((event, body))
+            except queue.Full:
+                # slow client: replace its backlog with the latest full frame
+                # of each event type (deltas then continue from those)
+                try:
+                    while True:
+                        sub.get_nowait()
+                except queue.Empty:
+                    pass
+                if resync is None:
+                    resync = self._resync_frames()
+                for item in resync:
+                    try:
+                        sub.put_nowait(item)
+                    except queue.Full:
+                        break
+
+    def _publish_status(self) -> None:
+        if self._subscribers:
+            try:
+                self.broadcast("status", self.get_status())
+            except Exception:
+                pass
 
     def set_mode(self, mode: str) -> None:
-        if mode not in self.get_available_modes():
+        if mode not in _AVAILABLE_MODES:
             raise ValueError(f"Unsupported mode: {mode}")
         self._mode = mode
         self._write_control()
+        self._publish_status()
 
     def get_custom_signals_schema(self) -> list[SignalSchema]:
         return list(self._schemas)
@@ -93,7 +318,7 @@ class UiBackend:
     def get_custom_signals_schema_ui(self) -> list[dict]:
         payload: list[dict] = []
         for schema in self._schemas:
-            min_v, max_v, step_v, default_v = self._normalize_range(schema)
+            min_v, max_v, step_v, default_v = self._signal_ranges[schema.name]
             payload.append(
                 {
                     "name": schema.name,
@@ -112,40 +337,33 @@ class UiBackend:
     def apply_custom_payload(self, updates) -> Tuple[bool, Optional[str]]:
         items = self._normalize_updates(updates)
         if not items:
-            self._apply_error_count += 1
-            return False, "No updates provided"
+            return self._apply_failed("No updates provided")
         sanitized: Dict[str, dict] = {}
+        ranges = self._signal_ranges
         for name, update in items.items():
             schema = self._schema_by_name.get(name)
             if schema is None:
-                self._apply_error_count += 1
-                return False, f"Unknown signal: {name}"
+                return self._apply_failed(f"Unknown signal: {name}")
             if "value" not in update:
-                self._apply_error_count += 1
-                return False, f"Missing value for {name}"
+                return self._apply_failed(f"Missing value for {name}")
             try:
                 value = float(update.get("value"))
             except Exception:
-                self._apply_error_count += 1
-                return False, f"Invalid value for {name}"
+                return self._apply_failed(f"Invalid value for {name}")
             if not math.isfinite(value):
-                self._apply_error_count += 1
-                return False, f"Non-finite value for {name}"
-            min_v, max_v, _, _ = self._normalize_range(schema)
+                return self._apply_failed(f"Non-finite value for {name}")
+            min_v, max_v, _, _ = ranges[name]
             if value < min_v or value > max_v:
-                self._apply_error_count += 1
-                return False, f"Value out of range for {name} ({min_v}..{max_v})"
+                return self._apply_failed(f"Value out of range for {name} ({min_v}..{max_v})")
             enabled = update.get("enabled")
             period_ms = update.get("period_ms")
             if period_ms is not None:
                 try:
                     period_ms = float(period_ms)
                 except Exception:
-                    self._apply_error_count += 1
-                    return False, f"Invalid period for {name}"
+                    return self._apply_failed(f"Invalid period for {name}")
                 if period_ms <= 0:
-                    self._apply_error_count += 1
-                    return False, f"Invalid period for {name}"
+                    return self._apply_failed(f"Invalid period for {name}")
             sanitized[name] = {
                 "value": value,
                 "enabled": bool(enabled) if enabled is not None else None,
@@ -155,14 +373,22 @@ class UiBackend:
             self.apply_custom_signal_updates(sanitized)
         except Exception as exc:
             self._last_error = str(exc)
-            self._apply_error_count += 1
-            return False, str(exc)
+            return self._apply_failed(str(exc))
         return True, None
 
+    def _apply_failed(self, error: str) -> Tuple[bool, Optional[str]]:
+        with self._error_count_lock:
+            self._apply_error_count += 1
+        return False, error
+
+    def _count_parse_error(self) -> None:
+        with self._error_count_lock:
+            self._parse_error_count += 1
+
     def apply_custom_signal_updates(self, updates) -> None:
         items = self._normalize_updates(updates)
         for name, update in items.items():
-            if name not in MS_SIGNAL_LIST:
+            if name not in MS_SIGNAL_SET:
                 continue
             if "enabled" in update and update["enabled"] is not None:
                 self._custom_enabled[name] = bool(update["enabled"])
@@ -176,10 +402,15 @@ class UiBackend:
                     self._custom_values[name] = float(update["value"])
                 except Exception:
                     pass
-        self._write_control()
+        # the deferred write builds its payload when it fires, so it always
+        # carries the newest state and never undoes a later direct write
+        self._update_debouncer.schedule(
+            UPDATE_WRITE_DELAY_S, self._write_control, max_delay_s=UPDATE_WRITE_MAX_DELAY_S
+        )
 
     def start(self) -> None:
         ensure_not_set(self._stop_path)
+        self._device_status_expiry = 0.0
         self._write_control()
         try:
             self._runner.start(
@@ -192,17 +423,26 @@ class UiBackend:
         except Exception as exc:
             self._last_error = str(exc)
             raise
+        finally:
+            self._telemetry_wake.set()
+            self._publish_status()
 
     def stop(self) -> None:
+        self._device_status_expiry = 0.0
         try:
             self._runner.stop()
         except Exception as exc:
             self._last_error = str(exc)
             raise
+        finally:
+            self._telemetry_wake.set()
+            self._publish_status()
 
     def get_status(self) -> dict:
         device_present, device_ready, port, device_error = self._device_status()
-        last_error = device_error or self._last_error or self._telemetry_last_error
+        last_error = (
+            device_error or self._schema_error or self._last_error or self._telemetry_last_error
+        )
         return {
             "running": self._runner.is_running(),
             "backend": self._backend,
@@ -216,16 +456,16 @@ class UiBackend:
         }
 
     def get_telemetry(self) -> dict:
-        with self._telemetry_lock:
-            return dict(self._telemetry_snapshot)
+        """Latest telemetry snapshot; shared with other readers, so do not mutate it."""
+        return self._telemetry_snapshot
 
     def _control_payload(self) -> dict:
-        custom_payload: Dict[str, object] = {}
-        for key in MS_SIGNAL_LIST:
-            if self._custom_enabled.get(key, True):
-                custom_payload[key] = self._custom_values.get(key, 0.0)
-            else:
-                custom_payload[key] = None
+        enabled_get = self._custom_enabled.get
+        values_get = self._custom_values.get
+        custom_payload: Dict[str, object] = {
+            key: values_get(key, 0.0) if enabled_get(key, True) else None
+            for key in MS_SIGNAL_LIST
+        }
         return {
             "profile_id": "ms_simplified",
             "backend": self._backend,
@@ -248,13 +488,11 @@ class UiBackend:
         if updates is None:
             return {}
         if isinstance(updates, dict):
-            result = {}
-            for name, update in updates.items():
-                if isinstance(update, dict):
-                    result[name] = update
-                else:
-                    result[name] = {"value": update}
-            return result
+            # {name: value} from slider changes, or {name: {...}} full updates
+            return {
+                name: update if isinstance(update, dict) else {"value": update}
+                for name, update in updates.items()
+            }
         if isinstance(updates, list):
             result = {}
             for item in updates:
@@ -303,76 +541,124 @@ class UiBackend:
         return float(min_v), float(max_v), float(step_v), float(default_v)
 
     def _telemetry_poll_loop(self) -> None:
+        idle_cycles = 0
         while True:
+            running = False
+            stat_key = self._tel_stat_key
             try:
                 snapshot = self._build_telemetry_snapshot()
-                with self._telemetry_lock:
-                    self._telemetry_snapshot = snapshot
+                self._telemetry_snapshot = snapshot
                 last_error = snapshot.get("last_error")
                 if isinstance(last_error, str) and last_error:
                     self._telemetry_last_error = last_error
+                if self._subscribers:
+                    self.broadcast_telemetry(snapshot)
+                    self.broadcast("status", self.get_status())
+                running = bool(snapshot.get("running"))
             except Exception:
                 pass
-            time.sleep(0.5)
+            idle_cycles = 0 if self._tel_stat_key != stat_key else idle_cycles + 1
+            if running:
+                interval = min(
+                    TELEMETRY_IDLE_POLL_S,
+                    TELEMETRY_POLL_S * (1 + idle_cycles // TELEMETRY_BACKOFF_CYCLES),
+                )
+            else:
+                interval = TELEMETRY_IDLE_POLL_S
+            if self._telemetry_wake.wait(interval):
+                self._telemetry_wake.clear()
+                idle_cycles = 0
 
     def _read_telemetry_file(self) -> Dict[str, object]:
+        """Parsed telemetry file; reused as long as its mtime and size are unchanged.
+
+        The returned dict may be shared between polls, so it must not be mutated.
+        """
         try:
             path = self._telemetry_path
-            if not path.exists():
+            try:
+                st = os.stat(path)
+            except FileNotFoundError:
+                self._tel_stat_key = None
+                self._tel_cached_raw = {}
+                return {}
+            stat_key = (st.st_mtime_ns, st.st_size)
+            if stat_key == self._tel_stat_key:
+                return self._tel_cached_raw
+            try:
+                data = json_codec.loads(path.read_bytes())
+            except FileNotFoundError:
                 return {}
-            with path.open("r", encoding="utf-8") as handle:
-                data = json.load(handle)
             if isinstance(data, dict):
+                self._tel_stat_key = stat_key
+                self._tel_cached_raw = data
                 return data
-            self._parse_error_count += 1
+            self._count_parse_error()
             return {}
         except Exception:
-            self._parse_error_count += 1
+            self._count_parse_error()
             return {}
 
-    def _build_telemetry_snapshot(self) -> Dict[str, object]:
-        raw = self._read_telemetry_file()
-        now_ms = int(time.time() * 1000)
-        ts = raw.get("ts") if isinstance(raw, dict) else None
+    def _build_signal_templates(self) -> Dict[str, Dict[str, object]]:
+        """Per-signal telemetry rows with the static fields filled in, copied on every poll."""
+        templates: Dict[str, Dict[str, object]] = {}
+        for name in MS_SIGNAL_LIST:
+            schema = self._schema_by_name.get(name)
+            frame_id = schema.frame_id if schema else None
+            templates[name] = {
+                "name": name,
+                "key": name,
+                "arbitration_id": f"0x{frame_id:X}" if frame_id is not None else None,
+                "value": None,
+                "raw": None,
+                "raw_fmt": "",
+                "period_ms": int(schema.default_period_ms) if schema else None,
+                "enabled": True,
+                "last_sent_ms": None,
+                "age_ms": None,
+            }
+        return templates
+
+    def _parse_telemetry_raw(self, raw: Dict[str, object]) -> tuple:
+        """File-derived parts of a snapshot: (ts, tx_errors, last_error, rows).
+
+        rows holds (name, partial row, last_sent_ms) per signal; the partial row
+        has every field except enabled and age_ms, which change between polls.
+        """
+        ts = raw.get("ts")
         try:
             ts_val = float(ts) if ts is not None else 0.0
         except Exception:
             ts_val = 0.0
-        timestamp_ms = int(ts_val * 1000) if ts_val > 0 else now_ms
-        counters = raw.get("counters") if isinstance(raw, dict) else None
+        counters = raw.get("counters")
         if not isinstance(counters, dict):
             counters = {}
-        tx_errors = 0
         try:
             tx_errors = int(counters.get("tx_errors", 0))
         except Exception:
             tx_errors = 0
-        # error_count_total = CAN tx_errors (send failures) + apply_errors (invalid custom payloads)
-        device_present, device_ready, _port, _device_error = self._device_status()
-        errors_device = 0 if (device_present and device_ready) else 1
-        errors_send = tx_errors
-        errors_apply = int(self._apply_error_count)
-        errors_parse = int(self._parse_error_count)
-        error_count_total = errors_send + errors_apply + errors_parse + errors_device
-        signals_raw = raw.get("signals") if isinstance(raw, dict) else None
+        signals_raw = raw.get("signals")
         if not isinstance(signals_raw, dict):
             signals_raw = {}
-        signal_meta = raw.get("signal_meta") if isinstance(raw, dict) else None
+        signal_meta = raw.get("signal_meta")
         if not isinstance(signal_meta, dict):
             signal_meta = {}
-        last_error = raw.get("last_error") if isinstance(raw, dict) else None
+        last_error = raw.get("last_error")
         if not isinstance(last_error, str) or not last_error:
             last_error = None
 
-        items: List[Dict[str, object]] = []
-        for name in MS_SIGNAL_LIST:
-            schema = self._schema_by_name.get(name)
-            frame_id = schema.frame_id if schema else None
-            try:
-                value = float(signals_raw.get(name)) if name in signals_raw else None
-            except Exception:
-                value = None
-            meta = signal_meta.get(name) if isinstance(signal_meta, dict) else None
+        rows = []
+        signal_get = signals_raw.get
+        meta_get = signal_meta.get
+        # templates are keyed in MS_SIGNAL_LIST order and carry the static fields
+        for name, template in self._signal_templates.items():
+            value = signal_get(name)
+            if value is not None:
+                try:
+                    value = float(value)
+                except Exception:
+                    value = None
+            meta = meta_get(name)
             if not isinstance(meta, dict):
                 meta = {}
             last_sent_ms = meta.get("last_sent_ms")
@@ -380,37 +666,51 @@ class UiBackend:
                 last_sent_ms = int(last_sent_ms) if last_sent_ms else None
             except Exception:
                 last_sent_ms = None
-            raw_payload = meta.get("raw") if isinstance(meta, dict) else None
-            age_ms = None
+            raw_payload = meta.get("raw")
+            row = template.copy()
+            row["value"] = value
+            row["raw"] = raw_payload
+            if isinstance(raw_payload, str):
+                row["raw_fmt"] = _format_raw_hex(raw_payload)
+            row["last_sent_ms"] = last_sent_ms
+            rows.append((name, row, last_sent_ms))
+        return ts_val, tx_errors, last_error, rows
+
+    def _build_telemetry_snapshot(self) -> Dict[str, object]:
+        raw = self._read_telemetry_file()
+        if raw is not self._tel_parsed_src:
+            # the reader hands back the same dict while the file is unchanged
+            self._tel_parsed = self._parse_telemetry_raw(raw)
+            self._tel_parsed_src = raw
+        ts_val, tx_errors, last_error, rows = self._tel_parsed
+        now_ms = int(time.time() * 1000)
+        timestamp_ms = int(ts_val * 1000) if ts_val > 0 else now_ms
+        # error_count_total = CAN tx_errors (send failures) + apply_errors (invalid custom payloads)
+        device_present, device_ready, _port, _device_error = self._device_status()
+        errors_device = 0 if (device_present and device_ready) else 1
+        errors_send = tx_errors
+        with self._error_count_lock:
+            errors_apply = self._apply_error_count
+            errors_parse = self._parse_error_count
+        error_count_total = errors_send + errors_apply + errors_parse + errors_device
+
+        items: List[Dict[str, object]] = []
+        enabled_get = self._custom_enabled.get
+        for name, row, last_sent_ms in rows:
+            item = row.copy()
+            item["enabled"] = bool(enabled_get(name, True))
             if last_sent_ms:
-                age_ms = max(0, now_ms - last_sent_ms)
+                item["age_ms"] = max(0, now_ms - last_sent_ms)
             else:
-                age_ms = max(0, now_ms - timestamp_ms)
-            items.append(
-                {
-                    "name": name,
-                    "key": name,
-                    "arbitration_id": f"0x{frame_id:X}" if frame_id is not None else None,
-                    "value": value,
-                    "raw": raw_payload,
-                    "period_ms": int(schema.default_period_ms) if schema else None,
-                    "enabled": bool(self._custom_enabled.get(name, True)),
-                    "last_sent_ms": last_sent_ms,
-                    "age_ms": age_ms,
-                }
-            )
+                item["age_ms"] = max(0, now_ms - timestamp_ms)
+            items.append(item)
 
         def _sort_key(item: Dict[str, object]) -> tuple:
-            enabled = 0 if item.get("enabled") else 1
-            age_val = item.get("age_ms")
-            try:
-                age_val = float(age_val)
-            except Exception:
-                age_val = 1e12
-            name = item.get("key") or item.get("name") or ""
-            return (enabled, age_val, str(name))
+            # rows built above always carry a bool enabled, an int age_ms and a str key
+            return (not item["enabled"], item["age_ms"], item["key"])
 
-        items = sorted(items, key=_sort_key)[:20]
+        items.sort(key=_sort_key)
+        del items[20:]
 
         return {
             "timestamp_ms": timestamp_ms,
@@ -428,7 +728,15 @@ class UiBackend:
         if self._backend != "slcan":
             port = self._port or "auto"
             return True, True, port, None
-
+        now = time.monotonic()
+        if self._device_status_cache is not None and now < self._device_status_expiry:
+            return self._device_status_cache
+        status = self._probe_slcan_device()
+        self._device_status_cache = status
+        self._device_status_expiry = now + DEVICE_STATUS_TTL_S
+        return status
+
+    def _probe_slcan_device(self) -> Tuple[bool, bool, str, Optional[str]]:
         port = self._port or self._auto_detect_port()
         if not port:
             return False, False, "auto", "No SLCAN device detected"
@@ -4,40 +4,52 @@ from __future__ import annotations
 
 import ctypes
 import os
+import time
 from pathlib import Path
-from typing import Optional
+from typing import Dict, Optional, Tuple
 
 import usb.backend.libusb1 as libusb1
 import usb.core
 import usb.util
 
+# None: not resolved yet; False: resolution failed (message in _BACKEND_ERROR)
 _BACKEND = None
+_BACKEND_ERROR = ""
 _ORIG_FIND = None
 
+# (vid, pid) -> (monotonic time, Device or None); repeated probes within the
+# TTL reuse the result instead of re-enumerating the bus
+_DEV_CACHE: Dict[Tuple[int, int], Tuple[float, object]] = {}
+_DEV_CACHE_TTL_S = 2.0
+
 
 def ensure_pyusb_libusb_backend(verbose: bool = False):
     """Ensure a libusb backend is available (required for gs_usb on Windows).
 
-    Raises RuntimeError if the backend cannot be loaded.
+    Raises RuntimeError if the backend cannot be loaded. A failure is
+    remembered, so later calls raise the same error without retrying.
     """
-    global _BACKEND, _ORIG_FIND
+    global _BACKEND, _BACKEND_ERROR, _ORIG_FIND
+    if _BACKEND is False:
+        raise RuntimeError(_BACKEND_ERROR)
     if _BACKEND is not None:
         return _BACKEND
 
-    libusb_pkg = None
     try:
-        import libusb_package
-
-        libusb_pkg = libusb_package
+        import libusb_package as libusb_pkg
     except ImportError as exc:  # pragma: no cover - optional dependency
-        raise RuntimeError("libusb-package not installed; required for gs_usb on Windows") from exc
+        _BACKEND = False
+        _BACKEND_ERROR = "libusb-package not installed; required for gs_usb on Windows"
+        raise RuntimeError(_BACKEND_ERROR) from exc
+
+    get_lib = getattr(libusb_pkg, "get_library_path", None)
+    get_be = getattr(libusb_pkg, "get_libusb1_backend", None)
 
     dll_path: Optional[str] = None
-    if hasattr(libusb_pkg, "get_library_path"):
-        try:
-            dll_path = libusb_pkg.get_library_path()
-        except Exception:
-            dll_path = None
+    try:
+        dll_path = get_lib() if get_lib else None
+    except Exception:
+        dll_path = None
 
     if dll_path:
         try:
@@ -53,9 +65,9 @@ def ensure_pyusb_libusb_backend(verbose: bool = False):
             pass
 
     backend = libusb1.get_backend(find_library=(lambda _: dll_path) if dll_path else None)
-    if backend is None and hasattr(libusb_pkg, "get_libusb1_backend"):
+    if backend is None and get_be is not None:
         try:
-            backend = libusb_pkg.get_libusb1_backend()
+            backend = get_be()
         except Exception:
             backend = None
     if backend is None:
@@ -65,6 +77,8 @@ def ensure_pyusb_libusb_backend(verbose: bool = False):
         msg = "libusb backend not available. "
         msg += f"libusb_package.get_library_path={dll_path}. "
         msg += "Suggest: reinstall libusb-package wheel; check 64-bit Python; ensure VC runtime if needed."
+        _BACKEND = False
+        _BACKEND_ERROR = msg
         raise RuntimeError(msg)
 
     if _ORIG_FIND is None:
@@ -88,6 +102,17 @@ def ensure_backend(verbose: bool = False):
     return ensure_pyusb_libusb_backend(verbose=verbose)
 
 
+def _find_device(vid: int, pid: int, backend) -> Optional[usb.core.Device]:
+    key = (vid, pid)
+    now = time.monotonic()
+    hit = _DEV_CACHE.get(key)
+    if hit is not None and now - hit[0] < _DEV_CACHE_TTL_S:
+        return hit[1]
+    dev = usb.core.find(idVendor=vid, idProduct=pid, backend=backend)
+    _DEV_CACHE[key] = (now, dev)
+    return dev
+
+
 def hard_reset_gsusb(vid: int = 0x1D50, pid: int = 0x606F, verbose: bool = False) -> bool:
     """Best-effort USB-level reset of a gs_usb-compatible device via libusb."""
     try:
@@ -95,9 +120,11 @@ def hard_reset_gsusb(vid: int = 0x1D50, pid: int = 0x606F, verbose: bool = False
     except Exception as exc:
         raise RuntimeError(f"Cannot reset device: backend unavailable ({exc})") from exc
 
-    dev = usb.core.find(idVendor=vid, idProduct=pid, backend=backend)
+    dev = _find_device(vid, pid, backend)
     if dev is None:
         raise RuntimeError(f"gs_usb device not found vid=0x{vid:04x} pid=0x{pid:04x}")
+    # the device re-enumerates after a reset, so the cached handle goes stale
+    _DEV_CACHE.pop((vid, pid), None)
     try:
         dev.reset()
         if verbose:
@@ -114,7 +141,7 @@ def probe_gsusb(vid: int, pid: int, verbose: bool = False) -> bool:
     except Exception:
         return False
 
-    dev: Optional[usb.core.Device] = usb.core.find(idVendor=vid, idProduct=pid, backend=backend)
+    dev: Optional[usb.core.Device] = _find_device(vid, pid, backend)
     if verbose:
         print(f"probe_gsusb vid=0x{vid:04x} pid=0x{pid:04x} -> {bool(dev)}")  # noqa: T201
     return dev is not None
@@ -130,7 +157,7 @@ def probe_any_gsusb(verbose: bool = False) -> bool:
     VID = 0x1D50
     PID = 0x606F
     try:
-        dev = usb.core.find(idVendor=VID, idProduct=PID, backend=backend)
+        dev = _find_device(VID, PID, backend)
         found = dev is not None
         if verbose:
             print(f"probe_any_gsusb candleLight 0x1d50:0x606f -> {found}")  # noqa: T201
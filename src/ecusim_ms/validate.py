@@ -3,19 +3,52 @@
 from __future__ import annotations
 
 import logging
-from typing import Iterable
+from dataclasses import fields, is_dataclass
+from typing import Dict, FrozenSet, Iterable, Tuple
 
 from ecusim_ms import dbc_loader
 from ecusim_ms.ms_signals import MS_SIGNAL_LIST
 
-VALID_MODES = {"loop", "koeo", "idle", "pull", "custom", "silent"}
+VALID_MODES = frozenset({"loop", "koeo", "idle", "pull", "custom", "silent"})
 
+_ALLOWED_CONTROL_KEYS = frozenset(
+    {
+        "profile_id",
+        "backend",
+        "iface",
+        "channel",
+        "port",
+        "serial_baud",
+        "skip_bitrate",
+        "bitrate",
+        "hz",
+        "mode",
+        "custom",
+        "hard_test",
+    }
+)
 
-def _warn_unknown_keys(name: str, provided: Iterable[str], allowed: Iterable[str]) -> None:
-    allowed_set = set(allowed)
-    unknown = [k for k in provided if k not in allowed_set]
+# id(db) -> (db, signal names); holding db keeps its id from being reused
+_PRESENT_CACHE: Dict[int, Tuple[object, FrozenSet[str]]] = {}
+_PRESENT_CACHE_MAX = 4
+
+
+def _present_signals(db) -> FrozenSet[str]:
+    """Signal names defined anywhere in db, computed once per loaded database."""
+    hit = _PRESENT_CACHE.get(id(db))
+    if hit is not None and hit[0] is db:
+        return hit[1]
+    present = frozenset(sig.name for msg in db.messages for sig in msg.signals)
+    if len(_PRESENT_CACHE) >= _PRESENT_CACHE_MAX:
+        _PRESENT_CACHE.clear()
+    _PRESENT_CACHE[id(db)] = (db, present)
+    return present
+
+
+def _warn_unknown_keys(name: str, provided: Iterable[str], allowed: FrozenSet[str]) -> None:
+    unknown = set(provided) - allowed
     if unknown:
-        logging.warning("%s contains unknown keys: %s", name, unknown)
+        logging.warning("%s contains unknown keys: %s", name, sorted(unknown))
 
 
 def validate_startup(db, control_cfg) -> str:
@@ -24,7 +57,7 @@ def validate_startup(db, control_cfg) -> str:
     dbc_loader.extract_signal_info(db)  # ensure DBC is parsable
 
     # check signals exist
-    present = {sig.name for msg in db.messages for sig in msg.signals}
+    present = _present_signals(db)
     missing = [k for k in MS_SIGNAL_LIST if k not in present]
     if missing:
         raise RuntimeError(f"DBC missing expected signals: {missing}")
@@ -35,24 +68,11 @@ def validate_startup(db, control_cfg) -> str:
         mode = "loop"
 
     # warn on unknown top-level keys
-    if hasattr(control_cfg, "__dict__"):
-        _warn_unknown_keys(
-            "control.json",
-            control_cfg.__dict__.keys(),
-            [
-                "profile_id",
-                "backend",
-                "iface",
-                "channel",
-                "port",
-                "serial_baud",
-                "skip_bitrate",
-                "bitrate",
-                "hz",
-                "mode",
-                "custom",
-                "hard_test",
-            ],
-        )
+    if is_dataclass(control_cfg):
+        # slotted dataclass: no __dict__, so list its fields instead
+        names = [f.name for f in fields(control_cfg)]
+        _warn_unknown_keys("control.json", names, _ALLOWED_CONTROL_KEYS)
+    elif hasattr(control_cfg, "__dict__"):
+        _warn_unknown_keys("control.json", control_cfg.__dict__.keys(), _ALLOWED_CONTROL_KEYS)
 
     return mode
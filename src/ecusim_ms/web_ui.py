@@ -2,6 +2,9 @@
 
 from __future__ import annotations
 
+import gzip
+import hashlib
+import json
 import os
 import sys
 
@@ -9,15 +12,28 @@ import sys
 if __name__ == "__main__" and __package__ is None:
     sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
 
-from flask import Flask, jsonify, render_template_string, request
+from flask import Flask, Response, request, stream_with_context
 
-from ecusim_ms.ui_backend import UiBackend
+from ecusim_ms.ui_backend import MAX_SUBSCRIBERS, UiBackend
+import queue
 import threading
 import time
 
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional dependency
+    orjson = None
+
 app = Flask(__name__)
 backend = UiBackend()
 
+# comment frame sent on idle event streams so proxies keep them open; writing
+# it is also how a stream notices a gone client and frees its worker thread
+SSE_HEARTBEAT_S = 3.0
+
+# waitress workers: one per possible event stream plus these for plain requests
+SERVER_SPARE_THREADS = 4
+
 
 INDEX_HTML = """
 <!doctype html>
@@ -49,7 +65,7 @@ INDEX_HTML = """
       .card { background: var(--panel); border: 1px solid #222a35; border-radius: 10px; padding: 10px; margin-bottom: 10px; }
       .meta { color: var(--muted); font-size: 12px; }
       .signals { display: grid; gap: 8px; }
-      .signal { display: grid; gap: 6px; }
+      .signal { display: grid; gap: 6px; content-visibility: auto; contain-intrinsic-size: auto 150px; }
       .signal-controls { display: grid; gap: 8px; }
       .range-row { display: grid; grid-template-columns: 1fr 96px; gap: 8px; align-items: center; }
       .range-row input[type="range"] { width: 100%; }
@@ -178,6 +194,7 @@ INDEX_HTML = """
       let signals = [];
       const currentValues = {};
       const schemaByKey = {};
+      const EMPTY_SCHEMA = Object.freeze({});
       let applyTimer = null;
       const modeEl = document.getElementById("mode");
       const filterEl = document.getElementById("filter");
@@ -280,15 +297,6 @@ INDEX_HTML = """
         return text.slice(0, Math.max(0, maxLen - ellipsis.length)) + ellipsis;
       }
 
-      function formatRaw(raw) {
-        if (!raw) {
-          return "";
-        }
-        const clean = String(raw).replace(/\\s+/g, "").toUpperCase();
-        const parts = clean.match(/.{1,2}/g) || [];
-        return parts.join(" ");
-      }
-
       function formatHumanValue(value) {
         if (typeof value === "number" && Number.isFinite(value)) {
           const abs = Math.abs(value);
@@ -303,170 +311,349 @@ INDEX_HTML = """
         return "";
       }
 
-      function renderTelemetryRows(items) {
+      // small LRU over a one-argument formatter: Map keeps insertion order, so
+      // a hit is re-inserted and the first key is the least recently used
+      function lruMemo(fn, cap = 128) {
+        const cache = new Map();
+        return x => {
+          if (cache.has(x)) {
+            const hit = cache.get(x);
+            cache.delete(x);
+            cache.set(x, hit);
+            return hit;
+          }
+          const v = fn(x);
+          cache.set(x, v);
+          if (cache.size > cap) {
+            cache.delete(cache.keys().next().value);
+          }
+          return v;
+        };
+      }
+
+      // telemetry values mostly repeat tick over tick
+      const memoFormatHuman = lruMemo(formatHumanValue);
+      const memoTruncate16 = lruMemo(text => truncateText(text, 16));
+
+      // key -> {row, nameEl, valueEl, ageEl, last}; rows are built once and
+      // only their text is updated on later refreshes; last holds what was
+      // rendered so unchanged rows skip formatting entirely
+      const telemetryRowCache = new Map();
+      let telemetryHeaderEl = null;
+
+      function setText(el, text) {
+        if (el.textContent !== text) {
+          el.textContent = text;
+        }
+      }
+
+      function clearTelemetryRows() {
         telemetryTableEl.innerHTML = "";
-        const header = document.createElement("div");
-        header.className = "live-row live-header-row";
-        header.innerHTML = "<div class='live-cell'>Signal</div><div class='live-cell'>Value</div><div class='live-cell'>Age ms</div>";
-        telemetryTableEl.appendChild(header);
+        telemetryRowCache.clear();
+        telemetryHeaderEl = null;
+      }
+
+      function buildTelemetryRow() {
+        const line = document.createElement("div");
+        line.className = "live-row";
+        const nameEl = document.createElement("div");
+        nameEl.className = "live-cell";
+        const valueEl = document.createElement("div");
+        valueEl.className = "live-cell";
+        const ageEl = document.createElement("div");
+        ageEl.className = "live-cell";
+        line.appendChild(nameEl);
+        line.appendChild(valueEl);
+        line.appendChild(ageEl);
+        return {row: line, nameEl: nameEl, valueEl: valueEl, ageEl: ageEl};
+      }
+
+      function renderTelemetryRows(items) {
+        if (!telemetryHeaderEl) {
+          telemetryHeaderEl = document.createElement("div");
+          telemetryHeaderEl.className = "live-row live-header-row";
+          telemetryHeaderEl.innerHTML = "<div class='live-cell'>Signal</div><div class='live-cell'>Value</div><div class='live-cell'>Age ms</div>";
+          telemetryTableEl.appendChild(telemetryHeaderEl);
+        }
         const rows = (items || []).slice(0, 20);
+        const seen = new Set();
+        let prev = telemetryHeaderEl;
         for (const row of rows) {
-          const line = document.createElement("div");
-          line.className = "live-row";
-          const name = document.createElement("div");
-          name.className = "live-cell";
           const key = row.key || row.name || "";
-          const schema = schemaByKey[key] || {};
+          const cacheKey = seen.has(key) ? `${key}#${seen.size}` : key;
+          seen.add(cacheKey);
+          let entry = telemetryRowCache.get(cacheKey);
+          if (!entry) {
+            entry = buildTelemetryRow();
+            telemetryRowCache.set(cacheKey, entry);
+          }
+          if (prev.nextSibling !== entry.row) {
+            telemetryTableEl.insertBefore(entry.row, prev.nextSibling);
+          }
+          prev = entry.row;
+          const schema = schemaByKey[key] || EMPTY_SCHEMA;
           const unit = schema.unit || "";
-          name.textContent = row.name || key || "";
-          const value = document.createElement("div");
-          value.className = "live-cell";
-          const humanValue = formatHumanValue(row.value);
+          const last = entry.last;
+          const age = row.age_ms;
+          if (last && last.v === row.value && last.r === row.raw_fmt && last.u === unit &&
+              (last.a === age || Math.abs(last.a - age) < 50)) {
+            continue;
+          }
+          entry.last = {v: row.value, r: row.raw_fmt, u: unit, a: age};
+          setText(entry.nameEl, row.name || key || "");
+          const humanValue = memoFormatHuman(row.value);
           const humanFull = humanValue ? (unit ? `${humanValue} ${unit}` : humanValue) : "--";
-          const rawText = formatRaw(row.raw);
+          const rawText = row.raw_fmt || "";  // formatted once on the backend
           const display = unit && humanValue ? humanFull : (rawText || "--");
-          value.textContent = truncateText(display, 16);
-          const age = document.createElement("div");
-          age.className = "live-cell";
-          age.textContent = Number.isFinite(row.age_ms) ? String(Math.round(row.age_ms)) : "--";
-          line.appendChild(name);
-          line.appendChild(value);
-          line.appendChild(age);
+          setText(entry.valueEl, memoTruncate16(display));
+          setText(entry.ageEl, Number.isFinite(age) ? String(Math.round(age)) : "--");
           const idText = row.arbitration_id || "n/a";
           const tooltipRaw = rawText || "--";
-          line.title = `ID: ${idText} | Value: ${humanFull} | Raw: ${tooltipRaw}`;
-          telemetryTableEl.appendChild(line);
+          const title = `ID: ${idText} | Value: ${humanFull} | Raw: ${tooltipRaw}`;
+          if (entry.row.title !== title) {
+            entry.row.title = title;
+          }
+        }
+        for (const [key, entry] of telemetryRowCache) {
+          if (!seen.has(key)) {
+            entry.row.remove();
+            telemetryRowCache.delete(key);
+          }
+        }
+      }
+
+      // rows as last pushed, keyed by signal; _at stamps arrival so ages can be
+      // extrapolated for rows the server leaves out of a delta
+      const telemetryState = new Map();
+
+      function telemetryRowsFromState() {
+        const now = performance.now();
+        const rows = [];
+        for (const row of telemetryState.values()) {
+          const age = Number.isFinite(row.age_ms) ? row.age_ms + (now - row._at) : row.age_ms;
+          rows.push(Object.assign({}, row, {age_ms: age}));
+        }
+        const ageOf = r => (Number.isFinite(r.age_ms) ? r.age_ms : 1e12);
+        rows.sort((a, b) =>
+          (a.enabled ? 0 : 1) - (b.enabled ? 0 : 1) ||
+          ageOf(a) - ageOf(b) ||
+          String(a.key || "").localeCompare(String(b.key || "")));
+        return rows.slice(0, 20);
+      }
+
+      function storeTelemetryRows(rows) {
+        const now = performance.now();
+        for (const row of rows || []) {
+          row._at = now;
+          telemetryState.set(row.key || row.name || "", row);
+        }
+      }
+
+      function applyTelemetry(t) {
+        telemetryState.clear();
+        storeTelemetryRows(t.signals);
+        applyTelemetryHeader(t);
+      }
+
+      function applyTelemetryDelta(d) {
+        for (const key of d.gone || []) {
+          telemetryState.delete(key);
         }
+        storeTelemetryRows(d.changed);
+        applyTelemetryHeader(d);
+      }
+
+      function applyTelemetryHeader(t) {
+        telemetryUnavailableEl.style.display = "none";
+        const total = t.error_count_total ?? 0;
+        const send = t.errors_send ?? 0;
+        const apply = t.errors_apply ?? 0;
+        const parse = t.errors_parse ?? 0;
+        const device = t.errors_device ?? 0;
+        telemetryErrorsEl.textContent = `Errors: ${total} (send ${send}, apply ${apply}, parse ${parse}, device ${device})`;
+        renderTelemetryRows(telemetryRowsFromState());
+        setBadge(telemetryConnectedEl, "Connected", "ok");
+        const ready = lastStatus ? !!lastStatus.device_ready : false;
+        const running = lastStatus ? !!lastStatus.running : !!t.running;
+        setBadge(telemetryReadyEl, "Ready", ready ? "ok" : "warn");
+        setBadge(telemetryRunningEl, "Running", running ? "ok" : "idle");
+      }
+
+      function applyTelemetryError() {
+        telemetryState.clear();
+        clearTelemetryRows();
+        telemetryUnavailableEl.style.display = "";
+        telemetryErrorsEl.textContent = "Errors: --";
+        setBadge(telemetryConnectedEl, "Disconnected", "bad");
+        setBadge(telemetryReadyEl, "Ready", "idle");
+        setBadge(telemetryRunningEl, "Running", "idle");
       }
 
       function refreshTelemetry() {
-        fetchJson("/api/telemetry")
-          .then(t => {
-            telemetryUnavailableEl.style.display = "none";
-            const total = t.error_count_total ?? 0;
-            const send = t.errors_send ?? 0;
-            const apply = t.errors_apply ?? 0;
-            const parse = t.errors_parse ?? 0;
-            const device = t.errors_device ?? 0;
-            telemetryErrorsEl.textContent = `Errors: ${total} (send ${send}, apply ${apply}, parse ${parse}, device ${device})`;
-            renderTelemetryRows(t.signals || []);
-            setBadge(telemetryConnectedEl, "Connected", "ok");
-            const ready = lastStatus ? !!lastStatus.device_ready : false;
-            const running = lastStatus ? !!lastStatus.running : !!t.running;
-            setBadge(telemetryReadyEl, "Ready", ready ? "ok" : "warn");
-            setBadge(telemetryRunningEl, "Running", running ? "ok" : "idle");
-          })
-          .catch(() => {
-            telemetryTableEl.innerHTML = "";
-            telemetryUnavailableEl.style.display = "";
-            telemetryErrorsEl.textContent = "Errors: --";
-            setBadge(telemetryConnectedEl, "Disconnected", "bad");
-            setBadge(telemetryReadyEl, "Ready", "idle");
-            setBadge(telemetryRunningEl, "Running", "idle");
-          });
+        fetchJson("/api/telemetry").then(applyTelemetry).catch(applyTelemetryError);
       }
 
-      function renderSignals() {
-        const q = (filterEl.value || "").toLowerCase();
-        signalsEl.innerHTML = "";
-        let items = signals.filter(s => !q || s.name.toLowerCase().includes(q));
-        for (const s of items) {
-          const card = document.createElement("div");
-          card.className = "card signal";
-          const key = s.key || s.name;
-          const title = document.createElement("div");
-          title.textContent = s.name || key;
-          const meta = document.createElement("div");
-          meta.className = "meta";
-          const unitText = s.unit ? ` | Unit: ${s.unit}` : "";
-          meta.textContent = `CAN ID: ${s.frame_id ? "0x"+s.frame_id.toString(16).toUpperCase() : "n/a"} | Period: ${s.default_period_ms?.toFixed(1) || "n/a"} ms${unitText}`;
-
-          const controls = document.createElement("div");
-          controls.className = "signal-controls";
-
-          const minVal = Number.isFinite(s.min) ? s.min : 0;
-          const maxVal = Number.isFinite(s.max) ? s.max : 100;
-          const stepVal = Number.isFinite(s.step) ? s.step : 1;
-          const stored = currentValues[key];
-          let value = stored && Number.isFinite(stored.value) ? stored.value : s.default;
-          if (!Number.isFinite(value)) {
-            value = minVal;
-          }
-          if (value < minVal) value = minVal;
-          if (value > maxVal) value = maxVal;
-          const enabled = stored ? !!stored.enabled : true;
-          currentValues[key] = {value: value, enabled: enabled};
-
-          const rangeRow = document.createElement("div");
-          rangeRow.className = "range-row";
-          const slider = document.createElement("input");
-          slider.type = "range";
-          slider.min = String(minVal);
-          slider.max = String(maxVal);
-          slider.step = String(stepVal);
-          slider.value = String(value);
-          const number = document.createElement("input");
-          number.type = "number";
-          number.min = String(minVal);
-          number.max = String(maxVal);
-          number.step = String(stepVal);
-          number.value = String(value);
-          rangeRow.appendChild(slider);
-          rangeRow.appendChild(number);
-
-          const toggleRow = document.createElement("div");
-          toggleRow.className = "toggle-row";
-          const toggle = document.createElement("input");
-          toggle.type = "checkbox";
-          toggle.checked = enabled;
-          toggle.disabled = controlsDisabled;
-          const toggleLabel = document.createElement("span");
-          toggleLabel.textContent = "Enable";
-          toggleRow.appendChild(toggle);
-          toggleRow.appendChild(toggleLabel);
-
-          function pushValue(rawVal) {
-            if (!Number.isFinite(rawVal)) {
-              return;
-            }
-            let nextVal = rawVal;
-            if (nextVal < minVal) nextVal = minVal;
-            if (nextVal > maxVal) nextVal = maxVal;
-            slider.value = String(nextVal);
-            number.value = String(nextVal);
-            currentValues[key] = {value: nextVal, enabled: toggle.checked};
-            submitUpdate(key, nextVal, toggle.checked);
+      // key -> {card, slider, number, toggle, name}; cards are built once, the
+      // filter only toggles their display so sliders keep focus mid-drag
+      const signalCardCache = new Map();
+
+      function buildSignalCard(s, key) {
+        const card = document.createElement("div");
+        card.className = "card signal";
+        const title = document.createElement("div");
+        title.textContent = s.name || key;
+        const meta = document.createElement("div");
+        meta.className = "meta";
+        const unitText = s.unit ? ` | Unit: ${s.unit}` : "";
+        meta.textContent = `CAN ID: ${s.frame_id ? "0x"+s.frame_id.toString(16).toUpperCase() : "n/a"} | Period: ${s.default_period_ms?.toFixed(1) || "n/a"} ms${unitText}`;
+
+        const controls = document.createElement("div");
+        controls.className = "signal-controls";
+
+        const minVal = Number.isFinite(s.min) ? s.min : 0;
+        const maxVal = Number.isFinite(s.max) ? s.max : 100;
+        const stepVal = Number.isFinite(s.step) ? s.step : 1;
+        const stored = currentValues[key];
+        let value = stored && Number.isFinite(stored.value) ? stored.value : s.default;
+        if (!Number.isFinite(value)) {
+          value = minVal;
+        }
+        if (value < minVal) value = minVal;
+        if (value > maxVal) value = maxVal;
+        const enabled = stored ? !!stored.enabled : true;
+        currentValues[key] = {value: value, enabled: enabled};
+
+        const rangeRow = document.createElement("div");
+        rangeRow.className = "range-row";
+        const slider = document.createElement("input");
+        slider.type = "range";
+        slider.min = String(minVal);
+        slider.max = String(maxVal);
+        slider.step = String(stepVal);
+        slider.value = String(value);
+        const number = document.createElement("input");
+        number.type = "number";
+        number.min = String(minVal);
+        number.max = String(maxVal);
+        number.step = String(stepVal);
+        number.value = String(value);
+        rangeRow.appendChild(slider);
+        rangeRow.appendChild(number);
+
+        const toggleRow = document.createElement("div");
+        toggleRow.className = "toggle-row";
+        const toggle = document.createElement("input");
+        toggle.type = "checkbox";
+        toggle.checked = enabled;
+        toggle.disabled = controlsDisabled;
+        const toggleLabel = document.createElement("span");
+        toggleLabel.textContent = "Enable";
+        toggleRow.appendChild(toggle);
+        toggleRow.appendChild(toggleLabel);
+
+        function pushValue(rawVal) {
+          if (!Number.isFinite(rawVal)) {
+            return;
           }
+          let nextVal = rawVal;
+          if (nextVal < minVal) nextVal = minVal;
+          if (nextVal > maxVal) nextVal = maxVal;
+          slider.value = String(nextVal);
+          number.value = String(nextVal);
+          currentValues[key] = {value: nextVal, enabled: toggle.checked};
+          submitUpdate(key, nextVal, toggle.checked);
+        }
 
-          slider.addEventListener("input", () => pushValue(parseFloat(slider.value)));
-          number.addEventListener("input", () => pushValue(parseFloat(number.value)));
-          toggle.addEventListener("change", () => {
-            const enabled = toggle.checked;
-            slider.disabled = controlsDisabled || !enabled;
-            number.disabled = controlsDisabled || !enabled;
-            currentValues[key] = {value: parseFloat(number.value), enabled: enabled};
-            submitUpdate(key, parseFloat(number.value), enabled);
-          });
-
+        slider.addEventListener("input", () => pushValue(parseFloat(slider.value)));
+        number.addEventListener("input", () => pushValue(parseFloat(number.value)));
+        toggle.addEventListener("change", () => {
+          const enabled = toggle.checked;
           slider.disabled = controlsDisabled || !enabled;
           number.disabled = controlsDisabled || !enabled;
+          currentValues[key] = {value: parseFloat(number.value), enabled: enabled};
+          submitUpdate(key, parseFloat(number.value), enabled);
+        });
+
+        slider.disabled = controlsDisabled || !enabled;
+        number.disabled = controlsDisabled || !enabled;
 
-          controls.appendChild(rangeRow);
-          controls.appendChild(toggleRow);
+        controls.appendChild(rangeRow);
+        controls.appendChild(toggleRow);
 
-          card.appendChild(title);
-          card.appendChild(meta);
-          card.appendChild(controls);
-          signalsEl.appendChild(card);
+        card.appendChild(title);
+        card.appendChild(meta);
+        card.appendChild(controls);
+        return {card: card, slider: slider, number: number, toggle: toggle, name: (s.name || "").toLowerCase()};
+      }
+
+      function renderSignals() {
+        const q = (filterEl.value || "").toLowerCase();
+        const seen = new Set();
+        for (const s of signals) {
+          const key = s.key || s.name;
+          let entry = signalCardCache.get(key);
+          if (!entry) {
+            entry = buildSignalCard(s, key);
+            signalCardCache.set(key, entry);
+            signalsEl.appendChild(entry.card);
+          }
+          seen.add(key);
+          const display = !q || entry.name.includes(q) ? "" : "none";
+          if (entry.card.style.display !== display) {
+            entry.card.style.display = display;
+          }
+          entry.toggle.disabled = controlsDisabled;
+          entry.slider.disabled = controlsDisabled || !entry.toggle.checked;
+          entry.number.disabled = controlsDisabled || !entry.toggle.checked;
+        }
+        for (const [key, entry] of signalCardCache) {
+          if (!seen.has(key)) {
+            entry.card.remove();
+            signalCardCache.delete(key);
+          }
         }
       }
 
-      function submitUpdate(name, value, enabled) {
+      // a slider drag fires "input" per pixel: merge changes per key, collect
+      // them once per animation frame and POST at most every UPDATE_MIN_MS,
+      // with a trailing flush so the final value always goes out
+      const UPDATE_MIN_MS = 120;
+      const pendingUpdates = new Map();
+      let rafScheduled = false;
+      let debounceTimer = null;
+      let lastUpdatePost = 0;
+
+      function flushUpdates() {
+        rafScheduled = false;
+        if (!pendingUpdates.size) {
+          return;
+        }
+        const wait = UPDATE_MIN_MS - (Date.now() - lastUpdatePost);
+        if (wait > 0) {
+          if (!debounceTimer) {
+            debounceTimer = setTimeout(() => {
+              debounceTimer = null;
+              flushUpdates();
+            }, wait);
+          }
+          return;
+        }
+        const body = Object.fromEntries(pendingUpdates);
+        pendingUpdates.clear();
+        lastUpdatePost = Date.now();
         fetchJson("/api/updates", {
           method: "POST",
           headers: {"Content-Type": "application/json"},
-          body: JSON.stringify({[name]: {value: value, enabled: enabled}})
-        }).then(refreshStatus);
+          body: JSON.stringify(body)
+        }).catch(() => {});
+      }
+
+      function submitUpdate(name, value, enabled) {
+        pendingUpdates.set(name, {value: value, enabled: enabled});
+        if (!rafScheduled) {
+          rafScheduled = true;
+          requestAnimationFrame(flushUpdates);
+        }
       }
 
       function showApplyStatus(message, ok) {
@@ -525,73 +712,75 @@ INDEX_HTML = """
           });
       }
 
+      function applyStatus(s) {
+        if (controlsDisabled) {
+          setControlsDisabled(false);
+        }
+        connectionMessageEl.textContent = "";
+        lastStatus = s;
+        const running = !!s.running;
+        lastRunning = running;
+        const statusText = running ? "running" : "stopped";
+        statusEl.textContent = `Status: ${statusText} | backend=${s.backend} port=${s.port} bitrate=${s.bitrate}`;
+        badgeEl.className = `badge ${running ? "badge-running" : "badge-stopped"}`;
+        badgeEl.textContent = running ? "● RUNNING" : "● STOPPED";
+        const devicePresent = !!s.device_present;
+        const deviceReady = !!s.device_ready;
+        if (!devicePresent) {
+          deviceBadgeEl.className = "badge badge-not-detected";
+          deviceBadgeEl.textContent = "USB: NOT DETECTED";
+        } else if (!deviceReady) {
+          deviceBadgeEl.className = "badge badge-not-ready";
+          deviceBadgeEl.textContent = "USB: DETECTED / NOT READY";
+        } else {
+          deviceBadgeEl.className = "badge badge-ready";
+          deviceBadgeEl.textContent = "USB: READY";
+        }
+        deviceMetaEl.textContent = `Backend: ${s.backend} | Port: ${s.port}`;
+        deviceErrorEl.textContent = s.last_error ? String(s.last_error) : "";
+        const canStart = !running && deviceReady;
+        startBtn.disabled = !canStart;
+        stopBtn.disabled = !running;
+        startBtn.classList.toggle("btn-disabled", !canStart);
+        stopBtn.classList.toggle("btn-disabled", !running);
+        const hotApply = s.hot_apply_supported !== false;
+        if (running && !hotApply) {
+          applyBtn.disabled = true;
+          applyRestartBtn.style.display = "";
+          applyRestartBtn.disabled = !deviceReady;
+          applyNoteEl.textContent = "Requires restart";
+          applyNoteEl.className = "apply-note apply-note-warn";
+        } else {
+          applyBtn.disabled = false;
+          applyRestartBtn.style.display = "none";
+          applyNoteEl.textContent = "";
+          applyNoteEl.className = "apply-note";
+        }
+      }
+
+      function applyStatusError() {
+        setControlsDisabled(true);
+        connectionMessageEl.textContent = "Backend disconnected";
+        statusEl.textContent = "Status: disconnected";
+        badgeEl.className = "badge badge-disconnected";
+        badgeEl.textContent = "● DISCONNECTED";
+        deviceBadgeEl.className = "badge badge-disconnected";
+        deviceBadgeEl.textContent = "USB: DISCONNECTED";
+        deviceMetaEl.textContent = "Backend: -- | Port: --";
+        deviceErrorEl.textContent = "";
+        startBtn.disabled = true;
+        stopBtn.disabled = true;
+        applyBtn.disabled = true;
+        applyRestartBtn.disabled = true;
+        applyRestartBtn.style.display = "none";
+        applyNoteEl.textContent = "";
+        applyNoteEl.className = "apply-note";
+        startBtn.classList.add("btn-disabled");
+        stopBtn.classList.add("btn-disabled");
+      }
+
       function refreshStatus() {
-        fetchJson("/api/status")
-          .then(s => {
-            if (controlsDisabled) {
-              setControlsDisabled(false);
-            }
-            connectionMessageEl.textContent = "";
-            lastStatus = s;
-            const running = !!s.running;
-            lastRunning = running;
-            const statusText = running ? "running" : "stopped";
-            statusEl.textContent = `Status: ${statusText} | backend=${s.backend} port=${s.port} bitrate=${s.bitrate}`;
-            badgeEl.className = `badge ${running ? "badge-running" : "badge-stopped"}`;
-            badgeEl.textContent = running ? "● RUNNING" : "● STOPPED";
-            const devicePresent = !!s.device_present;
-            const deviceReady = !!s.device_ready;
-            if (!devicePresent) {
-              deviceBadgeEl.className = "badge badge-not-detected";
-              deviceBadgeEl.textContent = "USB: NOT DETECTED";
-            } else if (!deviceReady) {
-              deviceBadgeEl.className = "badge badge-not-ready";
-              deviceBadgeEl.textContent = "USB: DETECTED / NOT READY";
-            } else {
-              deviceBadgeEl.className = "badge badge-ready";
-              deviceBadgeEl.textContent = "USB: READY";
-            }
-            deviceMetaEl.textContent = `Backend: ${s.backend} | Port: ${s.port}`;
-            deviceErrorEl.textContent = s.last_error ? String(s.last_error) : "";
-            const canStart = !running && deviceReady;
-            startBtn.disabled = !canStart;
-            stopBtn.disabled = !running;
-            startBtn.classList.toggle("btn-disabled", !canStart);
-            stopBtn.classList.toggle("btn-disabled", !running);
-            const hotApply = s.hot_apply_supported !== false;
-            if (running && !hotApply) {
-              applyBtn.disabled = true;
-              applyRestartBtn.style.display = "";
-              applyRestartBtn.disabled = !deviceReady;
-              applyNoteEl.textContent = "Requires restart";
-              applyNoteEl.className = "apply-note apply-note-warn";
-            } else {
-              applyBtn.disabled = false;
-              applyRestartBtn.style.display = "none";
-              applyNoteEl.textContent = "";
-              applyNoteEl.className = "apply-note";
-            }
-          })
-          .catch(() => {
-            setControlsDisabled(true);
-            connectionMessageEl.textContent = "Backend disconnected";
-            statusEl.textContent = "Status: disconnected";
-            badgeEl.className = "badge badge-disconnected";
-            badgeEl.textContent = "● DISCONNECTED";
-            deviceBadgeEl.className = "badge badge-disconnected";
-            deviceBadgeEl.textContent = "USB: DISCONNECTED";
-            deviceMetaEl.textContent = "Backend: -- | Port: --";
-            deviceErrorEl.textContent = "";
-            startBtn.disabled = true;
-            stopBtn.disabled = true;
-            applyBtn.disabled = true;
-            applyRestartBtn.disabled = true;
-            applyRestartBtn.style.display = "none";
-            applyNoteEl.textContent = "";
-            applyNoteEl.className = "apply-note";
-            startBtn.classList.add("btn-disabled");
-            stopBtn.classList.add("btn-disabled");
-          });
+        fetchJson("/api/status").then(applyStatus).catch(applyStatusError);
       }
 
       fetchJson("/api/modes").then(modes => {
@@ -608,7 +797,7 @@ INDEX_HTML = """
           method: "POST",
           headers: {"Content-Type": "application/json"},
           body: JSON.stringify({mode: modeEl.value})
-        }).then(refreshStatus);
+        }).catch(() => {});  // the status push (or next poll) reflects the new mode
       });
       filterEl.addEventListener("input", renderSignals);
       applyBtn.addEventListener("click", () => applyAll(false));
@@ -659,24 +848,111 @@ INDEX_HTML = """
         }
         renderSignals();
       });
-      refreshStatus();
-      refreshTelemetry();
-      setInterval(refreshStatus, 1000);
-      setInterval(refreshTelemetry, 1000);
+      let polling = false;
+      function startPolling() {
+        if (polling) return;
+        polling = true;
+        refreshStatus();
+        refreshTelemetry();
+        setInterval(refreshStatus, 1000);
+        setInterval(refreshTelemetry, 1000);
+      }
+      if (window.EventSource) {
+        // the server pushes status/telemetry on change; primed on (re)connect
+        const events = new EventSource("/api/events");
+        events.addEventListener("status", e => applyStatus(JSON.parse(e.data)));
+        events.addEventListener("telemetry", e => applyTelemetry(JSON.parse(e.data)));
+        events.addEventListener("telemetry_delta", e => applyTelemetryDelta(JSON.parse(e.data)));
+        events.onerror = () => {
+          if (events.readyState === EventSource.CLOSED) {
+            // refused (e.g. 503 when the server is at its stream limit)
+            startPolling();
+            return;
+          }
+          applyStatusError();
+          applyTelemetryError();
+        };
+      } else {
+        startPolling();
+      }
     </script>
   </body>
 </html>
 """
 
 
+# The page has no template variables: encode and compress it once, and let
+# browsers revalidate it by ETag instead of re-downloading
+_INDEX_BYTES = INDEX_HTML.encode("utf-8")
+_INDEX_GZ = gzip.compress(_INDEX_BYTES, 9, mtime=0)
+_INDEX_ETAG = hashlib.blake2b(_INDEX_BYTES, digest_size=8).hexdigest()
+
+
+def _dumps(obj) -> bytes:
+    """Compact JSON bytes; orjson when installed."""
+    if orjson is not None:
+        try:
+            return orjson.dumps(obj)
+        except Exception:
+            pass  # e.g. non-str keys; the stdlib path handles those
+    return json.dumps(obj, separators=(",", ":")).encode("utf-8")
+
+
+def _json(obj) -> Response:
+    return Response(_dumps(obj), mimetype="application/json")
+
+
+# the common acknowledgement, encoded once
+_OK_BODY = _dumps({"ok": True})
+
+
+def _ok() -> Response:
+    return Response(_OK_BODY, mimetype="application/json")
+
+
+# key -> (monotonic time, encoded body); concurrent GETs within the TTL (several
+# tabs, poll fallback) share one backend call and one encode
+_GET_CACHE_TTL_S = 0.2
+_get_cache: dict = {}
+_get_cache_lock = threading.Lock()
+
+
+def _cached_json(key: str, fn) -> Response:
+    with _get_cache_lock:
+        now = time.monotonic()
+        hit = _get_cache.get(key)
+        if hit is not None and now - hit[0] < _GET_CACHE_TTL_S:
+            body = hit[1]
+        else:
+            body = _dumps(fn())
+            _get_cache[key] = (now, body)
+    return Response(body, mimetype="application/json")
+
+
+def _invalidate_status() -> None:
+    # actions that change status must not be answered from a stale entry
+    with _get_cache_lock:
+        _get_cache.pop("status", None)
+
+
 @app.get("/")
 def index():
-    return render_template_string(INDEX_HTML)
+    if request.if_none_match.contains(_INDEX_ETAG):
+        resp = Response(status=304)
+    elif request.accept_encodings["gzip"]:
+        resp = Response(_INDEX_GZ, mimetype="text/html")
+        resp.headers["Content-Encoding"] = "gzip"
+    else:
+        resp = Response(_INDEX_BYTES, mimetype="text/html")
+    resp.set_etag(_INDEX_ETAG)
+    resp.headers["Cache-Control"] = "public, max-age=300"
+    resp.headers["Vary"] = "Accept-Encoding"
+    return resp
 
 
 @app.get("/api/modes")
 def api_modes():
-    return jsonify(backend.get_available_modes())
+    return _json(backend.get_available_modes())
 
 
 @app.post("/api/mode")
@@ -685,24 +961,25 @@ def api_mode():
     mode = payload.get("mode")
     if mode:
         backend.set_mode(str(mode))
-    return jsonify({"ok": True})
+        _invalidate_status()
+    return _ok()
 
 
 @app.get("/api/signals")
 def api_signals():
-    return jsonify(backend.get_custom_signals_schema_ui())
+    return _json(backend.get_custom_signals_schema_ui())
 
 
 @app.get("/api/custom/schema")
 def api_custom_schema():
-    return jsonify(backend.get_custom_signals_schema_ui())
+    return _json(backend.get_custom_signals_schema_ui())
 
 
 @app.post("/api/updates")
 def api_updates():
     updates = request.get_json(silent=True) or {}
     backend.apply_custom_signal_updates(updates)
-    return jsonify({"ok": True})
+    return _ok()
 
 
 @app.post("/api/custom/apply")
@@ -710,25 +987,31 @@ def api_custom_apply():
     updates = request.get_json(silent=True) or {}
     ok, error = backend.apply_custom_payload(updates)
     if ok:
-        return jsonify({"ok": True})
-    return jsonify({"ok": False, "error": error})
+        return _ok()
+    return _json({"ok": False, "error": error})
 
 
 @app.post("/api/start")
 def api_start():
-    backend.start()
-    return jsonify({"ok": True})
+    try:
+        backend.start()
+    finally:
+        _invalidate_status()
+    return _ok()
 
 
 @app.post("/api/stop")
 def api_stop():
-    backend.stop()
-    return jsonify({"ok": True})
+    try:
+        backend.stop()
+    finally:
+        _invalidate_status()
+    return _ok()
 
 
 @app.get("/api/status")
 def api_status():
-    return jsonify(backend.get_status())
+    return _cached_json("status", backend.get_status)
 
 
 
@@ -752,16 +1035,54 @@ def api_hard_stop():
         os._exit(0)
 
     threading.Thread(target=_exit_soon, daemon=True).start()
-    return jsonify({"ok": True})
+    return _ok()
 # HARD_STOP_PATCH
 
 @app.get("/api/telemetry")
 def api_telemetry():
-    return jsonify(backend.get_telemetry())
+    return _cached_json("telemetry", backend.get_telemetry)
+
+
+@app.get("/api/events")
+def api_events():
+    sub = backend.subscribe()
+    if sub is None:
+        return Response("too many event streams", status=503, mimetype="text/plain")
+
+    def gen():
+        try:
+            while True:
+                try:
+                    event, body = sub.get(timeout=SSE_HEARTBEAT_S)
+                except queue.Empty:
+                    yield ":\n\n"
+                    continue
+                yield f"event: {event}\ndata: {body}\n\n"
+        finally:
+            backend.unsubscribe(sub)
+
+    return Response(
+        stream_with_context(gen()),
+        mimetype="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
 
 
 def main() -> None:
-    app.run(host="127.0.0.1", port=8000, debug=False)
+    try:
+        from waitress import serve
+    except ImportError:  # pragma: no cover - optional dependency
+        app.run(host="127.0.0.1", port=8000, debug=False, threaded=True)
+        return
+    # each open event stream holds a worker thread, so leave room for requests
+    serve(
+        app,
+        host="127.0.0.1",
+        port=8000,
+        threads=MAX_SUBSCRIBERS + SERVER_SPARE_THREADS,
+        connection_limit=64,
+        channel_timeout=30,
+    )
 
 
 if __name__ == "__main__":
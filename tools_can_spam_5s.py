@@ -4,17 +4,29 @@ from ecusim_ms.transport import TermuxUsbSlcanTransport
 t = TermuxUsbSlcanTransport(bitrate=500000)
 t.open()
 
-start = time.time()
 count = 0
 
 # 0x5E8 standard, 8 bytes
 frame_id = 0x5E8
-payload = bytes.fromhex("0102030405060708")
+PAYLOAD = bytes.fromhex("0102030405060708")
+# constant frame: encode the SLCAN ASCII once
+frame = t.build_frame(frame_id, PAYLOAD, is_extended=False)
 
-while time.time() - start < 5.0:
-    t.send(frame_id, payload, is_extended=False)
+# pace against a monotonic schedule: sleeps absorb send time, so the rate
+# stays at 50 Hz instead of drifting below it
+period = 0.020  # 20 ms
+next_t = time.monotonic()
+deadline = next_t + 5.0
+while True:
+    now = time.monotonic()
+    if now >= deadline:
+        break
+    if now < next_t:
+        time.sleep(next_t - now)
+        continue
+    t.send_prebuilt(frame)
     count += 1
-    time.sleep(0.020)  # 20 ms
+    next_t += period
 
 t.close()
 print("SENT_FRAMES=", count)
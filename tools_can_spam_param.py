@@ -1,16 +1,27 @@
 import sys, time
 from ecusim_ms.transport import TermuxUsbSlcanTransport
 
+PAYLOAD = bytes.fromhex("0102030405060708")
+
 br = int(sys.argv[1]) if len(sys.argv) > 1 else 500000
 t = TermuxUsbSlcanTransport(bitrate=br)
 t.open()
 
-start = time.time()
 count = 0
-while time.time() - start < 3.0:
-    t.send(0x5E8, bytes.fromhex("0102030405060708"), is_extended=False)
+frame = t.build_frame(0x5E8, PAYLOAD, is_extended=False)
+period = 0.02
+next_t = time.monotonic()
+deadline = next_t + 3.0
+while True:
+    now = time.monotonic()
+    if now >= deadline:
+        break
+    if now < next_t:
+        time.sleep(next_t - now)
+        continue
+    t.send_prebuilt(frame)
     count += 1
-    time.sleep(0.02)
+    next_t += period
 
 t.close()
 print("BITRATE", br, "SENT", count)